@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Multi-AI Chat Manager v1.0.0 - Dispatch Benchmark
+ measures prompt fan-out cost against the in-memory fake backend (runs on Linux)
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "multi_ai_chat"))
+
+from core.fake_backend import FakeBackend
+from core.prompt_sender import ReliablePromptSender
+from core.readiness import ReadinessWaiter
+
+APP_NAMES = ["Claude", "Google Gemini", "Perplexity", "Grok", "DeepSeek", "ChatGPT"]
+
+def make_backend(args):
+    backend = FakeBackend(
+        clipboard_latency=args.clipboard_latency,
+        clipboard_latency_per_kb=args.clipboard_latency_per_kb,
+        key_latency=args.key_latency
+    )
+    window_info = {}
+    for i, name in enumerate(APP_NAMES[:args.windows]):
+        hwnd = 1000 + i
+        backend.add_window(hwnd, f"{name} - Chat", iconic=(i % 2 == 0),
+                           restore_delay=args.restore_delay, focus_delay=args.focus_delay)
+        window_info[hwnd] = {'app_name': name, 'hwnd': hwnd}
+    return backend, window_info
+
+def bench_clipboard_per_window(backend, windows, prompt, config):
+    """Legacy behaviour: the clipboard is rewritten for every target window.
+
+    Restore, focus and paste use the same readiness waits as the dispatch
+    session, so both runs pay the same settle delays.
+    """
+    waiter = ReadinessWaiter(backend, config)
+    start = time.perf_counter()
+    for hwnd in windows:
+        if backend.is_iconic(hwnd):
+            backend.restore_window(hwnd)
+            waiter.wait_restored(hwnd)
+        backend.set_foreground_window(hwnd)
+        waiter.wait_foreground(hwnd)
+        backend.set_clipboard_text(prompt)
+        backend.send_keys("^v")
+        waiter.settle_after_paste()
+        backend.send_keys("{ENTER}")
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark prompt fan-out on the fake backend")
+    parser.add_argument("--windows", type=int, default=6)
+    parser.add_argument("--prompt-kb", type=float, default=8.0, help="Prompt size in KB")
+    parser.add_argument("--clipboard-latency", type=float, default=0.015)
+    parser.add_argument("--clipboard-latency-per-kb", type=float, default=0.002)
+    parser.add_argument("--key-latency", type=float, default=0.001)
+    parser.add_argument("--restore-delay", type=float, default=0.08, help="Simulated restore settle time")
+    parser.add_argument("--focus-delay", type=float, default=0.03, help="Simulated foreground settle time")
+    args = parser.parse_args()
+
+    prompt = ("Compare these approaches. " * 64)[:int(args.prompt_kb * 1024)]
+
+    # Learned profiles are disabled so every run starts from the same configured waits
+    config = {'window': {'timing': {'prompt_send_delay': 0.0, 'profiles': {'enabled': False}}}}
+
+    backend, window_info = make_backend(args)
+    legacy = bench_clipboard_per_window(backend, list(window_info), prompt, config)
+    print(f"Legacy clipboard-per-window: {legacy * 1000:.1f} ms, {backend.clipboard_writes} clipboard writes")
+
+    backend, window_info = make_backend(args)
+    sender = ReliablePromptSender(config, backend=backend)
+    result = sender.send_prompt_to_all(list(window_info), window_info, prompt)
+
+    print(f"Dispatch session: {result['success']}/{result['total']} delivered, "
+          f"{result['clipboard_writes']} clipboard write(s), total {result['elapsed'] * 1000:.1f} ms")
+    print(f"  prepare phase  {result['prepare_elapsed'] * 1000:8.1f} ms")
+    for entry in result['windows']:
+        print(f"  {entry['app_name']:<15} {entry['elapsed'] * 1000:8.1f} ms  {'ok' if entry['success'] else 'FAILED'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Multi-AI Chat Manager v1.0.0 - Input Injection Benchmark
+ compares per-keystroke timing of the SendKeys (COM) and SendInput paths (Windows only)
+"""
+
+import os
+import sys
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "multi_ai_chat"))
+
+from core.input_injector import InputInjector
+
+def summarize(method, timings):
+    inject = [t['inject'] * 1000 for t in timings]
+    roundtrip = [t['roundtrip'] * 1000 for t in timings]
+    print(f"{method:<10} inject  median {statistics.median(inject):7.3f} ms  max {max(inject):7.3f} ms")
+    print(f"{'':<10} roundtrip median {statistics.median(roundtrip):7.3f} ms  max {max(roundtrip):7.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SendKeys vs SendInput keystroke injection")
+    parser.add_argument("--count", type=int, default=50, help="Keystrokes per method")
+    # F16 has no default binding, so the benchmark does not disturb the focused window
+    parser.add_argument("--key", default="{F16}", help="SendKeys-style key to inject")
+    args = parser.parse_args()
+
+    injector = InputInjector()
+    try:
+        # Warm up the COM apartment so activation cost is not counted
+        injector.send_keys("")
+
+        for method in InputInjector.METHODS:
+            timings = injector.measure_keystrokes([args.key] * args.count, method=method)
+            summarize(method, timings)
+    finally:
+        injector.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Multi-AI Chat Manager v1.0.0 - Title Matcher Benchmark
+ compares the legacy title scan with TitleMatcher and its per-hwnd cache
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "multi_ai_chat"))
+
+from gui.title_matcher import TitleMatcher
+
+AI_APPS = [
+    {'name': "Claude", 'keywords': ["claude"]},
+    {'name': "Google Gemini", 'keywords': ["gemini", "bard"]},
+    {'name': "Perplexity", 'keywords': ["perplexity"]},
+    {'name': "Grok", 'keywords': ["grok", "x.ai"]},
+    {'name': "DeepSeek", 'keywords': ["deepseek"]},
+    {'name': "ChatGPT", 'keywords': ["chatgpt", "chat.openai"]}
+]
+
+WORDS = ["Inbox", "Untitled", "Document", "Settings", "Report", "Project", "Search",
+         "Terminal", "Explorer", "Notes", "Calendar", "Music", "Downloads", "Task"]
+
+def make_titles(count, ai_ratio, seed):
+    rng = random.Random(seed)
+    keywords = [kw for app in AI_APPS for kw in app['keywords']]
+    titles = []
+    for _ in range(count):
+        words = rng.sample(WORDS, 3)
+        if rng.random() < ai_ratio:
+            words.insert(rng.randrange(4), rng.choice(keywords).capitalize())
+        titles.append(" - ".join(words) + " - Google Chrome")
+    return titles
+
+def legacy_match(titles):
+    """Previous behaviour: keyword map rebuilt per scan, nested loop per title"""
+    app_keyword_map = {app['name']: [kw.lower() for kw in app['keywords']] for app in AI_APPS}
+    matches = []
+    for title in titles:
+        title_lower = title.lower()
+        found = None
+        for app_name, keywords in app_keyword_map.items():
+            if any(keyword in title_lower for keyword in keywords):
+                found = app_name
+                break
+        matches.append(found)
+    return matches
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark window title matching")
+    parser.add_argument("--titles", type=int, default=5000, help="Synthetic window titles per scan")
+    parser.add_argument("--ai-ratio", type=float, default=0.05, help="Fraction of titles naming an AI app")
+    parser.add_argument("--scans", type=int, default=10, help="Repeated scans of the same desktop")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    titles = make_titles(args.titles, args.ai_ratio, args.seed)
+    hwnds = list(range(1000, 1000 + len(titles)))
+
+    legacy_time, legacy = timed(lambda: [legacy_match(titles) for _ in range(args.scans)][-1])
+
+    matcher = TitleMatcher(AI_APPS)
+    compiled_time, compiled = timed(lambda: [[(matcher.candidates(t) or (None,))[0] for t in titles]
+                                             for _ in range(args.scans)][-1])
+
+    matcher = TitleMatcher(AI_APPS, cache_size=len(titles))
+    cached_time, cached = timed(lambda: [[(matcher.match_window(h, t) or (None,))[0] for h, t in zip(hwnds, titles)]
+                                         for _ in range(args.scans)][-1])
+
+    if not (legacy == compiled == cached):
+        print("WARNING: matchers disagree")
+
+    per_scan = lambda seconds: seconds / args.scans * 1000
+    print(f"{args.titles} titles x {args.scans} scans, {sum(1 for m in legacy if m)} AI titles per scan")
+    print(f"  legacy nested loop   {per_scan(legacy_time):8.2f} ms/scan")
+    print(f"  keyword table        {per_scan(compiled_time):8.2f} ms/scan")
+    print(f"  table + hwnd cache   {per_scan(cached_time):8.2f} ms/scan (first scan fills the cache)")
+
+if __name__ == "__main__":
+    main()
@@ -231,8 +231,8 @@ window:
     preferred_display: 1
     use_work_area: true
   timing:
-    launch_delay: 0.1
-    load_wait: 2.0
+    launch_timeout: 20.0
+    launch_poll_interval: 0.25
     action_delay: 0.1
     prompt_send_delay: 0.1
 
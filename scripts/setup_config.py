@@ -179,8 +179,8 @@ def create_default_config():
                 'use_work_area': True
             },
             'timing': {
-                'launch_delay': 0.1,
-                'load_wait': 2.0,
+                'launch_timeout': 20.0,
+                'launch_poll_interval': 0.25,
                 'action_delay': 0.1,
                 'prompt_send_delay': 0.1
             }
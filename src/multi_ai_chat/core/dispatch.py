@@ -0,0 +1,242 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Dispatch Session
+ one clipboard write per prompt fan-out, with per-window timing
+"""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class DispatchAborted(Exception):
+    """Raised inside a delivery when its token is cancelled or past its deadline"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CancellationToken:
+    """Cancellation flag plus optional deadline, shared by a dispatch and its windows.
+
+    A child token (one per window) has its own, tighter deadline and is
+    cancelled whenever its parent is.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, parent: 'CancellationToken' = None):
+        self._event = threading.Event()
+        self.parent = parent
+        self.deadline = time.perf_counter() + timeout if timeout else None
+        if parent and parent.deadline is not None:
+            if self.deadline is None or parent.deadline < self.deadline:
+                self.deadline = parent.deadline
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or bool(self.parent and self.parent.cancelled)
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def remaining(self, default: float = None) -> Optional[float]:
+        """Seconds left before the deadline (default if there is none)"""
+        if self.deadline is None:
+            return default
+        return max(0.0, self.deadline - time.perf_counter())
+
+    def stop_reason(self) -> Optional[str]:
+        if self.cancelled:
+            return 'cancelled'
+        if self.expired:
+            return 'timed_out'
+        return None
+
+    def check(self) -> None:
+        """Raise DispatchAborted if the token is cancelled or expired"""
+        reason = self.stop_reason()
+        if reason:
+            raise DispatchAborted(reason)
+
+    def child(self, timeout: Optional[float] = None) -> 'CancellationToken':
+        return CancellationToken(timeout, parent=self)
+
+
+class DispatchSession:
+    """Holds the prompt on the clipboard for the length of one fan-out.
+
+    The prompt is written once; before every paste the clipboard sequence
+    number is compared with the one recorded after our write, and the text is
+    only rewritten when another process has changed the clipboard meanwhile.
+    """
+
+    def __init__(self, backend, prompt: str):
+        self.backend = backend
+        self.prompt = prompt
+        self.logger = logging.getLogger(__name__)
+
+        self.clipboard_writes = 0
+        self.window_results: List[Dict] = []
+        self._owned_sequence = None
+        self._started = None
+        self._lock = threading.Lock()
+        self._phases: Dict[int, Dict[str, float]] = {}
+        # Per-window wait overrides (learned timing profiles)
+        self.window_timing: Dict[int, Dict[str, float]] = {}
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def owns_clipboard(self) -> bool:
+        """Check whether the clipboard still holds our prompt"""
+        if self._owned_sequence is None:
+            return False
+        try:
+            return self.backend.get_clipboard_sequence() == self._owned_sequence
+        except Exception as e:
+            self.logger.debug(f"Could not read clipboard sequence: {e}")
+            return False
+
+    def ensure_clipboard(self, token: CancellationToken = None, retry_interval: float = 0.02) -> bool:
+        """Make sure the prompt is on the clipboard, writing it only if needed.
+
+        If another process holds the clipboard open the write is retried until
+        the token is cancelled or expires. Returns True when a write was performed.
+        """
+        with self._lock:
+            if self.owns_clipboard():
+                return False
+
+            if self._owned_sequence is not None:
+                self.logger.debug("Clipboard changed by another process, rewriting prompt")
+
+            while True:
+                try:
+                    self._owned_sequence = self.backend.set_clipboard_text(self.prompt)
+                    break
+                except Exception as e:
+                    if token is None:
+                        raise
+                    self.logger.debug(f"Clipboard busy, retrying: {e}")
+                    token.check()
+                    time.sleep(retry_interval)
+
+            self.clipboard_writes += 1
+            return True
+
+    def timing_for(self, hwnd: int) -> Dict[str, float]:
+        """Wait overrides for a window (empty dict means use the global timing)"""
+        return self.window_timing.get(hwnd, {})
+
+    @contextmanager
+    def phase(self, hwnd: int, name: str):
+        """Time one delivery phase (restore, focus, clipboard, paste, submit...) for a window"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                phases = self._phases.setdefault(hwnd, {})
+                phases[name] = phases.get(name, 0.0) + elapsed
+
+    def record(self, hwnd: int, app_name: str, success: bool, elapsed: float, method: str = None,
+               status: str = None) -> None:
+        # Called from delivery worker threads
+        with self._lock:
+            phases = self._phases.pop(hwnd, {})
+            self.window_results.append({
+                'hwnd': hwnd,
+                'app_name': app_name,
+                'success': success,
+                'status': status or ('delivered' if success else 'failed'),
+                'elapsed': round(elapsed, 4),
+                'method': method,
+                'phases': {name: round(value, 4) for name, value in phases.items()}
+            })
+
+    @property
+    def elapsed(self) -> float:
+        if self._started is None:
+            return 0.0
+        return time.perf_counter() - self._started
+
+
+class DispatchPlanner:
+    """Preparation phase run before any keystrokes are sent.
+
+    All selected windows are validated, un-hidden and restored in one batch,
+    followed by a single shared settle wait, so N minimized targets cost one
+    settle delay instead of N. Dead or hung windows are dropped.
+    """
+
+    def __init__(self, backend, waiter, health_monitor=None):
+        self.backend = backend
+        self.waiter = waiter
+        self.health_monitor = health_monitor
+        self.logger = logging.getLogger(__name__)
+
+    def drop_reason(self, hwnd: int) -> Optional[str]:
+        """Why a window cannot take a prompt now ('closed', 'quarantined', 'hung'), else None"""
+        if not self.backend.is_window(hwnd):
+            return 'closed'
+        if self.health_monitor is not None:
+            # Cached probe; unresponsive windows are quarantined and retried in the background
+            if not self.health_monitor.is_responsive(hwnd):
+                return 'quarantined'
+        elif self.backend.is_hung(hwnd):
+            return 'hung'
+        return None
+
+    def prepare(self, windows: List[int], token: CancellationToken = None) -> Dict:
+        start = time.perf_counter()
+        ready = []
+        dropped = []
+        to_restore = []
+
+        for hwnd in windows:
+            try:
+                reason = self.drop_reason(hwnd)
+                if reason:
+                    dropped.append({'hwnd': hwnd, 'reason': reason})
+                    continue
+
+                # Async show calls never block on the target's UI thread
+                if not self.backend.is_visible(hwnd):
+                    self.backend.unhide_window_async(hwnd)
+                if self.backend.is_iconic(hwnd):
+                    self.backend.restore_window_async(hwnd)
+                    to_restore.append(hwnd)
+                ready.append(hwnd)
+            except Exception as e:
+                self.logger.debug(f"Could not prepare window {hwnd}: {e}")
+                dropped.append({'hwnd': hwnd, 'reason': 'error'})
+
+        still_minimized = []
+        if to_restore:
+            try:
+                still_minimized = self.waiter.wait_all_restored(to_restore, token)
+            except DispatchAborted as e:
+                # The delivery phase checks the token again and reports the reason
+                self.logger.debug(f"Preparation stopped early: {e.reason}")
+        if still_minimized:
+            self.logger.debug(f"{len(still_minimized)} window(s) still minimized after batch restore")
+
+        for entry in dropped:
+            self.logger.warning(f"Skipping window {entry['hwnd']}: {entry['reason']}")
+
+        return {
+            'ready': ready,
+            'dropped': dropped,
+            'restored': len(to_restore) - len(still_minimized),
+            'elapsed': round(time.perf_counter() - start, 4)
+        }
@@ -0,0 +1,119 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Dispatch Metrics
+ per-app, per-phase timing of prompt dispatches kept in a bounded ring
+"""
+
+import os
+import json
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, List
+
+
+class DispatchMetrics:
+    """Bounded in-memory history of dispatch timing breakdowns"""
+
+    def __init__(self, config: Dict):
+        self.logger = logging.getLogger(__name__)
+        self.app_version = config.get('app', {}).get('version', '')
+
+        metrics_config = config.get('metrics', {})
+        self.ring_size = metrics_config.get('ring_size', 200)
+        self.export_file = metrics_config.get('export_file', 'data/dispatch_metrics.jsonl')
+        self.auto_export = metrics_config.get('auto_export', False)
+
+        self.records = deque(maxlen=self.ring_size)
+        self._lock = threading.Lock()
+
+    def add(self, result: Dict, prompt_length: int) -> Dict:
+        """Record a dispatch result and return its timing breakdown"""
+        windows = []
+        slowest = None
+        for entry in result.get('windows', []):
+            phases = entry.get('phases', {})
+            windows.append({
+                'app_name': entry.get('app_name'),
+                'success': entry.get('success', False),
+                'status': entry.get('status'),
+                'method': entry.get('method'),
+                'elapsed': entry.get('elapsed', 0.0),
+                'phases': phases
+            })
+            for phase, seconds in phases.items():
+                if slowest is None or seconds > slowest['seconds']:
+                    slowest = {'app_name': entry.get('app_name'), 'phase': phase, 'seconds': seconds}
+
+        record = {
+            'timestamp': datetime.now().isoformat(),
+            'version': self.app_version,
+            'prompt_length': prompt_length,
+            'delivery_method': result.get('delivery_method'),
+            'total': result.get('total', 0),
+            'success': result.get('success', 0),
+            'elapsed': result.get('elapsed', 0.0),
+            'prepare_elapsed': result.get('prepare_elapsed', 0.0),
+            'clipboard_writes': result.get('clipboard_writes', 0),
+            'windows': windows,
+            'slowest': slowest
+        }
+
+        with self._lock:
+            self.records.append(record)
+
+        if self.auto_export:
+            self._append_jsonl(self.export_file, [record])
+
+        return record
+
+    def get_recent(self, count: int = 10) -> List[Dict]:
+        """Get the most recent dispatch records"""
+        with self._lock:
+            return list(self.records)[-count:]
+
+    def average_delivery_times(self, count: int = 20) -> Dict[str, float]:
+        """Mean delivery time per app over its recent successful deliveries"""
+        totals: Dict[str, List[float]] = {}
+        for record in reversed(self.get_recent(self.ring_size)):
+            for entry in record['windows']:
+                if not entry['success']:
+                    continue
+                samples = totals.setdefault(entry['app_name'], [])
+                if len(samples) < count:
+                    samples.append(entry['elapsed'])
+        return {app: sum(samples) / len(samples) for app, samples in totals.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+    def export_jsonl(self, export_path: str = None) -> bool:
+        """Write every record in the ring to a JSONL file (one dispatch per line)"""
+        export_path = export_path or self.export_file
+        with self._lock:
+            records = list(self.records)
+        try:
+            self._ensure_directory(export_path)
+            with open(export_path, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.logger.info(f"Exported {len(records)} dispatch timing records to: {export_path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error exporting dispatch metrics: {e}")
+            return False
+
+    def _append_jsonl(self, path: str, records: List[Dict]) -> None:
+        try:
+            self._ensure_directory(path)
+            with open(path, 'a', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except Exception as e:
+            self.logger.error(f"Error appending dispatch metrics: {e}")
+
+    def _ensure_directory(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
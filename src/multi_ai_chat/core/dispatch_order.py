@@ -0,0 +1,70 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Dispatch Ordering
+ configurable order in which target windows receive a prompt
+"""
+
+import logging
+from typing import Dict, List
+
+
+class DispatchOrdering:
+    """Orders dispatch targets to minimize time until all answers are in.
+
+    Strategies:
+      layout                  - grid priority order (previous behaviour)
+      fastest_first           - apps with the shortest measured delivery first
+      slowest_responder_first - apps that take longest to answer start first
+    """
+
+    STRATEGIES = ('layout', 'fastest_first', 'slowest_responder_first')
+
+    def __init__(self, config: Dict, metrics, timing_profiles=None):
+        self.logger = logging.getLogger(__name__)
+        self.metrics = metrics
+        self.timing_profiles = timing_profiles
+
+        strategy = config.get('window', {}).get('delivery', {}).get('order', 'layout')
+        if strategy not in self.STRATEGIES:
+            self.logger.warning(f"Unknown dispatch order '{strategy}', using layout")
+            strategy = 'layout'
+        self.strategy = strategy
+
+        # Layout priority and expected answer time (seconds) from the app config
+        self.priorities = {}
+        self.expected_response = {}
+        for i, app in enumerate(config.get('ai_apps', [])):
+            self.priorities[app['name']] = app.get('priority', i)
+            if 'expected_response' in app:
+                self.expected_response[app['name']] = app['expected_response']
+
+    def order(self, windows: List[int], window_info: Dict, strategy: str = None) -> List[int]:
+        strategy = strategy or self.strategy
+
+        def app_of(hwnd):
+            return window_info.get(hwnd, {}).get('app_name', '')
+
+        def layout_key(hwnd):
+            info = window_info.get(hwnd, {})
+            return info.get('priority', self.priorities.get(app_of(hwnd), 999))
+
+        if strategy == 'fastest_first':
+            delivery_times = self._delivery_estimates()
+            # Apps without history go last, in layout order
+            return sorted(windows, key=lambda hwnd: (
+                delivery_times.get(app_of(hwnd), float('inf')), layout_key(hwnd)
+            ))
+
+        if strategy == 'slowest_responder_first':
+            return sorted(windows, key=lambda hwnd: (
+                -self.expected_response.get(app_of(hwnd), 0.0), layout_key(hwnd)
+            ))
+
+        return sorted(windows, key=layout_key)
+
+    def _delivery_estimates(self) -> Dict[str, float]:
+        """Average delivery time per app from recent dispatches, else learned profiles"""
+        estimates = self.metrics.average_delivery_times()
+        if self.timing_profiles is not None:
+            for app_name, seconds in self.timing_profiles.settle_estimates().items():
+                estimates.setdefault(app_name, seconds)
+        return estimates
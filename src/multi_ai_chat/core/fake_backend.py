@@ -0,0 +1,233 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Fake Backend
+ in-memory stand-in for the Win32 backend (Linux benchmarks and tests)
+"""
+
+import time
+import threading
+from typing import Dict, List, Optional
+
+from core.dispatch import DispatchSession, CancellationToken
+from core.prompt_sender import DeliveryBackend
+
+
+class FakeWindow:
+    """Simulated top-level window with a chat input box"""
+
+    def __init__(self, hwnd: int, title: str, iconic: bool = False,
+                 restore_delay: float = 0.0, focus_delay: float = 0.0):
+        self.hwnd = hwnd
+        self.title = title
+        self.iconic = iconic
+        self.alive = True
+        self.visible = True
+        self.hung = False
+        self.pid = 0
+        # Simulated settle times: state changes become visible after these delays
+        self.restore_delay = restore_delay
+        self.focus_delay = focus_delay
+        self.restore_at: Optional[float] = None
+        # Chromium-style renderer child that accepts posted input (None = not supported)
+        self.input_child: Optional[int] = None
+        # Whether the renderer child holds its thread's keyboard focus (posted input is dropped otherwise)
+        self.input_focused = True
+        self.input_text = ""
+        self.submitted: List[str] = []
+
+
+class FakeBackend:
+    """Stand-in clipboard/window backend with configurable per-call latency"""
+
+    def __init__(self, clipboard_latency: float = 0.0, clipboard_latency_per_kb: float = 0.0,
+                 key_latency: float = 0.0):
+        self.windows: Dict[int, FakeWindow] = {}
+        self.foreground: Optional[int] = None
+        self._pending_foreground = None
+        self.clipboard_text = ""
+        self.clipboard_sequence = 0
+        self.clipboard_writes = 0
+        self.clipboard_latency = clipboard_latency
+        self.clipboard_latency_per_kb = clipboard_latency_per_kb
+        self.key_latency = key_latency
+        self.trimmed: List[int] = []
+        self._lock = threading.Lock()
+
+    def add_window(self, hwnd: int, title: str, iconic: bool = False,
+                   restore_delay: float = 0.0, focus_delay: float = 0.0) -> FakeWindow:
+        window = FakeWindow(hwnd, title, iconic, restore_delay, focus_delay)
+        self.windows[hwnd] = window
+        return window
+
+    def add_input_child(self, hwnd: int, child: int) -> None:
+        """Give a window a renderer child so focus-free delivery can target it"""
+        self.windows[hwnd].input_child = child
+
+    def close(self) -> None:
+        pass
+
+    def external_clipboard_write(self, text: str) -> None:
+        """Simulate another process taking over the clipboard"""
+        with self._lock:
+            self.clipboard_text = text
+            self.clipboard_sequence += 1
+
+    # Window primitives
+
+    def get_foreground_window(self) -> int:
+        if self._pending_foreground and time.perf_counter() >= self._pending_foreground[1]:
+            self.foreground = self._pending_foreground[0]
+            self._pending_foreground = None
+        return self.foreground or 0
+
+    def set_foreground_window(self, hwnd: int) -> None:
+        if not self.is_window(hwnd):
+            raise RuntimeError(f"Invalid window handle: {hwnd}")
+        delay = self.windows[hwnd].focus_delay
+        if delay:
+            self._pending_foreground = (hwnd, time.perf_counter() + delay)
+        else:
+            self._pending_foreground = None
+            self.foreground = hwnd
+
+    def is_window(self, hwnd: int) -> bool:
+        window = self.windows.get(hwnd)
+        return bool(window and window.alive)
+
+    def is_iconic(self, hwnd: int) -> bool:
+        window = self.windows.get(hwnd)
+        if not window:
+            return False
+        if window.iconic and window.restore_at is not None and time.perf_counter() >= window.restore_at:
+            window.iconic = False
+            window.restore_at = None
+        return window.iconic
+
+    def restore_window(self, hwnd: int) -> None:
+        window = self.windows.get(hwnd)
+        if window and window.iconic and window.restore_at is None:
+            window.restore_at = time.perf_counter() + window.restore_delay
+
+    def is_visible(self, hwnd: int) -> bool:
+        window = self.windows.get(hwnd)
+        return bool(window and window.visible)
+
+    def is_hung(self, hwnd: int) -> bool:
+        window = self.windows.get(hwnd)
+        return bool(window and window.hung)
+
+    def ping(self, hwnd: int, timeout_ms: int = 200) -> bool:
+        return self.is_window(hwnd) and not self.is_hung(hwnd)
+
+    def restore_window_async(self, hwnd: int) -> None:
+        self.restore_window(hwnd)
+
+    def unhide_window_async(self, hwnd: int) -> None:
+        window = self.windows.get(hwnd)
+        if window:
+            window.visible = True
+
+    def get_window_text(self, hwnd: int) -> str:
+        window = self.windows.get(hwnd)
+        return window.title if window else ""
+
+    # Process primitives
+
+    def get_window_pid(self, hwnd: int) -> int:
+        window = self.windows.get(hwnd)
+        return window.pid if window else 0
+
+    def trim_working_set(self, pid: int) -> bool:
+        self.trimmed.append(pid)
+        return True
+
+    # Clipboard primitives
+
+    def get_clipboard_sequence(self) -> int:
+        return self.clipboard_sequence
+
+    def set_clipboard_text(self, text: str) -> int:
+        latency = self.clipboard_latency + self.clipboard_latency_per_kb * len(text.encode('utf-16-le')) / 1024
+        if latency:
+            time.sleep(latency)
+        with self._lock:
+            self.clipboard_text = text
+            self.clipboard_sequence += 1
+            self.clipboard_writes += 1
+            return self.clipboard_sequence
+
+    def get_clipboard_text(self) -> str:
+        return self.clipboard_text
+
+    # Input primitives
+
+    def send_keys(self, keys: str) -> None:
+        if self.key_latency:
+            time.sleep(self.key_latency)
+
+        window = self.windows.get(self.get_foreground_window())
+        if not window or not window.alive:
+            return
+
+        if keys == "^v":
+            window.input_text += self.clipboard_text
+        elif keys == "{ENTER}":
+            window.submitted.append(window.input_text)
+            window.input_text = ""
+        else:
+            window.input_text += keys
+
+    def find_input_window(self, hwnd: int) -> Optional[int]:
+        window = self.windows.get(hwnd)
+        return window.input_child if window and window.alive else None
+
+    def _window_for_child(self, child: int) -> Optional[FakeWindow]:
+        for window in self.windows.values():
+            if window.input_child == child and window.alive:
+                return window
+        return None
+
+    def has_input_focus(self, hwnd: int) -> bool:
+        window = self._window_for_child(hwnd)
+        return bool(window and window.input_focused)
+
+    def post_text(self, hwnd: int, text: str) -> None:
+        if self.key_latency:
+            time.sleep(self.key_latency)
+        window = self._window_for_child(hwnd)
+        if window and window.input_focused:
+            with self._lock:
+                window.input_text += text
+
+    def post_submit(self, hwnd: int) -> None:
+        window = self._window_for_child(hwnd)
+        if window:
+            with self._lock:
+                window.submitted.append(window.input_text)
+                window.input_text = ""
+
+
+class FakeDelivery(DeliveryBackend):
+    """Focus-free delivery stand-in that records prompts per window"""
+
+    name = 'fake'
+    requires_foreground = False
+
+    def __init__(self, latency: float = 0.0, unsupported: Optional[set] = None, failing: Optional[set] = None):
+        self.latency = latency
+        self.unsupported = unsupported or set()
+        self.failing = failing or set()
+        self.delivered: Dict[int, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def can_deliver(self, hwnd: int, prompt: str) -> bool:
+        return hwnd not in self.unsupported
+
+    def deliver(self, hwnd: int, session: DispatchSession, token: CancellationToken) -> bool:
+        if self.latency:
+            time.sleep(self.latency)
+        token.check()
+        if hwnd in self.failing:
+            return False
+        with self._lock:
+            self.delivered.setdefault(hwnd, []).append(session.prompt)
+        return True
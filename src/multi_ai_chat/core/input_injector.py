@@ -0,0 +1,246 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Input Injector
+ long-lived keystroke injection thread owning the COM apartment
+"""
+
+import time
+import queue
+import concurrent.futures
+import ctypes
+import logging
+import threading
+from ctypes import wintypes
+from concurrent.futures import Future
+from typing import Callable, Dict, List
+
+import pythoncom
+import win32con
+import win32com.client
+
+# SendInput structures (winuser.h)
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+ULONG_PTR = ctypes.c_size_t
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ('wVk', wintypes.WORD),
+        ('wScan', wintypes.WORD),
+        ('dwFlags', wintypes.DWORD),
+        ('time', wintypes.DWORD),
+        ('dwExtraInfo', ULONG_PTR)
+    ]
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ('dx', wintypes.LONG),
+        ('dy', wintypes.LONG),
+        ('mouseData', wintypes.DWORD),
+        ('dwFlags', wintypes.DWORD),
+        ('time', wintypes.DWORD),
+        ('dwExtraInfo', ULONG_PTR)
+    ]
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member and fixes the size of INPUT
+    _fields_ = [('mi', MOUSEINPUT), ('ki', KEYBDINPUT)]
+
+class INPUT(ctypes.Structure):
+    _fields_ = [('type', wintypes.DWORD), ('union', _INPUTUNION)]
+
+# SendKeys modifier prefixes and the named keys the sender uses
+MODIFIER_KEYS = {'^': win32con.VK_CONTROL, '+': win32con.VK_SHIFT, '%': win32con.VK_MENU}
+NAMED_KEYS = {
+    'ENTER': win32con.VK_RETURN,
+    'TAB': win32con.VK_TAB,
+    'ESC': win32con.VK_ESCAPE,
+    'BACKSPACE': win32con.VK_BACK,
+    'F16': win32con.VK_F16
+}
+
+def _key_input(vk: int = 0, scan: int = 0, flags: int = 0) -> INPUT:
+    return INPUT(type=INPUT_KEYBOARD, union=_INPUTUNION(ki=KEYBDINPUT(vk, scan, flags, 0, 0)))
+
+def sendkeys_to_inputs(keys: str) -> List[INPUT]:
+    """Translate the SendKeys subset used by the app (^v, {ENTER}, plain text) to SendInput events"""
+    events = []
+    i = 0
+    while i < len(keys):
+        modifiers = []
+        while i < len(keys) and keys[i] in MODIFIER_KEYS:
+            modifiers.append(MODIFIER_KEYS[keys[i]])
+            i += 1
+        if i >= len(keys):
+            break
+
+        if keys[i] == '{':
+            end = keys.index('}', i)
+            name = keys[i + 1:end].upper()
+            if name not in NAMED_KEYS:
+                raise ValueError(f"Unsupported key for SendInput: {{{name}}}")
+            down = [_key_input(vk=NAMED_KEYS[name])]
+            up = [_key_input(vk=NAMED_KEYS[name], flags=KEYEVENTF_KEYUP)]
+            i = end + 1
+        elif modifiers:
+            # Modified letters need virtual key codes, not Unicode events
+            vk = ctypes.windll.user32.VkKeyScanW(ord(keys[i])) & 0xFF
+            down = [_key_input(vk=vk)]
+            up = [_key_input(vk=vk, flags=KEYEVENTF_KEYUP)]
+            i += 1
+        else:
+            down = [_key_input(scan=ord(keys[i]), flags=KEYEVENTF_UNICODE)]
+            up = [_key_input(scan=ord(keys[i]), flags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP)]
+            i += 1
+
+        events.extend(_key_input(vk=vk) for vk in modifiers)
+        events.extend(down)
+        events.extend(up)
+        events.extend(_key_input(vk=vk, flags=KEYEVENTF_KEYUP) for vk in reversed(modifiers))
+    return events
+
+class InputInjector:
+    """Runs all keystroke injection on one worker thread.
+
+    The thread calls CoInitialize once and keeps a single WScript.Shell
+    instance, so GUI background threads never touch COM directly. Work is
+    queued and returned through futures; work still queued when the thread
+    fails or is stopped gets an exception instead of waiting forever.
+    """
+
+    METHODS = ('sendkeys', 'sendinput')
+
+    def __init__(self, method: str = 'sendkeys'):
+        self.logger = logging.getLogger(__name__)
+        if method not in self.METHODS:
+            self.logger.warning(f"Unknown input method '{method}', using sendkeys")
+            method = 'sendkeys'
+        self.method = method
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._shell = None
+        self._lock = threading.RLock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="InputInjector", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            if thread and thread.is_alive():
+                self._queue.put(None)
+        if thread:
+            thread.join(timeout)
+        with self._lock:
+            if self._thread is None:
+                self._fail_pending(RuntimeError("Input injector stopped"))
+
+    def _run(self) -> None:
+        error = None
+        pythoncom.CoInitialize()
+        try:
+            self._shell = win32com.client.Dispatch("WScript.Shell")
+            self.logger.debug("Input injector started (COM apartment initialized)")
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                func, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(func())
+                except Exception as e:
+                    future.set_exception(e)
+        except Exception as e:
+            self.logger.error(f"Input injector failed: {e}")
+            error = e
+        finally:
+            self._shell = None
+            pythoncom.CoUninitialize()
+            with self._lock:
+                # Failed rather than stopped: nothing else will serve the queue
+                if error is not None and self._thread is threading.current_thread():
+                    self._thread = None
+                    self._fail_pending(RuntimeError(f"Input injector failed: {error}"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        stop_requested = False
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stop_requested = True
+                continue
+            _, future = item
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+        if stop_requested:
+            # A worker that outlived stop()'s join still has to see it
+            self._queue.put(None)
+
+    def submit(self, func: Callable) -> Future:
+        """Queue a callable to run on the injector thread"""
+        future = Future()
+        # Under the lock so a worker that just failed cannot miss the item
+        with self._lock:
+            self.start()
+            self._queue.put((func, future))
+        return future
+
+    def _inject(self, keys: str, method: str, deadline: float = None) -> float:
+        """Inject one key sequence on the injector thread, returning elapsed seconds"""
+        start = time.perf_counter()
+        if deadline is not None and start > deadline:
+            # The caller gave up; focus may have moved on to another window since
+            raise TimeoutError(f"Keystrokes {keys!r} abandoned before injection")
+        if method == 'sendinput':
+            events = sendkeys_to_inputs(keys)
+            if events:
+                array = (INPUT * len(events))(*events)
+                sent = ctypes.windll.user32.SendInput(len(events), array, ctypes.sizeof(INPUT))
+                if sent != len(events):
+                    raise ctypes.WinError()
+        else:
+            self._shell.SendKeys(keys)
+        return time.perf_counter() - start
+
+    def send_keys(self, keys: str, method: str = None, timeout: float = 5.0) -> float:
+        """Send a SendKeys-style sequence and wait for it; returns injection time in seconds"""
+        method = method or self.method
+        deadline = time.perf_counter() + timeout
+        future = self.submit(lambda: self._inject(keys, method, deadline))
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            # Never type late into whatever window has focus by then
+            future.cancel()
+            raise
+
+    def measure_keystrokes(self, sequence: List[str], method: str = None) -> List[Dict]:
+        """Inject each entry of sequence and report per-keystroke timing.
+
+        'inject' is the time spent in SendKeys/SendInput on the injector
+        thread; 'roundtrip' includes the queue hop from the calling thread.
+        """
+        method = method or self.method
+        timings = []
+        for keys in sequence:
+            start = time.perf_counter()
+            inject = self.send_keys(keys, method)
+            timings.append({
+                'keys': keys,
+                'method': method,
+                'inject': inject,
+                'roundtrip': time.perf_counter() - start
+            })
+        return timings
@@ -0,0 +1,119 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Priority Boost
+ reference-counted priority raise of target app processes during a dispatch
+"""
+
+import atexit
+import logging
+import threading
+from typing import Dict, List
+
+import psutil
+
+# Windows priority classes (not available elsewhere, where boosting is off)
+BOOST_LEVELS = {
+    'above_normal': getattr(psutil, 'ABOVE_NORMAL_PRIORITY_CLASS', None),
+    'high': getattr(psutil, 'HIGH_PRIORITY_CLASS', None)
+}
+
+
+class PriorityBooster:
+    """Raises the priority class of the processes behind the target windows.
+
+    That is each window's owner process and its children, since browsers
+    and Electron apps render (and take input) in child processes. Every
+    acquire() is paired with a release(); a process is raised on its first
+    acquire and put back to its original priority when the last overlapping
+    dispatch releases it. Restores go through the psutil.Process taken at
+    boost time, so a pid reused by another process in between is left
+    alone. Anything still raised is restored at interpreter exit.
+    """
+
+    def __init__(self, config: Dict, backend):
+        self.backend = backend
+        self.logger = logging.getLogger(__name__)
+
+        level = config.get('window', {}).get('delivery', {}).get('priority_boost', 'above_normal')
+        if level and level != 'none' and level not in BOOST_LEVELS:
+            self.logger.warning(f"Unknown priority_boost '{level}', using above_normal")
+            level = 'above_normal'
+        self.priority = BOOST_LEVELS.get(level) if level and level != 'none' else None
+
+        # pid -> [reference count, original priority, psutil.Process]
+        self._boosted: Dict[int, List] = {}
+        self._lock = threading.Lock()
+
+        atexit.register(self.restore_all)
+
+    def acquire(self, windows: List[int]) -> List[int]:
+        """Raise the processes behind these windows; returns the pids to release later"""
+        if self.priority is None:
+            return []
+
+        processes: Dict[int, psutil.Process] = {}
+        for hwnd in windows:
+            try:
+                pid = self.backend.get_window_pid(hwnd)
+                if not pid or pid in processes:
+                    continue
+                owner = psutil.Process(pid)
+                processes[pid] = owner
+                for child in owner.children(recursive=True):
+                    processes.setdefault(child.pid, child)
+            except Exception as e:
+                self.logger.debug(f"Could not list processes of window {hwnd}: {e}")
+
+        acquired = []
+        with self._lock:
+            for pid, process in processes.items():
+                entry = self._boosted.get(pid)
+                if entry:
+                    # A different process behind a boosted pid waits for the old entry to go
+                    if entry[2] == process:
+                        entry[0] += 1
+                        acquired.append(pid)
+                    continue
+                try:
+                    original = process.nice()
+                    process.nice(self.priority)
+                except (psutil.Error, OSError) as e:
+                    self.logger.debug(f"Could not boost process {pid}: {e}")
+                    continue
+                self._boosted[pid] = [1, original, process]
+                acquired.append(pid)
+
+        if acquired:
+            self.logger.debug(f"Boosted {len(acquired)} target process(es) for dispatch")
+        return acquired
+
+    def release(self, pids: List[int]) -> None:
+        """Drop one reference per pid; the last one restores the original priority"""
+        with self._lock:
+            for pid in pids:
+                entry = self._boosted.get(pid)
+                if not entry:
+                    continue
+                entry[0] -= 1
+                if entry[0] <= 0:
+                    del self._boosted[pid]
+                    self._restore(entry[2], entry[1])
+
+    def restore_all(self) -> None:
+        """Restore every process still boosted, whatever its reference count"""
+        with self._lock:
+            boosted = list(self._boosted.items())
+            self._boosted.clear()
+            for _, (_, original, process) in boosted:
+                self._restore(process, original)
+
+    @property
+    def active(self) -> int:
+        with self._lock:
+            return len(self._boosted)
+
+    def _restore(self, process: psutil.Process, original: int) -> None:
+        # The setter checks the process is still the one boosted (NoSuchProcess if the pid was reused)
+        try:
+            process.nice(original)
+        except (psutil.Error, OSError) as e:
+            self.logger.debug(f"Could not restore priority of process {process.pid}: {e}")
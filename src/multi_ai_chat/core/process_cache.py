@@ -0,0 +1,94 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Process Name Cache
+ bounded pid -> executable name lookup for window validation
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import psutil
+
+# Browsers whose processes also host the user's own windows and tabs, so owning
+# such a process says nothing about which app (if any) a window belongs to
+SHARED_BROWSER_EXECUTABLES = frozenset([
+    'chrome.exe', 'msedge.exe', 'edge.exe', 'firefox.exe', 'brave.exe', 'opera.exe'
+])
+
+
+class ProcessNameCache:
+    """Caches executable names by pid so scans stop querying every process.
+
+    Browsers own many windows per process, so one lookup serves them all.
+    Entries remember the process create_time: an entry older than
+    ``verify_interval`` is checked against it before reuse, which catches a
+    pid recycled by a new process, and prune() drops processes that exited.
+    """
+
+    def __init__(self, max_size: int = 256, verify_interval: float = 5.0):
+        self.max_size = max_size
+        self.verify_interval = verify_interval
+        self.logger = logging.getLogger(__name__)
+
+        # pid -> (name, create_time, last verified)
+        self._entries: "OrderedDict[int, Tuple[str, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_name(self, pid: int) -> Optional[str]:
+        """Lower-cased executable name of a process, or None if it cannot be read"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(pid)
+            if entry and now - entry[2] < self.verify_interval:
+                self._entries.move_to_end(pid)
+                self.hits += 1
+                return entry[0]
+
+        try:
+            process = psutil.Process(pid)
+            create_time = process.create_time()
+            if entry and entry[1] == create_time:
+                name = entry[0]
+                self.hits += 1
+            else:
+                name = process.name().lower()
+                self.misses += 1
+        except psutil.Error as e:
+            self.logger.debug(f"Could not read process {pid}: {e}")
+            self.forget(pid)
+            return None
+
+        with self._lock:
+            self._entries[pid] = (name, create_time, now)
+            self._entries.move_to_end(pid)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return name
+
+    def prune(self) -> int:
+        """Drop entries for processes that have exited; returns how many"""
+        with self._lock:
+            pids = list(self._entries)
+        removed = 0
+        for pid in pids:
+            if not psutil.pid_exists(pid):
+                self.forget(pid)
+                removed += 1
+        return removed
+
+    def forget(self, pid: int) -> None:
+        with self._lock:
+            self._entries.pop(pid, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            size = len(self._entries)
+        return {'size': size, 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,121 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Prompt Pools
+ least-busy scheduling of prompts across several windows of one app
+"""
+
+import time
+import logging
+import threading
+from typing import Callable, Dict, List, Tuple
+
+
+class PromptPoolScheduler:
+    """Spreads prompts across the windows of pooled apps.
+
+    An app with a pool_size in ai_apps gets each prompt in only one of its
+    windows, the least busy one: fewest deliveries in flight, then the one
+    that finishes answering soonest, then the one used longest ago (so idle
+    windows take prompts in turn). A window counts as answering for the
+    app's expected_response seconds after each delivery. Apps without a
+    pool_size still get the prompt in every window.
+    """
+
+    def __init__(self, config: Dict):
+        self.logger = logging.getLogger(__name__)
+
+        pools_config = config.get('window', {}).get('pools', {})
+        default_busy = pools_config.get('busy_seconds', 30.0)
+
+        self.pool_sizes: Dict[str, int] = {}
+        self.busy_seconds: Dict[str, float] = {}
+        for app in config.get('ai_apps', []):
+            if app.get('pool_size'):
+                self.pool_sizes[app['name']] = max(1, app['pool_size'])
+                self.busy_seconds[app['name']] = app.get('expected_response', default_busy)
+
+        # Per pooled window: deliveries in flight, answering until, last assigned
+        self._in_flight: Dict[int, int] = {}
+        self._busy_until: Dict[int, float] = {}
+        self._last_assigned: Dict[int, float] = {}
+        self._apps: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def assign(self, windows: List[int], window_info: Dict,
+               is_available: Callable[[int], bool] = None) -> List[int]:
+        """Targets for one prompt: every window of unpooled apps, one window per pooled app.
+
+        is_available(hwnd) rules out pool windows that cannot take a prompt
+        right now (closed, hung); a pool with no such window falls back to
+        all of them so the dispatch reports why. Each pooled window returned
+        is marked in flight until release().
+        """
+        targets = []
+        pools: Dict[str, List[int]] = {}
+        for hwnd in windows:
+            app_name = window_info.get(hwnd, {}).get('app_name', '')
+            if app_name in self.pool_sizes:
+                pools.setdefault(app_name, []).append(hwnd)
+            else:
+                targets.append(hwnd)
+
+        # Checked before anything is marked in flight, so a failing check leaks nothing
+        choices = {}
+        for app_name, pool in pools.items():
+            pool = pool[:self.pool_sizes[app_name]]
+            available = [hwnd for hwnd in pool if is_available(hwnd)] if is_available else pool
+            choices[app_name] = (pool, available or pool)
+
+        now = time.monotonic()
+        with self._lock:
+            for app_name, (pool, available) in choices.items():
+                self._prune(app_name, pool)
+                hwnd = min(available, key=lambda h: self._load(h, now))
+                self._in_flight[hwnd] = self._in_flight.get(hwnd, 0) + 1
+                self._last_assigned[hwnd] = now
+                self._apps[hwnd] = app_name
+                targets.append(hwnd)
+                self.logger.debug(f"{app_name}: prompt goes to window {hwnd} of {len(pool)}")
+        return targets
+
+    def release(self, targets: List[int], window_results: List[Dict]) -> None:
+        """End a dispatch; pooled windows that got the prompt stay busy while they answer"""
+        delivered = {entry['hwnd'] for entry in window_results if entry.get('success')}
+        now = time.monotonic()
+        with self._lock:
+            for hwnd in targets:
+                if hwnd not in self._in_flight:
+                    continue
+                self._in_flight[hwnd] -= 1
+                if hwnd in delivered:
+                    # A prompt queued behind an unfinished answer extends it
+                    start = max(now, self._busy_until.get(hwnd, 0.0))
+                    self._busy_until[hwnd] = start + self.busy_seconds[self._apps[hwnd]]
+
+    def get_status(self) -> Dict[str, List[Dict]]:
+        """Per pooled app, each known window's in-flight count and seconds left answering"""
+        now = time.monotonic()
+        status: Dict[str, List[Dict]] = {}
+        with self._lock:
+            for hwnd, app_name in self._apps.items():
+                status.setdefault(app_name, []).append({
+                    'hwnd': hwnd,
+                    'in_flight': self._in_flight.get(hwnd, 0),
+                    'busy_for': round(max(0.0, self._busy_until.get(hwnd, 0.0) - now), 2)
+                })
+        return status
+
+    def _load(self, hwnd: int, now: float) -> Tuple[int, float, float]:
+        return (
+            self._in_flight.get(hwnd, 0),
+            max(0.0, self._busy_until.get(hwnd, 0.0) - now),
+            self._last_assigned.get(hwnd, 0.0)
+        )
+
+    def _prune(self, app_name: str, pool: List[int]) -> None:
+        # Forget windows of this app that are gone, unless a dispatch still holds them
+        for hwnd in [h for h, name in self._apps.items() if name == app_name and h not in pool]:
+            if not self._in_flight.get(hwnd):
+                self._in_flight.pop(hwnd, None)
+                self._busy_until.pop(hwnd, None)
+                self._last_assigned.pop(hwnd, None)
+                self._apps.pop(hwnd, None)
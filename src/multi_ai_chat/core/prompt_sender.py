@@ -4,102 +4,427 @@ Multi-AI Chat Manager v1.0.0 - Prompt Sender
 '''
 
 import time
-import win32gui
-import win32clipboard
-import win32com.client
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
+from core.dispatch import DispatchSession, DispatchPlanner, CancellationToken, DispatchAborted
+from core.readiness import ReadinessWaiter
+from core.dispatch_metrics import DispatchMetrics
+from core.timing_profiles import TimingProfileStore
+from core.dispatch_order import DispatchOrdering
+from core.prompt_pool import PromptPoolScheduler
+from core.priority_boost import PriorityBooster
+
+class DeliveryBackend:
+    """Interface for putting a prompt into one window and submitting it"""
+    
+    name = 'base'
+    # Backends that need the foreground window must run strictly one at a time
+    requires_foreground = True
+    
+    def can_deliver(self, hwnd: int, prompt: str) -> bool:
+        """Return False if this backend cannot handle the window/prompt (caller falls back)"""
+        return True
+    
+    def deliver(self, hwnd: int, session: DispatchSession, token: CancellationToken) -> bool:
+        """Deliver session.prompt; raise DispatchAborted (via token.check) to stop early"""
+        raise NotImplementedError
+
+class SendKeysDelivery(DeliveryBackend):
+    """Foreground + clipboard paste + Enter via SendKeys (the proven fallback path)"""
+    
+    name = 'sendkeys'
+    requires_foreground = True
+    
+    def __init__(self, backend, waiter: ReadinessWaiter):
+        self.backend = backend
+        self.waiter = waiter
+        self.logger = logging.getLogger(__name__)
+        # Optional WindowHealthMonitor, so a window found hung here is quarantined too
+        self.health_monitor = None
+    
+    def deliver(self, hwnd: int, session: DispatchSession, token: CancellationToken) -> bool:
+        timing = session.timing_for(hwnd)
+        
+        # SetForegroundWindow has no timeout, so a window that stopped answering since
+        # the prepare phase would stall the whole serial fan-out (and Cancel with it)
+        if not self._is_responsive(hwnd):
+            raise DispatchAborted('hung')
+        
+        # Ensure window is visible and ready
+        if self.backend.is_iconic(hwnd):
+            restore_timeout = timing.get('restore_timeout', self.waiter.restore_timeout)
+            with session.phase(hwnd, 'restore'):
+                self.backend.restore_window_async(hwnd)
+                restored = self.waiter.wait_restored(hwnd, token, restore_timeout)
+                if not restored and restore_timeout < self.waiter.restore_timeout:
+                    # A learned wait is only a first guess; allow the configured bound before giving up
+                    restored = self.waiter.wait_restored(hwnd, token, self.waiter.restore_timeout - restore_timeout)
+            if not restored:
+                self.logger.debug(f"Window {hwnd} still minimized after {self.waiter.restore_timeout}s")
+        
+        # Bring window to foreground and wait until it actually owns it
+        token.check()
+        foreground_timeout = timing.get('foreground_timeout', self.waiter.foreground_timeout)
+        with session.phase(hwnd, 'focus'):
+            self.backend.set_foreground_window(hwnd)
+            focused = self.waiter.wait_foreground(hwnd, token, foreground_timeout)
+            if not focused and foreground_timeout < self.waiter.foreground_timeout:
+                self.logger.debug(f"Window {hwnd} slower to focus than its learned {foreground_timeout}s, retrying")
+                self.backend.set_foreground_window(hwnd)
+                focused = self.waiter.wait_foreground(
+                    hwnd, token, self.waiter.foreground_timeout - foreground_timeout
+                )
+        if not focused:
+            self.logger.warning(f"Window {hwnd} did not take foreground within {self.waiter.foreground_timeout}s")
+            return False
+        
+        # Prompt is written once per session; rewritten only if another process took the clipboard
+        token.check()
+        with session.phase(hwnd, 'clipboard'):
+            session.ensure_clipboard(token)
+        
+        # Last chance to stop: nothing has been typed into the window yet
+        token.check()
+        
+        # Simulate Ctrl+V to paste
+        with session.phase(hwnd, 'paste'):
+            self.backend.send_keys("^v")  # Ctrl+V
+            self.waiter.settle_after_paste(token, timing.get('paste_settle'))
+        with session.phase(hwnd, 'submit'):
+            self.backend.send_keys("{ENTER}")  # Enter
+        
+        return True
+    
+    def _is_responsive(self, hwnd: int) -> bool:
+        """Fresh hang probe (IsHungAppWindow, then WM_NULL with a short timeout)"""
+        if self.health_monitor is not None:
+            return self.health_monitor.is_responsive(hwnd, force=True)
+        try:
+            return not self.backend.is_hung(hwnd) and self.backend.ping(hwnd)
+        except Exception as e:
+            self.logger.debug(f"Could not probe window {hwnd}: {e}")
+            return False
+
+class PostMessageDelivery(DeliveryBackend):
+    """Focus-free delivery: posts characters and Enter to the renderer child window.
+    
+    Works for Chromium/Electron windows, which route keyboard input through a
+    Chrome_RenderWidgetHostHWND child. That child drops posted characters
+    unless it holds its thread's keyboard focus, and a post cannot confirm
+    receipt, so windows whose renderer is not focused are left to the
+    SendKeys fallback, as are multi-line prompts (a posted newline would
+    submit the message early). Opt-in: sendkeys stays the default method.
+    """
+    
+    name = 'postmessage'
+    requires_foreground = False
+    
+    def __init__(self, backend):
+        self.backend = backend
+        self.logger = logging.getLogger(__name__)
+    
+    def can_deliver(self, hwnd: int, prompt: str) -> bool:
+        if '\n' in prompt or '\r' in prompt:
+            return False
+        target = self.backend.find_input_window(hwnd)
+        return bool(target) and self.backend.has_input_focus(target)
+    
+    def deliver(self, hwnd: int, session: DispatchSession, token: CancellationToken) -> bool:
+        with session.phase(hwnd, 'locate'):
+            target = self.backend.find_input_window(hwnd)
+        if not target:
+            self.logger.debug(f"No renderer input window found for {hwnd}")
+            return False
+        if not self.backend.has_input_focus(target):
+            # Focus moved within the app since the window was partitioned; the post would be dropped
+            self.logger.warning(f"Renderer of window {hwnd} lost input focus, prompt not posted")
+            return False
+        
+        token.check()
+        with session.phase(hwnd, 'paste'):
+            self.backend.post_text(target, session.prompt)
+        with session.phase(hwnd, 'submit'):
+            self.backend.post_submit(target)
+        return True
+
 class ReliablePromptSender:
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, backend=None, delivery: DeliveryBackend = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.original_foreground = None
         
-    def send_prompt_to_all(self, windows: List[int], window_info: Dict, prompt: str) -> Dict:
-        """Send prompt to selected AI windows using proven working method"""
-        if not prompt.strip():
-            return {'success': 0, 'failed': 0, 'total': 0}
+        # Window/clipboard backend (Win32 by default, FakeBackend for tests)
+        if backend is None:
+            from core.win32_backend import Win32Backend
+            backend = Win32Backend(config)
+        self.backend = backend
+        self.waiter = ReadinessWaiter(backend, config)
+        self.planner = DispatchPlanner(backend, self.waiter)
+        self.metrics = DispatchMetrics(config)
+        self.timing_profiles = TimingProfileStore(config)
+        self.ordering = DispatchOrdering(config, self.metrics, self.timing_profiles)
+        self.pools = PromptPoolScheduler(config)
         
-        if not windows:
-            return {'success': 0, 'failed': 0, 'total': 0}
+        # Optional ResourceGovernor: hibernated apps are woken before delivery
+        self.resource_governor = None
         
-        self.logger.info(f"Sending prompt to {len(windows)} selected AI applications")
+        # Target processes run at raised priority while a fan-out is in progress
+        self.priority_booster = PriorityBooster(config, backend)
         
-        # Store original foreground window
-        self.original_foreground = win32gui.GetForegroundWindow()
+        # Delivery backends: SendKeys is always available as the fallback
+        delivery_config = config.get('window', {}).get('delivery', {})
+        self.max_workers = max(1, delivery_config.get('max_workers', 4))
+        self.fallback_delivery = SendKeysDelivery(backend, self.waiter)
+        if delivery is None:
+            method = delivery_config.get('method', 'sendkeys')
+            if method == 'postmessage':
+                delivery = PostMessageDelivery(backend)
+            else:
+                if method != 'sendkeys':
+                    self.logger.warning(f"Unknown delivery method '{method}', using sendkeys")
+                delivery = self.fallback_delivery
+        self.delivery = delivery
         
-        success_count = 0
+        # Overall and per-window deadlines for a fan-out
+        timing_config = config.get('window', {}).get('timing', {})
+        self.dispatch_timeout = timing_config.get('dispatch_timeout', 30.0)
+        self.window_timeout = timing_config.get('window_timeout', 5.0)
         
-        # Send to each window using the exact working method
-        for i, hwnd in enumerate(windows):
-            try:
-                window_title = win32gui.GetWindowText(hwnd)
-                app_name = window_info.get(hwnd, {}).get('app_name', window_title)
+        # Token of the fan-out in progress, so the GUI can cancel it
+        self.active_token = None
+        self._token_lock = threading.Lock()
+        
+    def send_prompt_to_all(self, windows: List[int], window_info: Dict, prompt: str,
+                           token: CancellationToken = None) -> Dict:
+        """Send prompt to selected AI windows.
+        
+        Windows the focus-free backend can handle are fed in parallel from a
+        worker pool; the rest go through the serial SendKeys fallback. The
+        fan-out stops cleanly at window boundaries when cancelled or past its
+        deadline, and the result lists which apps got the prompt.
+        """
+        if not prompt.strip():
+            return self._empty_result()
+        
+        if not windows:
+            return self._empty_result()
+        
+        if token is None:
+            token = CancellationToken(self.dispatch_timeout)
+        with self._token_lock:
+            self.active_token = token
+        
+        # Everything taken here (token, pool slots, priority boosts) is given back in the finally
+        session = None
+        assigned = []
+        boosted = []
+        try:
+            # Pooled apps get the prompt in their least busy window that can take it
+            assigned = self.pools.assign(
+                windows, window_info, lambda hwnd: self.planner.drop_reason(hwnd) is None
+            )
+            windows = self.ordering.order(assigned, window_info)
+            
+            self.logger.info(
+                f"Sending prompt to {len(windows)} selected AI applications via {self.delivery.name} "
+                f"({self.ordering.strategy} order)"
+            )
+            
+            if self.resource_governor:
+                self.resource_governor.wake(windows)
+            
+            # Store original foreground window
+            self.original_foreground = self.backend.get_foreground_window()
+            
+            boosted = self.priority_booster.acquire(windows)
+            
+            # One dispatch session per fan-out: the prompt is put on the clipboard once
+            with DispatchSession(self.backend, prompt) as session:
+                # Per-app waits learned from earlier dispatches
+                for hwnd in windows:
+                    app_name = window_info.get(hwnd, {}).get('app_name')
+                    session.window_timing[hwnd] = self.timing_profiles.get_timing(app_name)
                 
-                self.logger.debug(f"Sending to {app_name}...")
+                # Phase 1: restore/validate every target in one batch
+                plan = self.planner.prepare(windows, token)
+                for entry in plan['dropped']:
+                    app_name = window_info.get(entry['hwnd'], {}).get('app_name', str(entry['hwnd']))
+                    session.record(entry['hwnd'], app_name, False, 0.0, status=entry['reason'])
                 
-                if self._send_prompt_to_window(hwnd, prompt):
-                    success_count += 1
-                    self.logger.debug(f"Successfully sent to {app_name}")
+                # Phase 2: tight delivery to the windows that are ready
+                concurrent_windows, serial_windows = self._partition_windows(plan['ready'], prompt)
                 
-                # Wait between sends (configurable delay)
-                delay = self.config.get('window', {}).get('timing', {}).get('prompt_send_delay', 0.1)
-                time.sleep(max(delay, 0.5))  # Minimum 0.5s delay for reliability
+                executor = None
+                futures = []
+                if concurrent_windows:
+                    executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(concurrent_windows)))
+                    futures = [
+                        executor.submit(self._deliver_to_window, hwnd, window_info, session, self.delivery, token)
+                        for hwnd in concurrent_windows
+                    ]
                 
-            except Exception as e:
-                self.logger.error(f"Error with window {i+1}: {e}")
-                continue
+                for i, hwnd in enumerate(serial_windows):
+                    self._deliver_to_window(hwnd, window_info, session, self.fallback_delivery, token)
+                    
+                    # Optional gap between foreground sends; readiness waits replace the old 0.5s floor
+                    delay = self.config.get('window', {}).get('timing', {}).get('prompt_send_delay', 0.1)
+                    if delay > 0 and i < len(serial_windows) - 1 and not token.stop_reason():
+                        time.sleep(min(delay, token.remaining(delay)))
+                
+                for future in futures:
+                    future.result()
+                if executor:
+                    executor.shutdown()
+        finally:
+            with self._token_lock:
+                if self.active_token is token:
+                    self.active_token = None
+            self.pools.release(assigned, session.window_results if session else [])
+            self.priority_booster.release(boosted)
         
-        # Restore original foreground window
-        self._restore_original_focus()
+        # Restore original foreground window (only foreground deliveries moved it)
+        if serial_windows:
+            self._restore_original_focus()
         
+        success_count = sum(1 for entry in session.window_results if entry['success'])
         failed_count = len(windows) - success_count
         
-        self.logger.info(f"Prompt sent to {success_count}/{len(windows)} selected applications")
+        self.logger.info(
+            f"Prompt sent to {success_count}/{len(windows)} selected applications "
+            f"({session.clipboard_writes} clipboard write(s), {session.elapsed:.2f}s)"
+        )
         
-        return {
+        result = {
             'success': success_count,
             'failed': failed_count,
-            'total': len(windows)
+            'total': len(windows),
+            'windows': session.window_results,
+            'delivered': self._apps_with_status(session, ('delivered',)),
+            'skipped': self._apps_with_status(session, ('closed', 'hung', 'quarantined', 'cancelled')),
+            'timed_out': self._apps_with_status(session, ('timed_out',)),
+            'cancelled': token.cancelled,
+            'clipboard_writes': session.clipboard_writes,
+            'elapsed': round(session.elapsed, 4),
+            'prepare_elapsed': plan['elapsed'],
+            'dropped': plan['dropped'],
+            'delivery_method': self.delivery.name
         }
+        result['timings'] = self.metrics.add(result, len(prompt))
+        self.timing_profiles.observe_dispatch(session.window_results)
+        
+        return result
+    
+    def reset_timing_profiles(self, app_name: str = None):
+        """Forget learned per-app timings (all apps if app_name is None)"""
+        self.timing_profiles.reset(app_name)
+    
+    def set_health_monitor(self, health_monitor):
+        """Use a shared WindowHealthMonitor to skip quarantined windows"""
+        self.planner.health_monitor = health_monitor
+        self.fallback_delivery.health_monitor = health_monitor
+    
+    def set_resource_governor(self, resource_governor):
+        """Wake apps hibernated by a ResourceGovernor before sending to them"""
+        self.resource_governor = resource_governor
+    
+    def cancel_active(self) -> bool:
+        """Cancel the fan-out in progress; it stops at the next window boundary"""
+        with self._token_lock:
+            token = self.active_token
+        if token is None:
+            return False
+        token.cancel()
+        self.logger.info("Prompt dispatch cancelled")
+        return True
+    
+    def _empty_result(self) -> Dict:
+        return {'success': 0, 'failed': 0, 'total': 0, 'windows': [],
+                'delivered': [], 'skipped': [], 'timed_out': [], 'cancelled': False}
+    
+    def _apps_with_status(self, session: DispatchSession, statuses) -> List[str]:
+        return [entry['app_name'] for entry in session.window_results if entry['status'] in statuses]
+    
+    def export_metrics(self, export_path: str = None) -> bool:
+        """Export recorded dispatch timings as JSONL"""
+        return self.metrics.export_jsonl(export_path)
     
-    def _send_prompt_to_window(self, hwnd: int, prompt: str) -> bool:
-        """Send prompt to a specific window - with Unicode clipboard support"""
+    def _partition_windows(self, windows: List[int], prompt: str):
+        """Split targets into focus-free (concurrent) and foreground (serial) groups"""
+        if self.delivery.requires_foreground:
+            return [], list(windows)
+        
+        concurrent_windows, serial_windows = [], []
+        for hwnd in windows:
+            try:
+                if self.delivery.can_deliver(hwnd, prompt):
+                    concurrent_windows.append(hwnd)
+                    continue
+            except Exception as e:
+                self.logger.debug(f"{self.delivery.name} cannot handle window {hwnd}: {e}")
+            serial_windows.append(hwnd)
+        
+        if serial_windows:
+            self.logger.debug(f"{len(serial_windows)} window(s) fall back to {self.fallback_delivery.name}")
+        return concurrent_windows, serial_windows
+    
+    def _deliver_to_window(self, hwnd: int, window_info: Dict, session: DispatchSession,
+                           delivery: DeliveryBackend, token: CancellationToken) -> bool:
+        """Deliver to one window under its own deadline and record the outcome in the session"""
+        start = time.perf_counter()
+        app_name = window_info.get(hwnd, {}).get('app_name')
+        success = False
+        status = None
+        
+        # Stop at window boundaries: windows not started yet are skipped
+        reason = token.stop_reason()
+        if reason:
+            session.record(hwnd, app_name or str(hwnd), False, 0.0, delivery.name, status=reason)
+            return False
+        
+        window_token = token.child(self.window_timeout)
         try:
-            # Ensure window is visible and ready
-            if win32gui.IsIconic(hwnd):
-                win32gui.ShowWindow(hwnd, win32gui.SW_RESTORE)
-                time.sleep(0.2)
-            
-            # Bring window to foreground
-            win32gui.SetForegroundWindow(hwnd)
-            time.sleep(0.2)  # Increased delay for stability
-            
-            # Copy prompt to clipboard with Unicode support
-            win32clipboard.OpenClipboard()
-            win32clipboard.EmptyClipboard()
-            # FIX: Use CF_UNICODETEXT format to handle Unicode characters
-            win32clipboard.SetClipboardText(prompt, win32clipboard.CF_UNICODETEXT)
-            win32clipboard.CloseClipboard()
-            
-            # Simulate Ctrl+V to paste
-            shell = win32com.client.Dispatch("WScript.Shell")
-            shell.SendKeys("^v")  # Ctrl+V
-            time.sleep(0.2)  # Wait for paste to complete
-            shell.SendKeys("{ENTER}")  # Enter
+            if not app_name:
+                app_name = self.backend.get_window_text(hwnd)
             
-            return True
+            self.logger.debug(f"Sending to {app_name} via {delivery.name}...")
+            
+            success = delivery.deliver(hwnd, session, window_token)
+            if success:
+                self.logger.debug(f"Successfully sent to {app_name}")
             
+        except DispatchAborted as e:
+            status = e.reason
+            self.logger.warning(f"Delivery to {app_name or hwnd} stopped: {e.reason}")
+        except Exception as e:
+            self.logger.error(f"Error sending prompt to {app_name or hwnd}: {e}")
+        
+        session.record(hwnd, app_name or str(hwnd), success, time.perf_counter() - start, delivery.name, status)
+        return success
+    
+    def _send_prompt_to_window(self, hwnd: int, session: DispatchSession) -> bool:
+        """Send the session prompt to a specific window via the foreground fallback path"""
+        try:
+            return self.fallback_delivery.deliver(hwnd, session, CancellationToken(self.window_timeout))
         except Exception as e:
             self.logger.error(f"Error sending prompt: {e}")
             return False
     
+    def close(self):
+        """Release backend resources (input injection thread, boosted priorities)"""
+        self.priority_booster.restore_all()
+        try:
+            self.backend.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing prompt sender backend: {e}")
+    
     def _restore_original_focus(self):
         """Restore focus to original window"""
         try:
-            if self.original_foreground and win32gui.IsWindow(self.original_foreground):
-                win32gui.SetForegroundWindow(self.original_foreground)
+            if self.original_foreground and self.backend.is_window(self.original_foreground):
+                self.backend.set_foreground_window(self.original_foreground)
                 self.logger.debug("Restored original window focus")
         except Exception as e:
             self.logger.debug(f"Could not restore original focus: {e}")
@@ -114,13 +439,18 @@ class ReliablePromptSender:
             self.logger.info(f"Sending prompt to {app_name}")
             
             # Store original foreground window
-            self.original_foreground = win32gui.GetForegroundWindow()
+            self.original_foreground = self.backend.get_foreground_window()
             
-            # Send prompt
-            success = self._send_prompt_to_window(hwnd, prompt)
-            
-            # Restore original focus
-            self._restore_original_focus()
+            # Send prompt, preferring the focus-free backend when it can handle the window
+            with DispatchSession(self.backend, prompt) as session:
+                token = CancellationToken(self.window_timeout)
+                concurrent_windows, _ = self._partition_windows([hwnd], prompt)
+                if concurrent_windows:
+                    success = self._deliver_to_window(hwnd, window_info, session, self.delivery, token)
+                else:
+                    success = self._deliver_to_window(hwnd, window_info, session, self.fallback_delivery, token)
+                    # Restore original focus
+                    self._restore_original_focus()
             
             if success:
                 self.logger.info(f"Successfully sent prompt to {app_name}")
@@ -139,15 +469,10 @@ class ReliablePromptSender:
             test_text = "Multi-AI Chat Manager Test with Unicode: éñ中文🤖"
             
             # Test clipboard write with Unicode
-            win32clipboard.OpenClipboard()
-            win32clipboard.EmptyClipboard()
-            win32clipboard.SetClipboardText(test_text, win32clipboard.CF_UNICODETEXT)
-            win32clipboard.CloseClipboard()
+            self.backend.set_clipboard_text(test_text)
             
             # Test clipboard read
-            win32clipboard.OpenClipboard()
-            clipboard_content = win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
-            win32clipboard.CloseClipboard()
+            clipboard_content = self.backend.get_clipboard_text()
             
             success = clipboard_content == test_text
             
@@ -163,12 +488,10 @@ class ReliablePromptSender:
             return False
     
     def test_com_automation(self) -> bool:
-        """Test if COM automation (WScript.Shell) works properly"""
+        """Test if keystroke injection (shared injector thread) works properly"""
         try:
-            shell = win32com.client.Dispatch("WScript.Shell")
-            
             # Simple test - this should not cause any visible effect
-            shell.SendKeys("")
+            self.backend.send_keys("")
             
             self.logger.info("COM automation test passed")
             return True
@@ -180,8 +503,12 @@ class ReliablePromptSender:
     def get_configuration_info(self) -> Dict:
         """Get current configuration information for diagnostics"""
         return {
+            'delivery_method': self.delivery.name,
             'prompt_send_delay': self.config.get('window', {}).get('timing', {}).get('prompt_send_delay', 0.1),
             'action_delay': self.config.get('window', {}).get('timing', {}).get('action_delay', 0.1),
+            'restore_timeout': self.waiter.restore_timeout,
+            'foreground_timeout': self.waiter.foreground_timeout,
+            'paste_settle': self.waiter.paste_settle,
             'clipboard_test': self.test_clipboard_functionality(),
             'com_automation_test': self.test_com_automation()
         }
@@ -0,0 +1,78 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Readiness Waits
+ poll window state instead of sleeping for a fixed time
+"""
+
+import time
+import logging
+from typing import Callable, Dict, List
+
+
+class ReadinessWaiter:
+    """Waits until a window reaches the state a delivery step needs.
+
+    Each wait returns as soon as the condition holds, or gives up after the
+    per-step timeout configured under ``window.timing``.
+    """
+
+    def __init__(self, backend, config: Dict):
+        self.backend = backend
+        self.logger = logging.getLogger(__name__)
+
+        timing = config.get('window', {}).get('timing', {})
+        self.restore_timeout = timing.get('restore_timeout', 1.0)
+        self.foreground_timeout = timing.get('foreground_timeout', 1.0)
+        self.paste_settle = timing.get('paste_settle', 0.05)
+        self.poll_interval = timing.get('poll_interval', 0.01)
+
+    def wait_until(self, condition: Callable[[], bool], timeout: float, token=None) -> bool:
+        """Poll condition until it is true or timeout expires.
+        
+        With a cancellation token the wait also ends at the token's deadline,
+        and raises DispatchAborted if the token is cancelled or expires.
+        """
+        deadline = time.perf_counter() + timeout
+        if token is not None and token.deadline is not None:
+            deadline = min(deadline, token.deadline)
+        while True:
+            try:
+                if condition():
+                    return True
+            except Exception as e:
+                self.logger.debug(f"Readiness condition raised: {e}")
+            if token is not None:
+                token.check()
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(self.poll_interval)
+
+    def wait_restored(self, hwnd: int, token=None, timeout: float = None) -> bool:
+        """Wait until the window is no longer minimized"""
+        timeout = self.restore_timeout if timeout is None else timeout
+        return self.wait_until(lambda: not self.backend.is_iconic(hwnd), timeout, token)
+
+    def wait_all_restored(self, hwnds: List[int], token=None) -> List[int]:
+        """Wait once for a batch of restores; returns the windows still minimized"""
+        pending = set(hwnds)
+
+        def all_restored():
+            for hwnd in list(pending):
+                if not self.backend.is_iconic(hwnd):
+                    pending.discard(hwnd)
+            return not pending
+
+        self.wait_until(all_restored, self.restore_timeout, token)
+        return [hwnd for hwnd in hwnds if hwnd in pending]
+
+    def wait_foreground(self, hwnd: int, token=None, timeout: float = None) -> bool:
+        """Wait until the window is confirmed as the foreground window"""
+        timeout = self.foreground_timeout if timeout is None else timeout
+        return self.wait_until(lambda: self.backend.get_foreground_window() == hwnd, timeout, token)
+
+    def settle_after_paste(self, token=None, settle: float = None) -> None:
+        """Paste completion cannot be observed, so allow a short configurable settle"""
+        settle = self.paste_settle if settle is None else settle
+        if token is not None:
+            settle = min(settle, token.remaining(settle))
+        if settle > 0:
+            time.sleep(settle)
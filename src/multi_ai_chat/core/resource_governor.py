@@ -0,0 +1,283 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Resource Governor
+ hibernates idle AI apps (idle priority, trimmed working set) and wakes them before use
+"""
+
+import time
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Set
+
+import psutil
+
+from core.process_cache import SHARED_BROWSER_EXECUTABLES
+
+# Windows priority class; the lowest scheduling priority elsewhere
+IDLE_PRIORITY = getattr(psutil, 'IDLE_PRIORITY_CLASS', 19)
+
+
+def format_bytes(size: int) -> str:
+    if size >= 1024 ** 3:
+        return f"{size / 1024 ** 3:.1f} GB"
+    return f"{size / 1024 ** 2:.0f} MB"
+
+
+class ResourceGovernor:
+    """Samples per-app memory and CPU and hibernates apps left idle.
+
+    An app is idle once the manager has not used it (dispatch, bring to
+    front), it has not been the foreground window and its processes stayed
+    under idle_cpu_percent for idle_after seconds. Hibernating drops its
+    processes to idle priority and trims their working sets; wake() puts the
+    original priority back before the app is used again, as does CPU use
+    above idle_cpu_percent. Processes shared with an app that is still
+    active are left alone, and apps hosted in a shared browser process are
+    not governed at all: that process tree also runs the user's other tabs.
+    """
+
+    def __init__(self, config: Dict, backend, window_source: Callable[[], Dict[int, Dict]]):
+        self.backend = backend
+        self.window_source = window_source
+        self.logger = logging.getLogger(__name__)
+
+        resources_config = config.get('resources', {})
+        self.enabled = resources_config.get('enabled', True)
+        self.idle_after = resources_config.get('idle_after', 600.0)
+        self.sample_interval = resources_config.get('sample_interval', 15.0)
+        self.idle_cpu_percent = resources_config.get('idle_cpu_percent', 2.0)
+        self.lower_priority = resources_config.get('lower_priority', True)
+        self.trim_working_set = resources_config.get('trim_working_set', True)
+
+        # app -> {'rss', 'cpu_percent', 'processes'} from the last sample
+        self.usage: Dict[str, Dict] = {}
+        # app -> processes it had hibernated, and each lowered process's original priority
+        self.hibernated: Dict[str, Set[int]] = {}
+        self._original_priority: Dict[int, int] = {}
+        # app -> bytes paged out when it was hibernated
+        self.reclaimed: Dict[str, int] = {}
+        self._last_active: Dict[str, float] = {}
+        # Kept between samples so cpu_percent measures the interval since the last call
+        self._processes: Dict[int, psutil.Process] = {}
+        self._lock = threading.Lock()
+
+        # Called (from the sampling thread) after each sample and wake
+        self.on_change: Optional[Callable[[], None]] = None
+
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def sample(self) -> Dict[str, Dict]:
+        """Measure every app and hibernate the ones idle past idle_after"""
+        windows = self.window_source()
+        app_pids = self._app_pids(windows)
+        now = time.monotonic()
+
+        try:
+            foreground_app = windows.get(self.backend.get_foreground_window(), {}).get('app_name')
+        except Exception:
+            foreground_app = None
+        if foreground_app in self.hibernated:
+            # Switched to directly (e.g. Alt+Tab), not through the manager
+            self._wake_apps([foreground_app])
+
+        usage = {}
+        working = []
+        for app_name, pids in app_pids.items():
+            rss, cpu = self._measure(pids)
+            usage[app_name] = {'rss': rss, 'cpu_percent': round(cpu, 1), 'processes': len(pids)}
+            with self._lock:
+                self._last_active.setdefault(app_name, now)
+                if app_name == foreground_app or cpu > self.idle_cpu_percent:
+                    self._last_active[app_name] = now
+                    if app_name in self.hibernated:
+                        working.append(app_name)
+        if working:
+            # Busy again in the background (e.g. still answering), so not idle
+            self._wake_apps(working)
+
+        with self._lock:
+            self.usage = usage
+            for app_name in list(self.hibernated):
+                if app_name not in app_pids:
+                    for pid in self.hibernated.pop(app_name):
+                        self._original_priority.pop(pid, None)
+                    self.reclaimed.pop(app_name, None)
+            idle = [app_name for app_name in app_pids
+                    if app_name not in self.hibernated and now - self._last_active[app_name] >= self.idle_after]
+            busy_pids: Set[int] = set()
+            for app_name, pids in app_pids.items():
+                if app_name not in idle and app_name not in self.hibernated:
+                    busy_pids |= pids
+
+        for app_name in idle:
+            self._hibernate(app_name, app_pids[app_name] - busy_pids)
+
+        # Forget processes that are no longer part of any app
+        seen = set().union(*app_pids.values()) if app_pids else set()
+        for pid in list(self._processes):
+            if pid not in seen:
+                self._processes.pop(pid, None)
+
+        self._notify_change()
+        return usage
+
+    def wake(self, hwnds: List[int]) -> List[str]:
+        """Restore the apps owning these windows before they are used; returns the apps woken"""
+        windows = self.window_source()
+        app_names = {windows[hwnd]['app_name'] for hwnd in hwnds if hwnd in windows}
+        now = time.monotonic()
+        with self._lock:
+            for app_name in app_names:
+                self._last_active[app_name] = now
+        return self._wake_apps(app_names)
+
+    def restore_all(self) -> None:
+        """Undo every priority change (used on shutdown)"""
+        with self._lock:
+            app_names = list(self.hibernated)
+        self._wake_apps(app_names)
+
+    def summary(self) -> str:
+        """Status bar text: memory and CPU of all AI apps, and what hibernation saved"""
+        with self._lock:
+            if not self.usage:
+                return ""
+            rss = sum(entry['rss'] for entry in self.usage.values())
+            cpu = sum(entry['cpu_percent'] for entry in self.usage.values())
+            hibernated = len(self.hibernated)
+            reclaimed = sum(self.reclaimed.values())
+        text = f"AI apps: {format_bytes(rss)}, {cpu:.0f}% CPU"
+        if hibernated:
+            text += f" | {hibernated} idle, {format_bytes(reclaimed)} reclaimed"
+        return text
+
+    def start(self) -> None:
+        """Start sampling in the background"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="ResourceGovernor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.restore_all()
+
+    def _sample_loop(self) -> None:
+        while not self._stop_event.wait(self.sample_interval):
+            try:
+                self.sample()
+            except Exception as e:
+                self.logger.error(f"Resource sampling failed: {e}")
+
+    def _app_pids(self, windows: Dict[int, Dict]) -> Dict[str, Set[int]]:
+        """Owner process of each app window plus its children (renderers, GPU process...)"""
+        app_pids: Dict[str, Set[int]] = {}
+        for hwnd, info in windows.items():
+            try:
+                pid = self.backend.get_window_pid(hwnd)
+            except Exception:
+                continue
+            process = self._process(pid) if pid else None
+            if process is None or self._is_shared_browser(process):
+                continue
+            pids = app_pids.setdefault(info.get('app_name', 'Unknown'), set())
+            pids.add(pid)
+            try:
+                pids.update(child.pid for child in process.children(recursive=True))
+            except psutil.Error:
+                pass
+        return app_pids
+
+    def _process(self, pid: int) -> Optional[psutil.Process]:
+        process = self._processes.get(pid)
+        try:
+            if process is None or not process.is_running():
+                process = psutil.Process(pid)
+                self._processes[pid] = process
+            return process
+        except psutil.Error:
+            self._processes.pop(pid, None)
+            return None
+
+    def _is_shared_browser(self, process: psutil.Process) -> bool:
+        try:
+            return process.name().lower() in SHARED_BROWSER_EXECUTABLES
+        except psutil.Error:
+            # Unreadable owners are left alone like browsers
+            return True
+
+    def _measure(self, pids: Set[int]):
+        rss, cpu = 0, 0.0
+        for pid in pids:
+            process = self._process(pid)
+            if process is None:
+                continue
+            try:
+                rss += process.memory_info().rss
+                cpu += process.cpu_percent(None)
+            except psutil.Error:
+                pass
+        return rss, cpu
+
+    def _hibernate(self, app_name: str, pids: Set[int]) -> None:
+        if not pids:
+            self.logger.debug(f"{app_name} idle, but its processes are shared with an active app")
+            return
+
+        before, _ = self._measure(pids)
+        for pid in pids:
+            process = self._process(pid)
+            if process is None:
+                continue
+            try:
+                # A process shared with another hibernated app keeps its first recorded priority
+                if self.lower_priority and pid not in self._original_priority:
+                    priority = process.nice()
+                    process.nice(IDLE_PRIORITY)
+                    with self._lock:
+                        self._original_priority[pid] = priority
+                if self.trim_working_set:
+                    self.backend.trim_working_set(pid)
+            except (psutil.Error, OSError) as e:
+                self.logger.debug(f"Could not hibernate process {pid} of {app_name}: {e}")
+        after, _ = self._measure(pids)
+
+        with self._lock:
+            self.hibernated[app_name] = set(pids)
+            self.reclaimed[app_name] = max(0, before - after)
+        self.logger.info(f"Hibernated idle {app_name}: {len(pids)} processes, "
+                         f"{format_bytes(max(0, before - after))} paged out")
+
+    def _wake_apps(self, app_names) -> List[str]:
+        woken = []
+        for app_name in app_names:
+            with self._lock:
+                pids = self.hibernated.pop(app_name, None)
+                self.reclaimed.pop(app_name, None)
+                if pids is None:
+                    continue
+                original = {pid: self._original_priority.pop(pid) for pid in pids if pid in self._original_priority}
+            for pid, priority in original.items():
+                process = self._process(pid)
+                if process is None:
+                    continue
+                try:
+                    process.nice(priority)
+                except (psutil.Error, OSError) as e:
+                    self.logger.debug(f"Could not restore priority of process {pid}: {e}")
+            woken.append(app_name)
+            self.logger.info(f"Woke {app_name}")
+        if woken:
+            self._notify_change()
+        return woken
+
+    def _notify_change(self) -> None:
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception as e:
+                self.logger.debug(f"Resource change callback failed: {e}")
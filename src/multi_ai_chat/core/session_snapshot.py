@@ -0,0 +1,80 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Session Snapshot
+ warm-start record of each app's processes, windows and the AI selection
+"""
+
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class SessionSnapshot:
+    """Remembers which windows belonged to each app, with their owning process.
+
+    On the next start the manager re-attaches to each recorded window that
+    is still owned by the same process (same pid and create time) and only
+    launches the apps that are missing. The AI selection is kept here as well.
+    """
+
+    def __init__(self, config: Dict):
+        self.logger = logging.getLogger(__name__)
+
+        session_config = config.get('session', {})
+        self.enabled = session_config.get('warm_start', True)
+        self.snapshot_file = session_config.get('snapshot_file', 'data/session_snapshot.json')
+
+        self.apps: Dict[str, List[Dict]] = {}
+        self.selected_apps: Optional[List[str]] = None
+        self._lock = threading.Lock()
+
+        self._load()
+
+    def record_windows(self, signatures: Dict[str, List[Dict]]) -> None:
+        """Replace the per-app window signatures (hwnd, pid, create_time, exe, title)"""
+        with self._lock:
+            self.apps = signatures
+
+    def record_selection(self, selected_apps: List[str]) -> None:
+        with self._lock:
+            self.selected_apps = list(selected_apps)
+
+    def apply_selection(self, config: Dict) -> None:
+        """Restore the saved AI selection into the app config"""
+        if not self.enabled or self.selected_apps is None:
+            return
+        for app in config['ai_apps']:
+            app['selected'] = app['name'] in self.selected_apps
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+        try:
+            data_dir = os.path.dirname(self.snapshot_file)
+            if data_dir and not os.path.exists(data_dir):
+                os.makedirs(data_dir)
+            with self._lock:
+                data = {
+                    'updated': datetime.now().isoformat(),
+                    'apps': self.apps,
+                    'selected_apps': self.selected_apps
+                }
+            with open(self.snapshot_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.logger.debug(f"Session snapshot saved to {self.snapshot_file}")
+        except Exception as e:
+            self.logger.error(f"Error saving session snapshot: {e}")
+
+    def _load(self) -> None:
+        if not self.enabled or not os.path.exists(self.snapshot_file):
+            return
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.apps = data.get('apps', {})
+            self.selected_apps = data.get('selected_apps')
+            self.logger.info(f"Loaded session snapshot with {len(self.apps)} apps from {self.snapshot_file}")
+        except Exception as e:
+            self.logger.error(f"Error loading session snapshot: {e}")
@@ -0,0 +1,191 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Timing Profiles
+ per-app settle times learned from dispatch outcomes
+"""
+
+import os
+import json
+import math
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class StepEstimate:
+    """Exponentially weighted mean/variance of one step's settle time"""
+
+    def __init__(self, mean: float = 0.0, variance: float = 0.0, samples: int = 0):
+        self.mean = mean
+        self.variance = variance
+        self.samples = samples
+
+    def update(self, value: float, alpha: float) -> None:
+        if self.samples == 0:
+            self.mean = value
+            self.variance = 0.0
+        else:
+            delta = value - self.mean
+            self.mean += alpha * delta
+            self.variance = (1 - alpha) * (self.variance + alpha * delta * delta)
+        self.samples += 1
+
+    def percentile(self, z: float) -> float:
+        """Approximate upper percentile: mean + z standard deviations"""
+        return self.mean + z * math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict:
+        return {'mean': self.mean, 'variance': self.variance, 'samples': self.samples}
+
+
+class TimingProfileStore:
+    """Learns how fast each app settles and derives its delivery waits.
+
+    Observed restore and focus times feed an exponentially weighted
+    percentile per app. Waits are that percentile times a safety margin,
+    clamped between a floor and the global ``window.timing`` value, so a
+    bad estimate can never exceed the configured upper bound. A learned wait
+    is only the first bound tried: delivery keeps waiting up to the
+    configured one before it fails a window. Paste completion cannot be
+    observed, so paste_settle is never learned.
+    """
+
+    # Observed step -> wait it controls
+    STEP_WAITS = {
+        'restore': 'restore_timeout',
+        'focus': 'foreground_timeout'
+    }
+
+    def __init__(self, config: Dict):
+        self.logger = logging.getLogger(__name__)
+
+        timing = config.get('window', {}).get('timing', {})
+        self.defaults = {
+            'restore_timeout': timing.get('restore_timeout', 1.0),
+            'foreground_timeout': timing.get('foreground_timeout', 1.0),
+            'paste_settle': timing.get('paste_settle', 0.05)
+        }
+
+        profiles_config = timing.get('profiles', {})
+        self.enabled = profiles_config.get('enabled', True)
+        self.profile_file = profiles_config.get('file', 'data/timing_profiles.json')
+        self.alpha = profiles_config.get('alpha', 0.2)
+        self.z = profiles_config.get('z', 1.645)  # ~95th percentile
+        self.margin = profiles_config.get('margin', 1.5)
+        self.min_samples = profiles_config.get('min_samples', 5)
+        self.floors = {
+            'restore_timeout': 0.2,
+            'foreground_timeout': 0.15
+        }
+        self.floors.update(profiles_config.get('floors', {}))
+
+        self.profiles: Dict[str, Dict[str, StepEstimate]] = {}
+        self._lock = threading.Lock()
+
+        if profiles_config.get('reset_on_start', False):
+            self.reset()
+        else:
+            self._load()
+
+    def observe(self, app_name: str, step: str, seconds: float, success: bool = True) -> None:
+        """Record how long a step took for an app.
+
+        A failed step counts as the full configured wait, which pulls the
+        estimate back up if a learned wait turned out too short.
+        """
+        if not self.enabled or step not in self.STEP_WAITS:
+            return
+        if not success:
+            seconds = self.defaults[self.STEP_WAITS[step]]
+        with self._lock:
+            steps = self.profiles.setdefault(app_name, {})
+            steps.setdefault(step, StepEstimate()).update(seconds, self.alpha)
+
+    def observe_dispatch(self, windows) -> None:
+        """Feed the per-window phase timings of one dispatch and persist"""
+        if not self.enabled:
+            return
+        for entry in windows:
+            if entry.get('method') != 'sendkeys':
+                continue
+            phases = entry.get('phases', {})
+            # Focus is the step that can fail outright: it ran but delivery never reached the clipboard
+            focus_failed = not entry.get('success') and 'clipboard' not in phases
+            for step in self.STEP_WAITS:
+                if step in phases:
+                    success = not (step == 'focus' and focus_failed)
+                    self.observe(entry['app_name'], step, phases[step], success)
+        self.save()
+
+    def get_timing(self, app_name: Optional[str]) -> Dict[str, float]:
+        """Waits to use for an app (configured defaults until enough samples)"""
+        timing = dict(self.defaults)
+        if not self.enabled or not app_name:
+            return timing
+
+        with self._lock:
+            steps = self.profiles.get(app_name, {})
+            for step, wait_name in self.STEP_WAITS.items():
+                estimate = steps.get(step)
+                if estimate and estimate.samples >= self.min_samples:
+                    timing[wait_name] = self._clamp(wait_name, estimate.percentile(self.z) * self.margin)
+
+        return timing
+
+    def settle_estimates(self) -> Dict[str, float]:
+        """Mean restore + focus time per app (used to order dispatch before metrics exist)"""
+        with self._lock:
+            return {
+                app: sum(estimate.mean for estimate in steps.values())
+                for app, steps in self.profiles.items()
+                if steps
+            }
+
+    def _clamp(self, wait_name: str, value: float) -> float:
+        return round(min(max(value, self.floors[wait_name]), self.defaults[wait_name]), 4)
+
+    def reset(self, app_name: str = None) -> None:
+        """Forget learned timings for one app, or for all apps"""
+        with self._lock:
+            if app_name:
+                self.profiles.pop(app_name, None)
+            else:
+                self.profiles.clear()
+        self.save()
+        self.logger.info(f"Timing profiles reset: {app_name or 'all apps'}")
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+        try:
+            data_dir = os.path.dirname(self.profile_file)
+            if data_dir and not os.path.exists(data_dir):
+                os.makedirs(data_dir)
+            with self._lock:
+                data = {
+                    'updated': datetime.now().isoformat(),
+                    'apps': {
+                        app: {step: estimate.to_dict() for step, estimate in steps.items()}
+                        for app, steps in self.profiles.items()
+                    }
+                }
+            with open(self.profile_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            self.logger.error(f"Error saving timing profiles: {e}")
+
+    def _load(self) -> None:
+        if not self.enabled or not os.path.exists(self.profile_file):
+            return
+        try:
+            with open(self.profile_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for app, steps in data.get('apps', {}).items():
+                self.profiles[app] = {
+                    step: StepEstimate(values['mean'], values['variance'], values['samples'])
+                    for step, values in steps.items()
+                    if step in self.STEP_WAITS
+                }
+            self.logger.info(f"Loaded timing profiles for {len(self.profiles)} apps from {self.profile_file}")
+        except Exception as e:
+            self.logger.error(f"Error loading timing profiles: {e}")
@@ -0,0 +1,190 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Win32 Backend
+ window and clipboard primitives used by the prompt sender
+"""
+
+import ctypes
+from ctypes import wintypes
+import win32gui
+import win32con
+import win32clipboard
+import win32process
+import logging
+from typing import Dict, Optional
+
+from core.input_injector import InputInjector
+
+# Class used by Chromium/Electron for the child window that receives keyboard input
+RENDERER_WINDOW_CLASS = "Chrome_RenderWidgetHostHWND"
+
+
+class GUITHREADINFO(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("flags", wintypes.DWORD),
+        ("hwndActive", wintypes.HWND),
+        ("hwndFocus", wintypes.HWND),
+        ("hwndCapture", wintypes.HWND),
+        ("hwndMenuOwner", wintypes.HWND),
+        ("hwndMoveSize", wintypes.HWND),
+        ("hwndCaret", wintypes.HWND),
+        ("rcCaret", wintypes.RECT)
+    ]
+
+
+class Win32Backend:
+    """Thin wrapper around the Win32 calls needed to deliver a prompt"""
+
+    def __init__(self, config: Dict = None):
+        self.logger = logging.getLogger(__name__)
+
+        # One long-lived injection thread instead of a WScript.Shell per send
+        method = (config or {}).get('window', {}).get('input', {}).get('method', 'sendkeys')
+        self.injector = InputInjector(method)
+
+    def close(self) -> None:
+        self.injector.stop()
+
+    # Window primitives
+
+    def get_foreground_window(self) -> int:
+        return win32gui.GetForegroundWindow()
+
+    def set_foreground_window(self, hwnd: int) -> None:
+        win32gui.SetForegroundWindow(hwnd)
+
+    def is_window(self, hwnd: int) -> bool:
+        return bool(win32gui.IsWindow(hwnd))
+
+    def is_iconic(self, hwnd: int) -> bool:
+        return bool(win32gui.IsIconic(hwnd))
+
+    def restore_window(self, hwnd: int) -> None:
+        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+
+    def is_visible(self, hwnd: int) -> bool:
+        return bool(win32gui.IsWindowVisible(hwnd))
+
+    def is_hung(self, hwnd: int) -> bool:
+        """True if the window's UI thread has stopped pumping messages"""
+        return bool(ctypes.windll.user32.IsHungAppWindow(hwnd))
+
+    def ping(self, hwnd: int, timeout_ms: int = 200) -> bool:
+        """Send WM_NULL with a timeout; False if the window's thread does not answer in time"""
+        try:
+            win32gui.SendMessageTimeout(hwnd, win32con.WM_NULL, 0, 0, win32con.SMTO_ABORTIFHUNG, timeout_ms)
+            return True
+        except Exception:
+            return False
+
+    def show_window_async(self, hwnd: int, cmd_show: int) -> None:
+        """Post a show-state change without waiting for the window's thread"""
+        ctypes.windll.user32.ShowWindowAsync(hwnd, cmd_show)
+
+    def restore_window_async(self, hwnd: int) -> None:
+        self.show_window_async(hwnd, win32con.SW_RESTORE)
+
+    def unhide_window_async(self, hwnd: int) -> None:
+        self.show_window_async(hwnd, win32con.SW_SHOWNA)
+
+    def get_window_text(self, hwnd: int) -> str:
+        return win32gui.GetWindowText(hwnd)
+
+    # Process primitives
+
+    PROCESS_SET_QUOTA = 0x0100
+    PROCESS_QUERY_INFORMATION = 0x0400
+
+    def get_window_pid(self, hwnd: int) -> int:
+        return win32process.GetWindowThreadProcessId(hwnd)[1]
+
+    def trim_working_set(self, pid: int) -> bool:
+        """Ask Windows to page out a process's working set (pages come back on demand)"""
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(self.PROCESS_SET_QUOTA | self.PROCESS_QUERY_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            # (SIZE_T)-1 for both limits empties the working set
+            return bool(kernel32.SetProcessWorkingSetSize(handle, ctypes.c_size_t(-1), ctypes.c_size_t(-1)))
+        finally:
+            kernel32.CloseHandle(handle)
+
+    # Clipboard primitives
+
+    def get_clipboard_sequence(self) -> int:
+        """Return the system clipboard sequence number (changes on every write)"""
+        return win32clipboard.GetClipboardSequenceNumber()
+
+    def set_clipboard_text(self, text: str) -> int:
+        """Write Unicode text to the clipboard and return the new sequence number"""
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            # Use CF_UNICODETEXT format to handle Unicode characters
+            win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
+        finally:
+            win32clipboard.CloseClipboard()
+        return self.get_clipboard_sequence()
+
+    def get_clipboard_text(self) -> str:
+        win32clipboard.OpenClipboard()
+        try:
+            return win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+        finally:
+            win32clipboard.CloseClipboard()
+
+    # Input primitives
+
+    def send_keys(self, keys: str) -> None:
+        """Send a SendKeys-style sequence to the foreground window via the injector thread"""
+        self.injector.send_keys(keys)
+
+    def find_input_window(self, hwnd: int) -> Optional[int]:
+        """Return the renderer child window that handles keyboard input, if any"""
+        found = []
+
+        def enum_child_proc(child, lParam):
+            if win32gui.GetClassName(child) == RENDERER_WINDOW_CLASS:
+                found.append(child)
+                return False
+            return True
+
+        try:
+            win32gui.EnumChildWindows(hwnd, enum_child_proc, None)
+        except Exception:
+            # EnumChildWindows raises when the callback stops enumeration early
+            pass
+        return found[0] if found else None
+
+    def has_input_focus(self, hwnd: int) -> bool:
+        """True if hwnd holds the keyboard focus of its own UI thread.
+
+        Chromium only turns posted WM_CHAR into page input while its renderer
+        window is that thread's focus window; otherwise the characters are dropped.
+        """
+        try:
+            thread_id, _ = win32process.GetWindowThreadProcessId(hwnd)
+            info = GUITHREADINFO(cbSize=ctypes.sizeof(GUITHREADINFO))
+            user32 = ctypes.windll.user32
+            user32.GetGUIThreadInfo.argtypes = [wintypes.DWORD, ctypes.POINTER(GUITHREADINFO)]
+            user32.GetGUIThreadInfo.restype = wintypes.BOOL
+            if not user32.GetGUIThreadInfo(thread_id, ctypes.byref(info)):
+                return False
+            return info.hwndFocus == hwnd
+        except Exception:
+            return False
+
+    def post_text(self, hwnd: int, text: str) -> None:
+        """Post text as WM_CHAR messages (UTF-16 code units) without taking focus"""
+        data = text.encode('utf-16-le')
+        for i in range(0, len(data), 2):
+            code_unit = data[i] | (data[i + 1] << 8)
+            win32gui.PostMessage(hwnd, win32con.WM_CHAR, code_unit, 0)
+
+    def post_submit(self, hwnd: int) -> None:
+        """Post an Enter key press to the window"""
+        # lParam: repeat count 1, scan code 0x1C; key-up sets the previous-state and transition bits
+        win32gui.PostMessage(hwnd, win32con.WM_KEYDOWN, win32con.VK_RETURN, 0x001C0001)
+        win32gui.PostMessage(hwnd, win32con.WM_CHAR, 0x0D, 0x001C0001)
+        win32gui.PostMessage(hwnd, win32con.WM_KEYUP, win32con.VK_RETURN, 0xC01C0001)
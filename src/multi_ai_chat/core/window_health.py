@@ -0,0 +1,126 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Window Health Monitor
+ hung-window detection with cached probes and quarantine
+"""
+
+import time
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class WindowHealthMonitor:
+    """Probes AI windows for responsiveness and quarantines hung ones.
+
+    Probe results are cached for a short TTL so dispatch and arrangement can
+    ask repeatedly without re-probing. Quarantined windows are re-probed in
+    the background and re-admitted as soon as they respond again.
+    """
+
+    def __init__(self, config: Dict, backend):
+        self.backend = backend
+        self.logger = logging.getLogger(__name__)
+
+        health_config = config.get('window', {}).get('health', {})
+        self.cache_ttl = health_config.get('cache_ttl', 2.0)
+        self.ping_timeout_ms = health_config.get('ping_timeout_ms', 200)
+        self.retry_interval = health_config.get('retry_interval', 5.0)
+
+        self._cache: Dict[int, Tuple[bool, float]] = {}
+        self.quarantined: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+        # Called (from the retry thread) when a window enters or leaves quarantine
+        self.on_change: Optional[Callable[[], None]] = None
+
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def probe(self, hwnd: int) -> bool:
+        """Check a window directly, bypassing the cache"""
+        try:
+            if not self.backend.is_window(hwnd):
+                return False
+            if self.backend.is_hung(hwnd):
+                return False
+            return self.backend.ping(hwnd, self.ping_timeout_ms)
+        except Exception as e:
+            self.logger.debug(f"Health probe failed for {hwnd}: {e}")
+            return False
+
+    def is_responsive(self, hwnd: int, force: bool = False) -> bool:
+        """Cached responsiveness check; updates quarantine state"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(hwnd)
+        if cached and not force and now - cached[1] < self.cache_ttl:
+            return cached[0]
+
+        responsive = self.probe(hwnd)
+        changed = False
+        with self._lock:
+            self._cache[hwnd] = (responsive, time.monotonic())
+            if responsive and hwnd in self.quarantined:
+                del self.quarantined[hwnd]
+                changed = True
+                self.logger.info(f"Window {hwnd} responding again, re-admitted")
+            elif not responsive and hwnd not in self.quarantined and self.backend.is_window(hwnd):
+                self.quarantined[hwnd] = now
+                changed = True
+                self.logger.warning(f"Window {hwnd} not responding, quarantined")
+
+        if changed:
+            self._notify_change()
+        return responsive
+
+    def is_quarantined(self, hwnd: int) -> bool:
+        with self._lock:
+            return hwnd in self.quarantined
+
+    def filter_responsive(self, hwnds: List[int]) -> Tuple[List[int], List[int]]:
+        """Split windows into (responsive, quarantined)"""
+        responsive, quarantined = [], []
+        for hwnd in hwnds:
+            if self.is_quarantined(hwnd) or not self.is_responsive(hwnd):
+                quarantined.append(hwnd)
+            else:
+                responsive.append(hwnd)
+        return responsive, quarantined
+
+    def forget(self, hwnd: int) -> None:
+        """Drop all state for a window that no longer exists"""
+        with self._lock:
+            self._cache.pop(hwnd, None)
+            self.quarantined.pop(hwnd, None)
+
+    def start(self) -> None:
+        """Start the background thread that retries quarantined windows"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._retry_loop, name="WindowHealthMonitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _retry_loop(self) -> None:
+        while not self._stop_event.wait(self.retry_interval):
+            with self._lock:
+                pending = list(self.quarantined)
+            for hwnd in pending:
+                if not self.backend.is_window(hwnd):
+                    self.forget(hwnd)
+                    self._notify_change()
+                    continue
+                self.is_responsive(hwnd, force=True)
+
+    def _notify_change(self) -> None:
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception as e:
+                self.logger.debug(f"Health change callback failed: {e}")
@@ -0,0 +1,92 @@
+"""
+Multi-AI Chat Manager v1.0.0 - App Launcher
+ starts AI apps from their shortcuts and keeps track of the processes started
+"""
+
+import os
+import logging
+import subprocess
+from typing import Dict, Optional, Set, Tuple
+
+import psutil
+
+
+class AppLauncher:
+    """Resolves .lnk shortcuts and starts their targets as child processes.
+
+    Unlike os.startfile, starting the target directly returns a process
+    handle, so the windows the app opens can be attributed to it by PID.
+    Shortcuts without a launchable target fall back to os.startfile.
+    """
+
+    DETACHED_PROCESS = 0x00000008
+    CREATE_NEW_PROCESS_GROUP = 0x00000200
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def resolve_shortcut(self, shortcut_path: str) -> Optional[Dict]:
+        """Target, arguments and working directory of a .lnk file"""
+        if not shortcut_path.lower().endswith('.lnk'):
+            return None
+
+        import pythoncom
+        import win32com.client
+
+        # Runs on launch worker threads, which need their own COM apartment
+        pythoncom.CoInitialize()
+        try:
+            shortcut = win32com.client.Dispatch("WScript.Shell").CreateShortcut(shortcut_path)
+            target = shortcut.TargetPath
+            if not target or not os.path.exists(target):
+                return None
+            return {
+                'target': target,
+                'arguments': shortcut.Arguments or '',
+                'working_dir': shortcut.WorkingDirectory or os.path.dirname(target)
+            }
+        except Exception as e:
+            self.logger.debug(f"Could not resolve shortcut {shortcut_path}: {e}")
+            return None
+        finally:
+            pythoncom.CoUninitialize()
+
+    def launch(self, app: Dict) -> Tuple[bool, Optional[int]]:
+        """Start an app; returns (launched, pid) where pid is None if it is unknown"""
+        shortcut_path = app['shortcut']
+        if not os.path.exists(shortcut_path):
+            self.logger.warning(f"Shortcut not found: {shortcut_path}")
+            return False, None
+
+        resolved = self.resolve_shortcut(shortcut_path)
+        if resolved:
+            try:
+                command = subprocess.list2cmdline([resolved['target']])
+                if resolved['arguments']:
+                    command += ' ' + resolved['arguments']
+                process = subprocess.Popen(
+                    command,
+                    cwd=resolved['working_dir'] or None,
+                    creationflags=self.DETACHED_PROCESS | self.CREATE_NEW_PROCESS_GROUP,
+                    close_fds=True
+                )
+                self.logger.info(f"Launched {app['name']} (pid {process.pid})")
+                return True, process.pid
+            except Exception as e:
+                self.logger.debug(f"Direct launch of {app['name']} failed, using shell: {e}")
+
+        try:
+            os.startfile(shortcut_path)
+            self.logger.info(f"Launched {app['name']} via shell")
+            return True, None
+        except Exception as e:
+            self.logger.error(f"Error launching {app['name']}: {e}")
+            return False, None
+
+    def process_tree(self, pid: int) -> Set[int]:
+        """The process and all of its live descendants"""
+        try:
+            process = psutil.Process(pid)
+            return {pid} | {child.pid for child in process.children(recursive=True)}
+        except psutil.Error:
+            return set()
@@ -0,0 +1,224 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Display Topology
+ cached monitor work areas and DPI, refreshed on display-change notifications
+"""
+
+import ctypes
+import logging
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class Display(NamedTuple):
+    """One monitor; left/top/width/height are its work area"""
+    index: int
+    left: int
+    top: int
+    width: int
+    height: int
+    is_primary: bool = False
+    dpi: int = 96
+    bounds: Tuple[int, int, int, int] = (0, 0, 0, 0)  # full monitor rect
+
+    @property
+    def right(self) -> int:
+        return self.left + self.width
+
+    @property
+    def bottom(self) -> int:
+        return self.top + self.height
+
+    def to_dict(self) -> Dict:
+        return {
+            'index': self.index,
+            'left': self.left,
+            'top': self.top,
+            'right': self.right,
+            'bottom': self.bottom,
+            'width': self.width,
+            'height': self.height,
+            'is_primary': self.is_primary,
+            'dpi': self.dpi
+        }
+
+
+class DisplayTopology(NamedTuple):
+    """Immutable snapshot of all monitors (hashable, so usable as a cache key)"""
+    displays: Tuple[Display, ...]
+
+    def get(self, index: int) -> Optional[Display]:
+        """Display by 1-based index"""
+        if 1 <= index <= len(self.displays):
+            return self.displays[index - 1]
+        return None
+
+    @property
+    def primary(self) -> Optional[Display]:
+        for display in self.displays:
+            if display.is_primary:
+                return display
+        return self.displays[0] if self.displays else None
+
+
+# Used only when monitors cannot be queried at all
+FALLBACK_TOPOLOGY = DisplayTopology((Display(1, 0, 0, 1920, 1080, True, 96, (0, 0, 1920, 1080)),))
+
+
+class Win32DisplayProvider:
+    """Queries monitors through EnumDisplayMonitors/GetMonitorInfo"""
+
+    MDT_EFFECTIVE_DPI = 0
+
+    def query(self) -> DisplayTopology:
+        import win32api
+
+        displays = []
+        for i, monitor in enumerate(win32api.EnumDisplayMonitors()):
+            monitor_info = win32api.GetMonitorInfo(monitor[0])
+            work = monitor_info['Work']
+            displays.append(Display(
+                index=i + 1,
+                left=work[0],
+                top=work[1],
+                width=work[2] - work[0],
+                height=work[3] - work[1],
+                is_primary=monitor_info.get('Flags', 0) & 1 == 1,
+                dpi=self._monitor_dpi(monitor[0]),
+                bounds=tuple(monitor_info['Monitor'])
+            ))
+        return DisplayTopology(tuple(displays))
+
+    def _monitor_dpi(self, hmonitor) -> int:
+        try:
+            dpi_x, dpi_y = ctypes.c_uint(), ctypes.c_uint()
+            ctypes.windll.shcore.GetDpiForMonitor(
+                int(hmonitor), self.MDT_EFFECTIVE_DPI, ctypes.byref(dpi_x), ctypes.byref(dpi_y)
+            )
+            return dpi_x.value or 96
+        except Exception:
+            return 96
+
+
+class StaticDisplayProvider:
+    """Fixed topology for tests and tools; set() simulates a display change"""
+
+    def __init__(self, topology: DisplayTopology):
+        self.topology = topology
+
+    def query(self) -> DisplayTopology:
+        return self.topology
+
+    def set(self, topology: DisplayTopology) -> None:
+        self.topology = topology
+
+
+class DisplayTopologyService:
+    """Caches the display topology until the OS reports a change.
+
+    snapshot() only queries the provider after invalidate(); start() runs a
+    hidden window that invalidates the cache on WM_DISPLAYCHANGE, DPI
+    changes and work-area changes (e.g. the taskbar moving).
+    """
+
+    WM_DISPLAYCHANGE = 0x007E
+    WM_SETTINGCHANGE = 0x001A
+    WM_DPICHANGED = 0x02E0
+    SPI_SETWORKAREA = 0x002F
+
+    def __init__(self, provider=None):
+        self.provider = provider or Win32DisplayProvider()
+        self.logger = logging.getLogger(__name__)
+
+        self._snapshot: Optional[DisplayTopology] = None
+        self._lock = threading.Lock()
+        self.listeners: List[Callable[[DisplayTopology], None]] = []
+
+        self._thread = None
+        self._hwnd = None
+
+    def snapshot(self) -> DisplayTopology:
+        """Current topology, queried only if the cache was invalidated"""
+        with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+        try:
+            topology = self.provider.query()
+            if not topology.displays:
+                raise RuntimeError("no displays reported")
+        except Exception as e:
+            self.logger.error(f"Display detection error, assuming a single 1920x1080 display: {e}")
+            return FALLBACK_TOPOLOGY
+        with self._lock:
+            self._snapshot = topology
+        self.logger.info(f"Display topology: {len(topology.displays)} display(s) "
+                         + ", ".join(f"{d.width}x{d.height}@{d.dpi}dpi" for d in topology.displays))
+        return topology
+
+    def invalidate(self) -> None:
+        """Drop the cached topology and notify listeners with the new one"""
+        with self._lock:
+            self._snapshot = None
+        topology = self.snapshot()
+        for listener in list(self.listeners):
+            try:
+                listener(topology)
+            except Exception as e:
+                self.logger.debug(f"Display change listener failed: {e}")
+
+    def start(self) -> None:
+        """Listen for display changes on a background message loop"""
+        if self._thread and self._thread.is_alive():
+            return
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name="DisplayTopology", daemon=True)
+        self._thread.start()
+        ready.wait(2.0)
+
+    def stop(self) -> None:
+        if self._hwnd:
+            import win32gui
+            import win32con
+            win32gui.PostMessage(self._hwnd, win32con.WM_CLOSE, 0, 0)
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self, ready: threading.Event) -> None:
+        import win32api
+        import win32con
+        import win32gui
+
+        def wnd_proc(hwnd, msg, wparam, lparam):
+            if msg in (self.WM_DISPLAYCHANGE, self.WM_DPICHANGED) or \
+                    (msg == self.WM_SETTINGCHANGE and wparam == self.SPI_SETWORKAREA):
+                self.logger.info("Display configuration changed")
+                self.invalidate()
+                return 0
+            if msg == win32con.WM_CLOSE:
+                win32gui.DestroyWindow(hwnd)
+                return 0
+            if msg == win32con.WM_DESTROY:
+                win32gui.PostQuitMessage(0)
+                return 0
+            return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+
+        try:
+            window_class = win32gui.WNDCLASS()
+            window_class.hInstance = win32api.GetModuleHandle(None)
+            window_class.lpszClassName = "MultiAIChatDisplayListener"
+            window_class.lpfnWndProc = wnd_proc
+            class_atom = win32gui.RegisterClass(window_class)
+            # A hidden top-level window: message-only windows do not get broadcasts
+            self._hwnd = win32gui.CreateWindow(class_atom, "", 0, 0, 0, 0, 0, 0, 0, window_class.hInstance, None)
+        except Exception as e:
+            self.logger.error(f"Could not listen for display changes: {e}")
+            ready.set()
+            return
+
+        ready.set()
+        win32gui.PumpMessages()
+        self._hwnd = None
+        try:
+            win32gui.UnregisterClass(class_atom, window_class.hInstance)
+        except Exception:
+            pass
@@ -10,6 +10,16 @@ import logging
 from typing import Dict, Callable, List
 
 class CleanGUI:
+    # Status text for each stage of an app's reopen pipeline
+    REOPEN_STAGES = {
+        'closing': 'closing',
+        'launching': 'launching',
+        'ready': 'ready',
+        'close_timeout': 'did not close',
+        'timed_out': 'no window',
+        'failed': 'launch failed'
+    }
+    
     def __init__(self, config: Dict, callbacks: Dict[str, Callable]):
         self.config = config
         self.callbacks = callbacks
@@ -20,6 +30,7 @@ class CleanGUI:
         self.prompt_text = None
         self.status_label = None
         self.window_count_label = None
+        self.resource_label = None
         self.app_icons_frame = None
         self.app_selection_frame = None
         self.app_buttons = {}
@@ -28,6 +39,7 @@ class CleanGUI:
         # State
         self.history_manager = None
         self.active_apps = []
+        self.reopen_progress = {}
         
         # Colors
         self.colors = config['gui']['theme']
@@ -222,6 +234,15 @@ class CleanGUI:
         )
         send_btn.pack(side=tk.LEFT, padx=(0, 10))
         
+        cancel_btn = self._create_button(
+            buttons_row,
+            "Cancel Send",
+            self._on_cancel_send,
+            style='secondary',
+            width=12
+        )
+        cancel_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
         # Window control buttons
         minimize_btn = self._create_button(
             buttons_row,
@@ -251,6 +272,16 @@ class CleanGUI:
         )
         always_on_top_btn.pack(side=tk.LEFT, padx=(0, 10))
         
+        # Dispatch timing export
+        export_timings_btn = self._create_button(
+            buttons_row,
+            "Export Timings",
+            self._on_export_metrics,
+            style='secondary',
+            width=14
+        )
+        export_timings_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
         # Spacer
         spacer = tk.Frame(buttons_row, bg=self.colors['bg_primary'])
         spacer.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -321,7 +352,7 @@ class CleanGUI:
         status_frame.pack_propagate(False)
         
         # Hotkey hints
-        hints_text = "Hotkeys: Enter=Send | Shift+Enter=New Line | Select AIs above to target specific models | Click 'Toggle Always On Top' to change window behavior"
+        hints_text = "Hotkeys: Enter=Send | Shift+Enter=New Line | Select AIs above to target specific models | Right-click an app to reopen it | Click 'Toggle Always On Top' to change window behavior"
         hints_label = tk.Label(
             status_frame,
             text=hints_text,
@@ -340,6 +371,16 @@ class CleanGUI:
             fg=self.colors['fg_secondary']
         )
         version_label.pack(side=tk.RIGHT, padx=10, pady=3)
+        
+        # AI app memory/CPU and hibernation savings
+        self.resource_label = tk.Label(
+            status_frame,
+            text="",
+            font=self.config['gui']['fonts']['small'],
+            bg=self.colors['bg_secondary'],
+            fg=self.colors['fg_secondary']
+        )
+        self.resource_label.pack(side=tk.RIGHT, padx=10, pady=3)
     
     def _bind_hotkeys(self):
         """Bind keyboard shortcuts - removed arrow key navigation"""
@@ -359,11 +400,21 @@ class CleanGUI:
         """Select all AI applications"""
         for var in self.ai_selection_vars.values():
             var.set(True)
+        self._on_selection_changed()
     
     def _select_none_ai(self):
         """Deselect all AI applications"""
         for var in self.ai_selection_vars.values():
             var.set(False)
+        self._on_selection_changed()
+    
+    def _on_selection_changed(self):
+        """Report the current AI selection so it survives a restart"""
+        if 'selection_changed' in self.callbacks:
+            try:
+                self.callbacks['selection_changed'](self._get_selected_apps())
+            except Exception as e:
+                self.logger.error(f"Error saving AI selection: {e}")
     
     def _get_selected_apps(self):
         """Get list of selected AI applications"""
@@ -400,10 +451,19 @@ class CleanGUI:
                 
                 if result['success'] > 0:
                     status_msg = f"Sent to {result['success']}/{result['total']} selected applications"
-                    self.update_status(status_msg, "success")
+                    details = self._format_partial_summary(result)
+                    timing_summary = self._format_timing_summary(result.get('timings'))
+                    if timing_summary:
+                        details.append(timing_summary)
+                    if details:
+                        status_msg += f" ({', '.join(details)})"
+                    partial = result['success'] < result['total']
+                    self.update_status(status_msg, "warning" if partial else "success")
                     
                     # Clear prompt after successful send
                     self.root.after(0, self._clear_prompt_text)
+                elif result.get('cancelled'):
+                    self.update_status("Send cancelled before any application received the prompt", "warning")
                 else:
                     self.update_status("No selected applications received the prompt", "warning")
                     
@@ -413,6 +473,45 @@ class CleanGUI:
         
         threading.Thread(target=send_async, daemon=True).start()
     
+    def _on_cancel_send(self):
+        """Handle cancel of the prompt dispatch in progress"""
+        if 'cancel_send' not in self.callbacks:
+            return
+        
+        if self.callbacks['cancel_send']():
+            self.update_status("Cancelling send - stopping at the next window", "warning")
+        else:
+            self.update_status("No send in progress", "info")
+    
+    def _format_partial_summary(self, result: Dict) -> List[str]:
+        """Describe apps that were skipped or timed out in a partial send"""
+        details = []
+        if result.get('timed_out'):
+            details.append(f"timed out: {', '.join(result['timed_out'])}")
+        if result.get('skipped'):
+            details.append(f"skipped: {', '.join(result['skipped'])}")
+        return details
+    
+    def _format_timing_summary(self, timings) -> str:
+        """Summarize a dispatch timing breakdown for the status label"""
+        if not timings:
+            return ""
+        summary = f"{timings.get('elapsed', 0.0):.2f}s"
+        slowest = timings.get('slowest')
+        if slowest:
+            summary += f", slowest: {slowest['app_name']} {slowest['phase']} {slowest['seconds']:.2f}s"
+        return summary
+    
+    def _on_export_metrics(self):
+        """Handle export of dispatch timings"""
+        if 'export_metrics' not in self.callbacks:
+            return
+        
+        if self.callbacks['export_metrics']():
+            self.update_status("Dispatch timings exported", "success")
+        else:
+            self.update_status("Error exporting dispatch timings", "error")
+    
     def _clear_prompt_text(self):
         """Clear the prompt text"""
         self.prompt_text.delete("1.0", tk.END)
@@ -443,12 +542,15 @@ class CleanGUI:
                 if 'restore_all' in self.callbacks:
                     restored = self.callbacks['restore_all']()
                     if restored > 0:
+                        # Arrangement waits for the restores itself
                         self.update_status(f"Restored {restored} minimized windows, arranging in grid", "info")
-                        import time
-                        time.sleep(0.5)
                 
-                self.callbacks['arrange_windows']()
-                self.update_status("Windows restored and arranged in grid position", "success")
+                result = self.callbacks['arrange_windows']()
+                if result:
+                    self.update_status(f"Grid arranged: {result['moved']} moved, "
+                                       f"{result['skipped']} already in place", "success")
+                else:
+                    self.update_status("Windows restored and arranged in grid position", "success")
                 self._update_app_buttons_state()
                 
             except Exception as e:
@@ -471,25 +573,73 @@ class CleanGUI:
             
             def reopen_async():
                 try:
-                    result = self.callbacks['reopen_all']()
-                    self.update_status(f"Reopened {result} applications", "success")
-                    self._update_app_icons()
-                    self._update_ai_selection()
+                    results = self.callbacks['reopen_all'](self.update_reopen_progress)
+                    self._report_reopen_results(results)
                 except Exception as e:
                     self.update_status("Error reopening apps", "error")
             
+            self.reopen_progress.clear()
             threading.Thread(target=reopen_async, daemon=True).start()
     
+    def _on_app_reopen(self, app_name: str):
+        """Handle reopening a single app (right-click on its icon)"""
+        if 'reopen_app' not in self.callbacks:
+            return
+        if not messagebox.askyesno("Confirm", f"Close {app_name} and reopen it?"):
+            return
+        self.update_status(f"Reopening {app_name}", "info")
+        
+        def reopen_async():
+            try:
+                results = self.callbacks['reopen_app'](app_name, self.update_reopen_progress)
+                self._report_reopen_results(results)
+            except Exception as e:
+                self.logger.error(f"Error reopening {app_name}: {e}")
+                self.update_status(f"Error reopening {app_name}", "error")
+        
+        self.reopen_progress.clear()
+        threading.Thread(target=reopen_async, daemon=True).start()
+    
+    def update_reopen_progress(self, app_name: str, stage: str):
+        """Show where each app is in its reopen pipeline (called from worker threads)"""
+        self.reopen_progress[app_name] = stage
+        progress = ", ".join(f"{name} {self.REOPEN_STAGES.get(stage, stage)}"
+                             for name, stage in list(self.reopen_progress.items()))
+        self.update_status(f"Reopening: {progress}", "info")
+    
+    def _report_reopen_results(self, results: Dict[str, str]):
+        """Summarize a finished reopen in the status label"""
+        ready = [name for name, stage in results.items() if stage == 'ready']
+        problems = [f"{name} {self.REOPEN_STAGES.get(stage, stage)}"
+                    for name, stage in results.items() if stage != 'ready']
+        status_msg = f"Reopened {len(ready)}/{len(results)} applications"
+        if problems:
+            status_msg += f" ({', '.join(problems)})"
+        self.update_status(status_msg, "warning" if problems else "success")
+        self.root.after(0, self._update_app_icons)
+        self.root.after(0, self._update_ai_selection)
+    
     def _on_close_all(self):
         """Handle close all apps"""
         if messagebox.askyesno("Confirm", "Close all AI application windows?"):
-            try:
-                result = self.callbacks['close_all']()
-                self.update_status(f"Closed {result} applications", "success")
-                self.update_window_count(0)
-                self._clear_app_icons()
-            except Exception as e:
-                self.update_status("Error closing apps", "error")
+            self.update_status("Closing applications", "info")
+            
+            # Closing waits for each window to go (up to close_timeout), so keep it off the Tk thread
+            def close_async():
+                try:
+                    result = self.callbacks['close_all']()
+                    # Windows held open (e.g. by a "Leave site?" prompt) stay tracked
+                    remaining = len(self.callbacks['get_active_apps']())
+                    if remaining:
+                        self.update_status(f"Closed {result} applications, {remaining} still open", "warning")
+                    else:
+                        self.update_status(f"Closed {result} applications", "success")
+                    self.update_window_count(remaining)
+                except Exception as e:
+                    self.logger.error(f"Error closing apps: {e}")
+                    self.update_status("Error closing apps", "error")
+            
+            threading.Thread(target=close_async, daemon=True).start()
     
     def _on_app_click(self, app_name: str):
         """Handle clicking on individual app icon"""
@@ -513,6 +663,9 @@ class CleanGUI:
     
     def _create_ai_selection_checkboxes(self):
         """Create AI selection checkboxes"""
+        # A rebuild keeps what the user ticked; config only seeds apps shown for the first time
+        current = {app_name: var.get() for app_name, var in self.ai_selection_vars.items()}
+        
         # Clear existing checkboxes
         for widget in self.app_selection_frame.winfo_children():
             widget.destroy()
@@ -522,13 +675,14 @@ class CleanGUI:
         for app in self.config['ai_apps']:
             if app.get('enabled', True):
                 app_name = app['name']
-                var = tk.BooleanVar(value=app.get('selected', True))
+                var = tk.BooleanVar(value=current.get(app_name, app.get('selected', True)))
                 self.ai_selection_vars[app_name] = var
                 
                 checkbox = tk.Checkbutton(
                     self.app_selection_frame,
                     text=app_name,
                     variable=var,
+                    command=self._on_selection_changed,
                     font=self.config['gui']['fonts']['small'],
                     bg=self.colors['bg_secondary'],
                     fg=self.colors['fg_primary'],
@@ -543,28 +697,41 @@ class CleanGUI:
         # Clear existing buttons
         self._clear_app_icons()
         
-        for app in apps:
+        for app in self._group_app_windows(apps):
             app_name = app['name']
-            is_minimized = app.get('is_minimized', False)
+            label = f"{app_name} ({app['windows']})" if app['windows'] > 1 else app_name
             
-            # Create button for each app
+            # Create button for each app (a pooled app's windows share one)
             app_btn = self._create_button(
                 self.app_icons_frame,
-                app_name,
+                label,
                 lambda name=app_name: self._on_app_click(name),
                 style='app',
-                width=len(app_name) + 2
+                width=len(label) + 2
             )
             
-            # Visual indicator for minimized state
-            if is_minimized:
-                app_btn.config(bg='#555555', fg='#cccccc')
-            else:
-                app_btn.config(bg='#333333', fg='white')
+            # Right-click recycles just this app
+            app_btn.bind("<Button-3>", lambda e, name=app_name: self._on_app_reopen(name))
+            
+            # Visual indicator for minimized/quarantined state
+            self._apply_app_button_state(app_btn, app)
             
             app_btn.pack(side=tk.LEFT, padx=2)
             self.app_buttons[app_name] = app_btn
     
+    def _group_app_windows(self, apps: List[Dict]) -> List[Dict]:
+        """One entry per app: minimized or quarantined only when all of its windows are"""
+        grouped = {}
+        for app in apps:
+            entry = grouped.get(app['name'])
+            if entry is None:
+                grouped[app['name']] = dict(app, windows=1)
+                continue
+            entry['windows'] += 1
+            entry['is_minimized'] = entry.get('is_minimized', False) and app.get('is_minimized', False)
+            entry['is_quarantined'] = entry.get('is_quarantined', False) and app.get('is_quarantined', False)
+        return list(grouped.values())
+    
     def _clear_app_icons(self):
         """Clear all app icon buttons"""
         for button in self.app_buttons.values():
@@ -592,20 +759,30 @@ class CleanGUI:
             try:
                 apps = self.callbacks['get_active_apps']()
                 
-                for app in apps:
+                for app in self._group_app_windows(apps):
                     app_name = app['name']
-                    is_minimized = app.get('is_minimized', False)
                     
                     if app_name in self.app_buttons:
-                        button = self.app_buttons[app_name]
-                        if is_minimized:
-                            button.config(bg='#555555', fg='#cccccc')
-                        else:
-                            button.config(bg='#333333', fg='white')
+                        self._apply_app_button_state(self.app_buttons[app_name], app)
                             
             except Exception as e:
                 self.logger.error(f"Error updating app button states: {e}")
     
+    def _apply_app_button_state(self, button, app: Dict):
+        """Color an app button by window state"""
+        if app.get('is_quarantined', False):
+            # Not responding: excluded from dispatch and arrangement until it recovers
+            button.config(bg=self.colors['warning_color'], fg='white')
+        elif app.get('is_minimized', False):
+            button.config(bg='#555555', fg='#cccccc')
+        else:
+            button.config(bg='#333333', fg='white')
+    
+    def refresh_app_states(self):
+        """Refresh app button states from any thread"""
+        if self.root:
+            self.root.after(0, self._update_app_buttons_state)
+    
     def update_status(self, message: str, status_type: str = "info"):
         """Update status label"""
         colors = {
@@ -623,15 +800,22 @@ class CleanGUI:
         if self.root:
             self.root.after(0, update)
     
+    def update_resource_status(self, text: str):
+        """Show AI app resource usage in the status bar (called from the governor thread)"""
+        def update():
+            self.resource_label.config(text=text)
+        
+        if self.root and self.resource_label:
+            self.root.after(0, update)
+    
     def update_window_count(self, count: int):
-        """Update window count and app icons"""
+        """Update window count and app icons (the AI selection is left as the user set it)"""
         text = f"{count} AI applications connected" if count > 0 else "No AI apps connected"
         
         def update():
             self.window_count_label.config(text=text)
             if count > 0:
                 self._update_app_icons()
-                self._update_ai_selection()
             else:
                 self._clear_app_icons()
         
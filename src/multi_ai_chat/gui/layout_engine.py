@@ -0,0 +1,166 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Layout Engine
+ pure, memoized window layouts across one or more displays
+"""
+
+import math
+import logging
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from gui.display_topology import Display, DisplayTopology
+
+# (x, y, width, height)
+Rect = Tuple[int, int, int, int]
+
+STRATEGIES = ('grid', 'auto_fit', 'master_stack')
+
+# Cost of one empty cell against the log of a cell's aspect mismatch
+EMPTY_CELL_PENALTY = 0.15
+
+
+@lru_cache(maxsize=256)
+def compute_layout(topology: DisplayTopology, weights: Tuple[float, ...], strategy: str = 'grid',
+                   cols: int = 3, rows: int = 2, padding: int = 10,
+                   master_ratio: float = 0.6, cell_aspect: float = 0.75) -> Tuple[Rect, ...]:
+    """Target rect for each window, in the order the windows are given.
+
+    weights has one entry per window (its layout weight); the result only
+    depends on the topology, the weights and the parameters, so repeated
+    arrangements of the same window set are served from the cache. Every
+    window gets a rect: grids grow extra rows instead of dropping windows.
+    An unknown strategy falls back to grid.
+    """
+    count = len(weights)
+    displays = topology.displays
+    if count == 0 or not displays:
+        return ()
+
+    if strategy == 'auto_fit':
+        return _auto_fit(displays, count, padding, cell_aspect)
+    if strategy == 'master_stack':
+        return _master_stack(displays, weights, padding, master_ratio, cell_aspect)
+    if strategy != 'grid':
+        logging.getLogger(__name__).warning(f"Unknown layout strategy '{strategy}', using grid")
+    return _grid(displays, count, cols, rows, padding)
+
+
+def tile(region: Rect, count: int, cols: int, rows: int, padding: int) -> List[Rect]:
+    """Fill a region row by row with a cols x rows grid of padded cells"""
+    x, y, width, height = region
+    cell_width = (width - (cols + 1) * padding) // cols
+    cell_height = (height - (rows + 1) * padding) // rows
+    rects = []
+    for i in range(count):
+        col = i % cols
+        row = i // cols
+        rects.append((
+            x + padding + col * (cell_width + padding),
+            y + padding + row * (cell_height + padding),
+            cell_width,
+            cell_height
+        ))
+    return rects
+
+
+def fit_grid(count: int, width: int, height: int, cell_aspect: float) -> Tuple[int, int]:
+    """cols x rows for count cells: cells closest to cell_aspect (w/h), few empty cells.
+
+    Only the last row may be partly empty (at most cols - 1 cells), so a
+    window count with no even split still gets a grid instead of one long row.
+    """
+    best = None
+    for cols in range(1, count + 1):
+        rows = math.ceil(count / cols)
+        empty = cols * rows - count
+        aspect = (width / cols) / (height / rows)
+        score = abs(math.log(aspect / cell_aspect)) + EMPTY_CELL_PENALTY * empty
+        if best is None or score < best[0]:
+            best = (score, cols, rows)
+    return best[1], best[2]
+
+
+def _region(display: Display) -> Rect:
+    return display.left, display.top, display.width, display.height
+
+
+def _split_by_area(displays: Tuple[Display, ...], count: int) -> List[int]:
+    """Windows per display in proportion to work area (largest remainder)"""
+    total = sum(d.width * d.height for d in displays)
+    shares = [count * d.width * d.height / total for d in displays]
+    counts = [int(share) for share in shares]
+    by_remainder = sorted(range(len(displays)), key=lambda i: shares[i] - counts[i], reverse=True)
+    for i in by_remainder[:count - sum(counts)]:
+        counts[i] += 1
+    return counts
+
+
+def _grid(displays: Tuple[Display, ...], count: int, cols: int, rows: int, padding: int) -> Tuple[Rect, ...]:
+    # Fill each display's cols x rows grid in order; any overflow adds rows evenly
+    capacity = cols * rows
+    counts = [0] * len(displays)
+    remaining = count
+    for i in range(len(displays)):
+        counts[i] = min(capacity, remaining)
+        remaining -= counts[i]
+    i = 0
+    while remaining:
+        counts[i % len(displays)] += 1
+        remaining -= 1
+        i += 1
+
+    rects: List[Rect] = []
+    for display, n in zip(displays, counts):
+        if n:
+            rects += tile(_region(display), n, cols, max(rows, math.ceil(n / cols)), padding)
+    return tuple(rects)
+
+
+def _auto_fit(displays: Tuple[Display, ...], count: int, padding: int, cell_aspect: float) -> Tuple[Rect, ...]:
+    rects: List[Rect] = []
+    for display, n in zip(displays, _split_by_area(displays, count)):
+        if n:
+            cols, rows = fit_grid(n, display.width, display.height, cell_aspect)
+            rects += tile(_region(display), n, cols, rows, padding)
+    return tuple(rects)
+
+
+def _master_stack(displays: Tuple[Display, ...], weights: Tuple[float, ...], padding: int,
+                  master_ratio: float, cell_aspect: float) -> Tuple[Rect, ...]:
+    # The heaviest window (first on ties) takes the left part of the first display
+    count = len(weights)
+    master = max(range(count), key=lambda i: (weights[i], -i))
+    rects: List[Optional[Rect]] = [None] * count
+
+    first = displays[0]
+    if count == 1:
+        rects[master] = tile(_region(first), 1, 1, 1, padding)[0]
+        return tuple(rects)
+
+    master_width = int(first.width * master_ratio)
+    rects[master] = tile((first.left, first.top, master_width, first.height), 1, 1, 1, padding)[0]
+
+    # The others stack on the right of the first display (heights by weight),
+    # spilling onto further displays when there are more than fit comfortably
+    stack = [i for i in range(count) if i != master]
+    stack_region = (first.left + master_width - padding, first.top, first.width - master_width + padding, first.height)
+    others = displays[1:]
+    max_stack = max(1, int(first.height / (first.width * (1 - master_ratio) / cell_aspect))) if others else len(stack)
+    on_first, spill = stack[:max_stack], stack[max_stack:]
+
+    x, y, width, height = stack_region
+    usable = height - (len(on_first) + 1) * padding
+    total_weight = sum(weights[i] or 1 for i in on_first)
+    top = y + padding
+    for n, i in enumerate(on_first):
+        if n == len(on_first) - 1:
+            cell_height = y + height - padding - top
+        else:
+            cell_height = int(usable * (weights[i] or 1) / total_weight)
+        rects[i] = (x + padding, top, width - 2 * padding, cell_height)
+        top += cell_height + padding
+
+    if spill:
+        for i, rect in zip(spill, _auto_fit(others, len(spill), padding, cell_aspect)):
+            rects[i] = rect
+    return tuple(rects)
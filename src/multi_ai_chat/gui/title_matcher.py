@@ -0,0 +1,79 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Title Matcher
+ maps window titles to AI apps with a keyword table built once from the config
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+
+class TitleMatcher:
+    """Finds which enabled AI apps a window title mentions.
+
+    The keyword table is built once when the config is loaded (lower-cased,
+    de-duplicated, each keyword mapped to every app that uses it), and
+    results are cached per hwnd together with a hash of the title, so
+    windows whose title has not changed are never matched again.
+    """
+
+    def __init__(self, ai_apps: List[Dict], cache_size: int = 4096):
+        self.cache_size = cache_size
+
+        # keyword -> indices of the apps that use it, in config order
+        self.app_names: List[str] = []
+        keyword_apps: Dict[str, List[int]] = {}
+        for app in ai_apps:
+            if not app.get('enabled', True):
+                continue
+            index = len(self.app_names)
+            self.app_names.append(app['name'])
+            for keyword in app.get('keywords', []):
+                keyword = keyword.lower()
+                if keyword:
+                    keyword_apps.setdefault(keyword, []).append(index)
+
+        # For the handful of keywords an app list has, substring search beats a
+        # combined regex (see scripts/benchmark_title_matcher.py)
+        self._keywords: Tuple[Tuple[str, Tuple[int, ...]], ...] = tuple(
+            (keyword, tuple(apps)) for keyword, apps in keyword_apps.items()
+        )
+
+        self._cache: "OrderedDict[int, Tuple[int, Tuple[str, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def candidates(self, title: str) -> Tuple[str, ...]:
+        """Names of every app whose keywords appear in the title, in config order"""
+        if not title:
+            return ()
+        title_lower = title.lower()
+        hits = [apps for keyword, apps in self._keywords if keyword in title_lower]
+        if not hits:
+            return ()
+        indices = sorted({index for apps in hits for index in apps})
+        return tuple(self.app_names[i] for i in indices)
+
+    def match_window(self, hwnd: int, title: str) -> Tuple[str, ...]:
+        """Cached candidates() for a window; re-matched only when its title changes"""
+        title_hash = hash(title)
+        with self._lock:
+            cached = self._cache.get(hwnd)
+            if cached is not None and cached[0] == title_hash:
+                self._cache.move_to_end(hwnd)
+                return cached[1]
+
+        result = self.candidates(title)
+        with self._lock:
+            self._cache[hwnd] = (title_hash, result)
+            self._cache.move_to_end(hwnd)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def forget(self, hwnd: int) -> None:
+        with self._lock:
+            self._cache.pop(hwnd, None)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -3,109 +3,411 @@ Multi-AI Chat Manager v1.0.0 - Window Manager
  window management for AI applications
 """
 
-import os
 import time
+import ctypes
+from ctypes import wintypes
 import win32gui
 import win32con
-import win32api
 import win32process
 import psutil
 import logging
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional, Tuple
+
+from gui.window_registry import WindowRegistry, WinEventSource, EVENT_DESTROY
+from gui.title_matcher import TitleMatcher
+from core.process_cache import ProcessNameCache, SHARED_BROWSER_EXECUTABLES
+from gui.app_launcher import AppLauncher
+from gui.display_topology import Display, DisplayTopology, DisplayTopologyService
+from gui.layout_engine import compute_layout
+
+# Process names accepted for AI windows unless window.validation.executables overrides them
+DEFAULT_EXECUTABLES = frozenset([
+    'chrome.exe', 'firefox.exe', 'edge.exe', 'msedge.exe',
+    'brave.exe', 'electron.exe', 'opera.exe'
+])
 
 class WindowManager:
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, display_service: DisplayTopologyService = None):
         self.config = config
         self.ai_windows = []
         self.window_info = {}
         self.logger = logging.getLogger(__name__)
         
-        # Custom app ordering for grid arrangement
+        # Optional shared WindowHealthMonitor (hung windows are skipped)
+        self.health_monitor = None
+        
+        # Optional ResourceGovernor (hibernated apps are woken before use)
+        self.resource_governor = None
+        
+        # Monitor layout, queried once and refreshed on display changes
+        self.displays = display_service or DisplayTopologyService()
+        
+        # Custom app ordering for grid arrangement (from each app's configured priority)
         self.app_priority = {
-            'Claude': 0,
-            'Google Gemini': 1, 
-            'Perplexity': 2,
-            'Grok': 3,
-            'DeepSeek': 4,
-            'ChatGPT': 5
+            app['name']: app.get('priority', i)
+            for i, app in enumerate(config['ai_apps'])
+        }
+        
+        # Relative size of each app's window in weighted layouts
+        self.app_layout_weight = {
+            app['name']: app.get('layout_weight', 1.0)
+            for app in config['ai_apps']
         }
         
+        # Windows kept open per app (prompt pools); extra instances are launched by fill_pools
+        self.app_pool_size = {
+            app['name']: max(1, app.get('pool_size', 1))
+            for app in config['ai_apps']
+        }
+        
+        # Keyword matching compiled once from the app config
+        self.title_matcher = TitleMatcher(config['ai_apps'])
+        
+        # Executables a window's process may have (per-app lists override the global one)
+        validation_config = config['window'].get('validation', {})
+        configured = validation_config.get('executables')
+        self.valid_executables = frozenset(exe.lower() for exe in configured) if configured else DEFAULT_EXECUTABLES
+        self.app_executables = {
+            app['name']: frozenset(exe.lower() for exe in app['executables'])
+            for app in config['ai_apps']
+            if app.get('executables')
+        }
+        self.process_cache = ProcessNameCache(
+            max_size=validation_config.get('process_cache_size', 256),
+            verify_interval=validation_config.get('verify_interval', 5.0)
+        )
+        
+        # Processes started for each app (pid -> app names); windows are attributed by owner pid first
+        self.launcher = AppLauncher()
+        self.app_pids: Dict[int, set] = {}
+        self._launch_roots: Dict[str, int] = {}
+        # app name -> top-level windows that existed when its launch in progress started
+        self._launching: Dict[str, set] = {}
+        # hwnd -> app name for windows re-attached from a session snapshot
+        self._pinned_windows: Dict[int, str] = {}
+        
+        # AI windows tracked incrementally from window events
+        registry_config = config['window'].get('registry', {})
+        self.use_window_events = registry_config.get('events', True)
+        self.full_scan_interval = registry_config.get('full_scan_interval', 60.0)
+        self.registry = WindowRegistry(self._classify_window, win32gui.GetWindowText)
+        self.registry.on_change = self._on_registry_change
+        self.event_source = None
+        self._scan_stop = threading.Event()
+        self._scan_thread = None
+        
+        # Called (from the event thread) when tracked AI windows appear or disappear
+        self.on_windows_changed = None
+        
+        # Reopen pipelines slot windows into the layout from several threads
+        self._arrange_lock = threading.Lock()
+        
+    def set_health_monitor(self, health_monitor):
+        """Set the window health monitor used to skip hung windows"""
+        self.health_monitor = health_monitor
+    
+    def set_resource_governor(self, resource_governor):
+        """Set the resource governor that hibernates idle apps"""
+        self.resource_governor = resource_governor
+    
+    def _is_quarantined(self, hwnd: int) -> bool:
+        return bool(self.health_monitor and self.health_monitor.is_quarantined(hwnd))
+    
     def detect_displays(self) -> Dict:
-        """Detect displays and return the configured one"""
+        """Return the configured display from the cached topology"""
+        topology = self.displays.snapshot()
+        
+        # Select display based on config
+        preferred = self.config['window']['display']['preferred_display']
+        selected = topology.get(preferred) or topology.displays[0]
+        
+        self.logger.info(f"Using display {selected.index}: {selected.width}x{selected.height}")
+        return selected.to_dict()
+    
+    def launch_apps_parallel(self, apps: List[Dict] = None,
+                             on_app_ready: Callable[[str, int], None] = None) -> Dict:
+        """Launch AI applications concurrently and wait until each shows a new window.
+        
+        An app is ready as soon as a matching window it did not have before is
+        detected (from window events while tracking, otherwise by periodic
+        scans) and is given up on
+        after its launch_timeout. on_app_ready(app_name, hwnd) is called as
+        each app becomes ready, so layout can start before slower apps finish.
+        """
+        if apps is None:
+            apps = [app for app in self.config['ai_apps'] if app.get('enabled', True)]
+        timing = self.config['window']['timing']
+        default_timeout = timing.get('launch_timeout', 20.0)
+        poll_interval = timing.get('launch_poll_interval', 0.25)
+        
+        result = {'launched': [], 'ready': {}, 'timed_out': [], 'failed': [], 'elapsed': 0.0}
+        if not apps:
+            return result
+        
+        self.logger.info(f"Launching {len(apps)} AI applications")
+        start = time.perf_counter()
+        
+        # Windows already open (e.g. when growing a pool) do not count as ready
+        known = {app['name']: set(self.registry.get_app_windows(app['name'])) for app in apps}
+        
+        # Only windows opened after this point can be claimed by a shared browser's pid alone
+        existing = self._top_level_windows()
+        for app in apps:
+            self._launching[app['name']] = existing
+        
+        pool = ThreadPoolExecutor(max_workers=len(apps), thread_name_prefix="AppLaunch")
+        futures = {app['name']: pool.submit(self._launch_app, app) for app in apps}
+        pool.shutdown(wait=False)
+        
+        deadlines = {app['name']: start + app.get('launch_timeout', default_timeout) for app in apps}
         try:
-            monitors = win32api.EnumDisplayMonitors()
-            displays = []
-            
-            for i, monitor in enumerate(monitors):
-                monitor_info = win32api.GetMonitorInfo(monitor[0])
-                work_area = monitor_info['Work']
+            while deadlines:
+                # Launchers often hand off to a child process that owns the window
+                self._capture_process_trees(deadlines)
+                if not self.is_tracking:
+                    self.get_ai_windows_fast()
                 
-                display_info = {
-                    'index': i + 1,
-                    'left': work_area[0],
-                    'top': work_area[1],
-                    'right': work_area[2],
-                    'bottom': work_area[3],
-                    'width': work_area[2] - work_area[0],
-                    'height': work_area[3] - work_area[1],
-                    'is_primary': monitor_info.get('Flags', 0) & 1 == 1
-                }
-                displays.append(display_info)
-            
-            # Select display based on config
-            preferred = self.config['window']['display']['preferred_display']
-            if 1 <= preferred <= len(displays):
-                selected = displays[preferred - 1]
-            else:
-                selected = displays[0] if displays else {
-                    'left': 0, 'top': 0, 'width': 1920, 'height': 1080
-                }
-            
-            self.logger.info(f"Using display {selected.get('index', 1)}: {selected['width']}x{selected['height']}")
-            return selected
-            
+                now = time.perf_counter()
+                for app_name, deadline in list(deadlines.items()):
+                    future = futures[app_name]
+                    if future.done() and not future.result():
+                        result['failed'].append(app_name)
+                        del deadlines[app_name]
+                        self._launching.pop(app_name, None)
+                        continue
+                
+                    hwnd = next((h for h in self.registry.get_app_windows(app_name) if h not in known[app_name]), None)
+                    if hwnd is not None:
+                        result['ready'][app_name] = hwnd
+                        del deadlines[app_name]
+                        self._launching.pop(app_name, None)
+                        self.logger.info(f"{app_name} ready after {now - start:.2f}s")
+                        if on_app_ready:
+                            try:
+                                on_app_ready(app_name, hwnd)
+                            except Exception as e:
+                                self.logger.error(f"Error handling {app_name} ready: {e}")
+                    elif now >= deadline:
+                        result['timed_out'].append(app_name)
+                        del deadlines[app_name]
+                        self._launching.pop(app_name, None)
+                        self.logger.warning(f"{app_name} did not show a window within its launch timeout")
+                
+                if deadlines:
+                    time.sleep(poll_interval)
+        finally:
+            for app in apps:
+                self._launching.pop(app['name'], None)
+        
+        result['launched'] = [name for name, future in futures.items() if future.done() and future.result()]
+        result['elapsed'] = time.perf_counter() - start
+        self.logger.info(f"Launched {len(result['launched'])}/{len(apps)} applications, "
+                         f"{len(result['ready'])} ready in {result['elapsed']:.2f}s")
+        return result
+    
+    def _top_level_windows(self) -> set:
+        hwnds = set()
+        try:
+            win32gui.EnumWindows(lambda hwnd, _: hwnds.add(hwnd) or True, None)
         except Exception as e:
-            self.logger.error(f"Display detection error: {e}")
-            return {'left': 0, 'top': 0, 'width': 1920, 'height': 1080}
+            self.logger.debug(f"Could not list top-level windows: {e}")
+        return hwnds
     
-    def launch_apps_parallel(self) -> None:
-        """Launch all AI applications"""
-        enabled_apps = [app for app in self.config['ai_apps'] if app.get('enabled', True)]
-        launch_delay = self.config['window']['timing']['launch_delay']
+    def reopen_apps(self, app_names: List[str] = None,
+                    on_progress: Callable[[str, str], None] = None,
+                    on_app_ready: Callable[[str, int], None] = None) -> Dict[str, str]:
+        """Recycle apps concurrently, each through its own close -> relaunch pipeline.
         
-        self.logger.info(f"Launching {len(enabled_apps)} AI applications")
+        Defaults to every enabled app. Returns each app's final stage (see
+        reopen_app); an app stuck closing or launching does not hold up the rest.
+        """
+        if app_names is None:
+            app_names = [app['name'] for app in self.config['ai_apps'] if app.get('enabled', True)]
+        if not app_names:
+            return {}
         
-        launched_count = 0
-        for app in enabled_apps:
-            try:
-                shortcut_path = app['shortcut']
-                if os.path.exists(shortcut_path):
-                    self.logger.info(f"Launching {app['name']}")
-                    os.startfile(shortcut_path)
-                    launched_count += 1
-                    time.sleep(launch_delay)
-                else:
-                    self.logger.warning(f"Shortcut not found: {shortcut_path}")
-            except Exception as e:
-                self.logger.error(f"Error launching {app['name']}: {e}")
+        with ThreadPoolExecutor(max_workers=len(app_names), thread_name_prefix="AppReopen") as pool:
+            futures = {
+                app_name: pool.submit(self.reopen_app, app_name, on_progress, on_app_ready)
+                for app_name in app_names
+            }
+        results = {app_name: future.result() for app_name, future in futures.items()}
         
-        self.logger.info(f"Launched {launched_count}/{len(enabled_apps)} applications")
+        ready = sum(1 for stage in results.values() if stage == 'ready')
+        self.logger.info(f"Reopened {ready}/{len(results)} applications")
+        return results
+    
+    def reopen_app(self, app_name: str,
+                   on_progress: Callable[[str, str], None] = None,
+                   on_app_ready: Callable[[str, int], None] = None) -> str:
+        """Close one app's windows, wait until they are gone, relaunch it and wait for its window.
+        
+        on_progress(app_name, stage) is called as the app moves through
+        'closing' and 'launching'; the returned final stage is one of 'ready',
+        'close_timeout' (a window would not close, so nothing was relaunched),
+        'timed_out' or 'failed'. Other apps' windows are left alone.
+        """
+        def report(stage: str) -> str:
+            if on_progress:
+                try:
+                    on_progress(app_name, stage)
+                except Exception as e:
+                    self.logger.debug(f"Reopen progress handler failed: {e}")
+            return stage
+        
+        app = next((app for app in self.config['ai_apps'] if app['name'] == app_name), None)
+        if app is None:
+            self.logger.warning(f"Cannot reopen unknown app: {app_name}")
+            return report('failed')
+        
+        report('closing')
+        hwnds = self.registry.get_app_windows(app_name)
+        for hwnd in hwnds:
+            self._show_in_taskbar(hwnd, app_name)
+        results = self.bulk_window_state(hwnds, 'close')
+        
+        still_open = False
+        for hwnd, status in results.items():
+            if status in ('done', 'missing'):
+                self.registry.remove(hwnd)
+                self._pinned_windows.pop(hwnd, None)
+            else:
+                still_open = True
+        self._sync_from_registry()
+        if still_open:
+            # Relaunching now would leave the app with two windows
+            self.logger.warning(f"{app_name} still has open windows, not relaunching")
+            return report('close_timeout')
         
-        # Wait for apps to load
-        load_wait = self.config['window']['timing']['load_wait']
-        self.logger.info(f"Waiting {load_wait}s for applications to load")
-        time.sleep(load_wait)
+        report('launching')
+        launch = self.launch_apps_parallel([app], on_app_ready=on_app_ready)
+        if app_name in launch['ready']:
+            self.fill_pools([app_name], on_app_ready)
+            return report('ready')
+        if app_name in launch['timed_out']:
+            return report('timed_out')
+        return report('failed')
     
-    def get_ai_windows_fast(self) -> List[int]:
-        """Detect AI application windows - includes minimized windows"""
-        windows = []
-        self.window_info.clear()
+    def fill_pools(self, app_names: List[str] = None,
+                   on_app_ready: Callable[[str, int], None] = None) -> int:
+        """Launch extra instances of running apps until each has pool_size windows.
         
-        # Build keyword mapping
-        app_keyword_map = {}
-        for app in self.config['ai_apps']:
-            if app.get('enabled', True):
-                app_keyword_map[app['name']] = [kw.lower() for kw in app['keywords']]
+        An app stops growing once a launch brings no new window (e.g. a
+        single-instance app that only focuses its existing window).
+        Returns the number of windows added.
+        """
+        apps = [
+            app for app in self.config['ai_apps']
+            if app.get('enabled', True) and self.app_pool_size[app['name']] > 1
+            and (app_names is None or app['name'] in app_names)
+        ]
+        added = 0
+        while apps:
+            short = [
+                app for app in apps
+                if 0 < len(self.registry.get_app_windows(app['name'])) < self.app_pool_size[app['name']]
+            ]
+            if not short:
+                break
+            result = self.launch_apps_parallel(short, on_app_ready=on_app_ready)
+            added += len(result['ready'])
+            apps = [app for app in short if app['name'] in result['ready']]
+        
+        if added:
+            self.logger.info(f"Added {added} pool windows")
+        return added
+    
+    def _launch_app(self, app: Dict) -> bool:
+        """Start one app from its shortcut; runs on a launch worker thread"""
+        try:
+            launched, pid = self.launcher.launch(app)
+            if pid is not None:
+                self._launch_roots[app['name']] = pid
+                self._register_app_pids(app['name'], {pid})
+            return launched
+        except Exception as e:
+            self.logger.error(f"Error launching {app['name']}: {e}")
+            return False
+    
+    def _register_app_pids(self, app_name: str, pids) -> None:
+        for pid in pids:
+            self.app_pids.setdefault(pid, set()).add(app_name)
+    
+    def _capture_process_trees(self, app_names) -> None:
+        """Record the descendants of each launched app's process"""
+        for app_name in list(app_names):
+            root = self._launch_roots.get(app_name)
+            if root is not None:
+                self._register_app_pids(app_name, self.launcher.process_tree(root))
+    
+    def attach_from_snapshot(self, snapshot_apps: Dict[str, List[Dict]]) -> List[str]:
+        """Re-attach to the windows recorded in a session snapshot.
+        
+        Only the recorded windows themselves are re-attached: a window that
+        still exists and is still owned by the same process (same pid and
+        create time) is pinned to its app. The process is not attributed to
+        the app, since it may be a browser that also hosts the user's own
+        windows. Returns the enabled apps that have a window afterwards.
+        """
+        enabled = {app['name'] for app in self.config['ai_apps'] if app.get('enabled', True)}
+        attached = 0
+        for app_name, signatures in snapshot_apps.items():
+            if app_name not in enabled:
+                continue
+            for signature in signatures:
+                pid = signature.get('pid')
+                hwnd = signature.get('hwnd')
+                if pid is None or not hwnd:
+                    continue
+                try:
+                    if psutil.Process(pid).create_time() != signature.get('create_time'):
+                        continue
+                    if not win32gui.IsWindow(hwnd) or win32process.GetWindowThreadProcessId(hwnd)[1] != pid:
+                        continue
+                except Exception:
+                    continue
+                self._pinned_windows[hwnd] = app_name
+                attached += 1
+        
+        self.get_ai_windows_fast()
+        present = sorted({info['app_name'] for info in self.window_info.values()} & enabled)
+        self.logger.info(f"Warm start: re-attached {attached} windows, {len(present)} apps already running")
+        return present
+    
+    def get_session_signatures(self) -> Dict[str, List[Dict]]:
+        """Per-app window signatures for the session snapshot"""
+        signatures: Dict[str, List[Dict]] = {}
+        for hwnd, info in self.registry.snapshot().items():
+            try:
+                _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                create_time = psutil.Process(pid).create_time()
+            except Exception:
+                continue
+            signatures.setdefault(info['app_name'], []).append({
+                'hwnd': hwnd,
+                'pid': pid,
+                'create_time': create_time,
+                'exe': self.process_cache.get_name(pid),
+                'title': info.get('title', '')
+            })
+        return signatures
+    
+    def _prune_app_pids(self) -> None:
+        """Forget processes that have exited (their pids may be reused)"""
+        for pid in list(self.app_pids):
+            if not psutil.pid_exists(pid):
+                self.app_pids.pop(pid, None)
+        for hwnd in list(self._pinned_windows):
+            if not win32gui.IsWindow(hwnd):
+                self._pinned_windows.pop(hwnd, None)
+    
+    def get_ai_windows_fast(self) -> List[int]:
+        """Detect AI application windows with a full desktop scan - includes minimized windows"""
+        found = {}
+        self.process_cache.prune()
+        self._prune_app_pids()
         
         def enum_windows_proc(hwnd, lParam):
             try:
@@ -114,24 +416,13 @@ class WindowManager:
                 if not window_title:
                     return True
                 
-                title_lower = window_title.lower()
-                
-                for app_name, keywords in app_keyword_map.items():
-                    for keyword in keywords:
-                        if keyword in title_lower:
-                            if self._is_valid_ai_window(hwnd, window_title):
-                                windows.append(hwnd)
-                                self.window_info[hwnd] = {
-                                    'title': window_title,
-                                    'app_name': app_name,
-                                    'hwnd': hwnd,
-                                    'priority': self.app_priority.get(app_name, 999)
-                                }
-                                self.logger.debug(f"Found {app_name}: {window_title}")
-                                
-                                # Hide from taskbar after detection
-                                self._hide_from_taskbar(hwnd, app_name)
-                            return True
+                info = self._classify_window(hwnd, window_title)
+                if info:
+                    found[hwnd] = info
+                    self.logger.debug(f"Found {info['app_name']}: {window_title}")
+                    
+                    # Hide from taskbar after detection
+                    self._hide_from_taskbar(hwnd, info['app_name'])
                         
             except Exception as e:
                 self.logger.debug(f"Window enumeration error: {e}")
@@ -140,11 +431,179 @@ class WindowManager:
         
         win32gui.EnumWindows(enum_windows_proc, None)
         
-        self.ai_windows = windows
+        self.registry.replace_all(found)
+        self._sync_from_registry()
         self.logger.info(f"Detected {len(self.ai_windows)} AI application windows")
         
         return self.ai_windows
     
+    def _classify_window(self, hwnd: int, window_title: str) -> Optional[Dict]:
+        """Window info if the window belongs to an enabled AI app, else None.
+        
+        A window re-attached from the session snapshot keeps its app. A main
+        window of a process started for exactly one app belongs to that app
+        even when its title names no app (e.g. a renamed conversation);
+        otherwise the title keywords decide, among the apps sharing the
+        process when it is known.
+        """
+        pinned = self._pinned_windows.get(hwnd)
+        if pinned is not None and self._is_main_window(hwnd):
+            return self._window_entry(hwnd, window_title, pinned)
+        
+        candidates = self.title_matcher.match_window(hwnd, window_title)
+        owners = self._window_owners(hwnd)
+        
+        if owners and self._is_main_window(hwnd):
+            # Title changed away from every keyword: keep the app it was attributed to
+            known = self.registry.get(hwnd)
+            known_app = known['app_name'] if known else None
+            if not candidates and known_app in owners:
+                return self._window_entry(hwnd, window_title, known_app)
+            
+            if len(owners) == 1:
+                owner = next(iter(owners))
+                # A title naming another app wins (a browser reused by a later launch owns
+                # that app's windows too). Without any keyword the process alone decides
+                # only when it is the app's own: a shared browser also hosts the user's
+                # windows, so there only a window opened while the app was launching counts
+                if owner in candidates:
+                    return self._window_entry(hwnd, window_title, owner)
+                if not candidates and self._has_pool_room(owner, hwnd) and \
+                        (not self._is_shared_browser(hwnd) or self._opened_by_launch(owner, hwnd)):
+                    return self._window_entry(hwnd, window_title, owner)
+            else:
+                candidates = [app_name for app_name in candidates if app_name in owners] or candidates
+        
+        # A rejected candidate falls through to the next app whose keywords match
+        for app_name in candidates:
+            if self._is_valid_ai_window(hwnd, window_title, app_name):
+                return self._window_entry(hwnd, window_title, app_name)
+        return None
+    
+    def _is_shared_browser(self, hwnd: int) -> bool:
+        pid = self._window_pid(hwnd)
+        name = self.process_cache.get_name(pid) if pid is not None else None
+        # A process that cannot be read is treated as shared
+        return name is None or name in SHARED_BROWSER_EXECUTABLES
+    
+    def _opened_by_launch(self, app_name: str, hwnd: int) -> bool:
+        existing = self._launching.get(app_name)
+        return existing is not None and hwnd not in existing
+    
+    def _has_pool_room(self, app_name: str, hwnd: int) -> bool:
+        windows = self.registry.get_app_windows(app_name)
+        return hwnd in windows or len(windows) < self.app_pool_size.get(app_name, 1)
+    
+    def _window_entry(self, hwnd: int, window_title: str, app_name: str) -> Dict:
+        return {
+            'title': window_title,
+            'app_name': app_name,
+            'hwnd': hwnd,
+            'priority': self.app_priority.get(app_name, 999)
+        }
+    
+    def _window_owners(self, hwnd: int) -> Optional[set]:
+        """Apps whose launched processes own the window, if any"""
+        if not self.app_pids:
+            return None
+        pid = self._window_pid(hwnd)
+        return self.app_pids.get(pid) if pid is not None else None
+    
+    def _window_pid(self, hwnd: int) -> Optional[int]:
+        try:
+            return win32process.GetWindowThreadProcessId(hwnd)[1]
+        except Exception:
+            return None
+    
+    def _is_main_window(self, hwnd: int) -> bool:
+        """Visible, unowned top-level window (not an IME or helper window)"""
+        try:
+            return bool(win32gui.IsWindowVisible(hwnd)) and not win32gui.GetWindow(hwnd, win32con.GW_OWNER)
+        except Exception:
+            return False
+    
+    def _sync_from_registry(self) -> None:
+        """Publish the registry contents as ai_windows / window_info"""
+        snapshot = self.registry.snapshot()
+        self.window_info = snapshot
+        self.ai_windows = list(snapshot)
+    
+    def _on_registry_change(self, event: str, hwnd: int, info: Optional[Dict]) -> None:
+        if info:
+            self._hide_from_taskbar(hwnd, info['app_name'])
+            self.logger.info(f"Tracked new {info['app_name']} window")
+        elif event == EVENT_DESTROY:
+            self.title_matcher.forget(hwnd)
+            # The handle may be reused by an unrelated window
+            self._pinned_windows.pop(hwnd, None)
+            if self.health_monitor:
+                self.health_monitor.forget(hwnd)
+        
+        self._sync_from_registry()
+        if self.on_windows_changed:
+            try:
+                self.on_windows_changed()
+            except Exception as e:
+                self.logger.debug(f"Window change callback failed: {e}")
+    
+    @property
+    def is_tracking(self) -> bool:
+        return self.event_source is not None
+    
+    def start_tracking(self, event_source=None) -> bool:
+        """Follow AI windows through window events instead of rescanning.
+        
+        Runs one full scan to seed the registry, then applies create, destroy
+        and title-change events as they arrive; a background full scan every
+        ``full_scan_interval`` seconds corrects anything the events missed.
+        """
+        if self.is_tracking:
+            return True
+        if event_source is None and not self.use_window_events:
+            return False
+        
+        try:
+            source = event_source or WinEventSource()
+            source.start(self.registry.handle_event)
+            self.event_source = source
+        except Exception as e:
+            self.logger.error(f"Could not start window event tracking, using full scans: {e}")
+            return False
+        
+        self.get_ai_windows_fast()
+        
+        if self.full_scan_interval and self.full_scan_interval > 0:
+            self._scan_stop.clear()
+            self._scan_thread = threading.Thread(target=self._full_scan_loop, name="WindowFullScan", daemon=True)
+            self._scan_thread.start()
+        
+        self.logger.info("Window event tracking started")
+        return True
+    
+    def stop_tracking(self) -> None:
+        self._scan_stop.set()
+        if self._scan_thread:
+            self._scan_thread.join(timeout=1.0)
+            self._scan_thread = None
+        if self.event_source:
+            try:
+                self.event_source.stop()
+            except Exception as e:
+                self.logger.debug(f"Error stopping window event source: {e}")
+            self.event_source = None
+    
+    def _full_scan_loop(self) -> None:
+        while not self._scan_stop.wait(self.full_scan_interval):
+            try:
+                before = set(self.ai_windows)
+                self.get_ai_windows_fast()
+                if set(self.ai_windows) != before:
+                    self.logger.info("Full scan corrected the window registry")
+                    if self.on_windows_changed:
+                        self.on_windows_changed()
+            except Exception as e:
+                self.logger.debug(f"Full window scan failed: {e}")
+    
     def _hide_from_taskbar(self, hwnd: int, app_name: str) -> None:
         """Hide window from taskbar"""
         try:
@@ -171,7 +630,7 @@ class WindowManager:
         except Exception as e:
             self.logger.debug(f"Could not restore {app_name} to taskbar: {e}")
     
-    def _is_valid_ai_window(self, hwnd: int, title: str) -> bool:
+    def _is_valid_ai_window(self, hwnd: int, title: str, app_name: str = None) -> bool:
         """Validate if window is a real AI application"""
         try:
             # Check if window exists
@@ -181,15 +640,11 @@ class WindowManager:
             # Check if it's a browser/electron app
             try:
                 _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                process = psutil.Process(pid)
-                exe_name = process.name().lower()
-                
-                valid_executables = [
-                    'chrome.exe', 'firefox.exe', 'edge.exe', 'msedge.exe',
-                    'brave.exe', 'electron.exe', 'opera.exe'
-                ]
+                exe_name = self.process_cache.get_name(pid)
+                if exe_name is None:
+                    return True
                 
-                return any(exe in exe_name for exe in valid_executables)
+                return exe_name in self.app_executables.get(app_name, self.valid_executables)
             except:
                 return True
                 
@@ -204,14 +659,28 @@ class WindowManager:
         except:
             return False
     
-    def arrange_windows_grid(self, display: Dict) -> None:
-        """Arrange windows in custom ordered grid"""
+    def arrange_windows_grid(self, display: Dict = None, reserve_for: List[str] = None) -> Dict:
+        """Arrange windows with the configured layout, touching only windows out of place.
+        
+        display overrides the target when the layout uses a single display;
+        reserve_for names apps that are still starting: their slots are kept
+        free so windows that are already up do not move when they arrive.
+        """
+        with self._arrange_lock:
+            return self._arrange_windows_grid(display, reserve_for)
+    
+    def _arrange_windows_grid(self, display: Dict = None, reserve_for: List[str] = None) -> Dict:
+        result = {'total': 0, 'moved': 0, 'skipped': 0, 'failed': 0}
         if not self.ai_windows:
             self.logger.warning("No windows to arrange")
-            return
+            return result
         
         grid_cols = self.config['window']['grid']['cols']
         grid_rows = self.config['window']['grid']['rows']
+        layout_config = self.config['window'].get('layout', {})
+        strategy = layout_config.get('strategy', 'grid')
+        padding = layout_config.get('padding', 10)
+        topology = self._layout_topology(display)
         
         # Sort windows by priority for custom ordering
         sorted_windows = sorted(
@@ -219,55 +688,194 @@ class WindowManager:
             key=lambda hwnd: self.window_info.get(hwnd, {}).get('priority', 999)
         )
         
-        # Calculate window dimensions with padding
-        padding = 10
-        window_width = (display['width'] - (grid_cols + 1) * padding) // grid_cols
-        window_height = (display['height'] - (grid_rows + 1) * padding) // grid_rows
+        # Moving a hung window blocks until its UI thread answers, so leave those out
+        if self.health_monitor:
+            sorted_windows, quarantined = self.health_monitor.filter_responsive(sorted_windows)
+            for hwnd in quarantined:
+                app_name = self.window_info.get(hwnd, {}).get('app_name', 'Unknown')
+                self.logger.warning(f"Skipping {app_name}: window not responding")
         
-        self.logger.info(f"Arranging {len(sorted_windows)} windows in {grid_cols}x{grid_rows} grid")
-        self.logger.info(f"Display: {display['width']}x{display['height']} at ({display['left']}, {display['top']})")
-        self.logger.info(f"Window size: {window_width}x{window_height} with {padding}px padding")
+        # Placeholder slots (hwnd None) for apps that have no window yet
+        slots = []
+        for hwnd in sorted_windows:
+            window_info = self.window_info.get(hwnd, {})
+            slots.append((window_info.get('priority', 999), hwnd, window_info.get('app_name', 'Unknown')))
+        if reserve_for:
+            present = {app_name for _, _, app_name in slots}
+            slots += [(self.app_priority.get(app_name, 999), None, app_name)
+                      for app_name in reserve_for if app_name not in present]
+            slots.sort(key=lambda slot: slot[0])
         
-        arranged_count = 0
-        for i, hwnd in enumerate(sorted_windows):
-            if i >= grid_cols * grid_rows:
-                self.logger.warning(f"Too many windows ({len(sorted_windows)}) for {grid_cols}x{grid_rows} grid")
-                break
-                
+        weights = tuple(self.app_layout_weight.get(app_name, 1.0) for _, _, app_name in slots)
+        rects = compute_layout(
+            topology, weights, strategy, grid_cols, grid_rows, padding,
+            layout_config.get('master_ratio', 0.6), layout_config.get('cell_aspect', 0.75)
+        )
+        
+        self.logger.info(f"Arranging {len(sorted_windows)} windows with {strategy} layout "
+                         f"on {len(topology.displays)} display(s)")
+        
+        targets = []
+        for (priority, hwnd, app_name), rect in zip(slots, rects):
+            if hwnd is None:
+                continue
+            
+            if self._is_in_place(hwnd, rect):
+                self.logger.debug(f"{app_name} already in place at {rect}")
+                result['skipped'] += 1
+                continue
+            
+            self.logger.info(f"Moving {app_name} (priority {priority}) to ({rect[0]}, {rect[1]}) size {rect[2]}x{rect[3]}")
+            targets.append((hwnd, app_name, rect))
+        
+        result['total'] = len(targets) + result['skipped']
+        if not targets:
+            self.logger.info(f"All {result['skipped']} windows already in place")
+            return result
+        
+        # Apply every rect in one transaction, then fall back per window for any that missed
+        # Windows that closed meanwhile are in neither list and count as failed
+        positioned, retry = self._arrange_batch(targets)
+        arranged_count = len(positioned)
+        
+        for hwnd, app_name, (x, y, width, height) in retry:
             try:
-                # Calculate grid position
-                col = i % grid_cols
-                row = i // grid_cols
-                
-                # Calculate window position with padding
-                x = display['left'] + padding + (col * (window_width + padding))
-                y = display['top'] + padding + (row * (window_height + padding))
-                
-                # Get window info for logging
-                window_info = self.window_info.get(hwnd, {})
-                app_name = window_info.get('app_name', 'Unknown')
-                priority = window_info.get('priority', 999)
-                
-                self.logger.info(f"Moving {app_name} (priority {priority}) to grid position [{row},{col}] at ({x}, {y})")
-                
-                # Use improved window arrangement method
-                if self._arrange_single_window_improved(hwnd, x, y, window_width, window_height, app_name):
+                self.logger.info(f"Batch move missed {app_name}, retrying individually")
+                if self._arrange_single_window_improved(hwnd, x, y, width, height, app_name):
                     arranged_count += 1
                     self.logger.info(f"Successfully arranged {app_name}")
                 else:
                     self.logger.warning(f"Failed to arrange {app_name}")
-                
-                # Small delay between operations
-                time.sleep(0.2)
-                
             except Exception as e:
-                self.logger.error(f"Error arranging window {i} ({app_name}): {e}")
+                self.logger.error(f"Error arranging window ({app_name}): {e}")
         
-        self.logger.info(f"Successfully arranged {arranged_count}/{len(sorted_windows)} windows in grid")
+        result['moved'] = arranged_count
+        result['failed'] = len(targets) - arranged_count
+        self.logger.info(f"Arranged grid: {result['moved']} moved, {result['skipped']} already in place, "
+                         f"{result['failed']} failed")
         
-        # Verification step
-        time.sleep(0.5)
         self._verify_arrangement()
+        return result
+    
+    def _layout_topology(self, display: Dict = None) -> DisplayTopology:
+        """Displays the layout spreads over (window.layout.displays)"""
+        selection = self.config['window'].get('layout', {}).get('displays', 'preferred')
+        topology = self.displays.snapshot()
+        
+        if selection == 'all':
+            return topology
+        if isinstance(selection, list):
+            chosen = tuple(d for d in (topology.get(index) for index in selection) if d)
+            if chosen:
+                return DisplayTopology(chosen)
+            self.logger.warning(f"Configured layout displays {selection} not found, using preferred display")
+        
+        if display:
+            return DisplayTopology((Display(
+                display.get('index', 1), display['left'], display['top'], display['width'], display['height']
+            ),))
+        preferred = self.config['window']['display']['preferred_display']
+        return DisplayTopology((topology.get(preferred) or topology.displays[0],))
+    
+    def _is_in_place(self, hwnd: int, rect: tuple) -> bool:
+        """True if the window is shown in its normal state at exactly the target rect"""
+        try:
+            if not win32gui.IsWindowVisible(hwnd) or win32gui.IsIconic(hwnd) or self._is_window_maximized(hwnd):
+                return False
+            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+            x, y, width, height = rect
+            return (left, top, right - left, bottom - top) == (x, y, width, height)
+        except Exception:
+            return False
+    
+    def _arrange_batch(self, targets: List) -> Tuple[List, List]:
+        """Move all windows in one DeferWindowPos transaction.
+
+        Returns the targets verified in place and the live ones to retry
+        individually; targets whose window no longer exists are in neither.
+        """
+        if not targets:
+            return [], []
+        
+        alive = [target for target in targets if win32gui.IsWindow(target[0])]
+        for hwnd, app_name, _ in targets:
+            if not win32gui.IsWindow(hwnd):
+                self.logger.warning(f"Window {app_name} no longer exists")
+        
+        # Minimized or maximized windows keep their normal rect aside, so restore them first
+        self._normalize_window_states([target[0] for target in alive])
+        
+        try:
+            user32 = self._defer_window_pos_api()
+            hdwp = user32.BeginDeferWindowPos(len(alive))
+            for hwnd, _, (x, y, width, height) in alive:
+                if not hdwp:
+                    raise ctypes.WinError()
+                hdwp = user32.DeferWindowPos(
+                    hdwp, hwnd, win32con.HWND_TOP, x, y, width, height,
+                    win32con.SWP_SHOWWINDOW | win32con.SWP_NOACTIVATE
+                )
+            if not hdwp or not user32.EndDeferWindowPos(hdwp):
+                raise ctypes.WinError()
+        except Exception as e:
+            # A failed DeferWindowPos discards the whole transaction
+            self.logger.warning(f"Batched arrangement failed, arranging windows individually: {e}")
+            return [], alive
+        
+        # Verify all rects in one pass
+        positioned, failed = [], []
+        for target in alive:
+            hwnd, app_name, (x, y, _, _) = target
+            try:
+                rect = win32gui.GetWindowRect(hwnd)
+                if abs(rect[0] - x) <= 50 and abs(rect[1] - y) <= 50:
+                    self.logger.debug(f"{app_name} positioned by batch")
+                    positioned.append(target)
+                    continue
+                self.logger.debug(f"{app_name} batch position mismatch: expected ({x},{y}), got ({rect[0]},{rect[1]})")
+            except Exception as e:
+                self.logger.debug(f"Could not verify {app_name}: {e}")
+            failed.append(target)
+        return positioned, failed
+    
+    @staticmethod
+    def _defer_window_pos_api():
+        """user32 with DeferWindowPos signatures set (HDWP is pointer sized)"""
+        user32 = ctypes.windll.user32
+        user32.BeginDeferWindowPos.restype = wintypes.HANDLE
+        user32.BeginDeferWindowPos.argtypes = [ctypes.c_int]
+        user32.DeferWindowPos.restype = wintypes.HANDLE
+        user32.DeferWindowPos.argtypes = [
+            wintypes.HANDLE, wintypes.HWND, wintypes.HWND,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT
+        ]
+        user32.EndDeferWindowPos.restype = wintypes.BOOL
+        user32.EndDeferWindowPos.argtypes = [wintypes.HANDLE]
+        return user32
+    
+    def _normalize_window_states(self, hwnds: List[int]) -> None:
+        """Show and restore windows that are hidden, minimized or maximized, then wait once"""
+        pending = []
+        for hwnd in hwnds:
+            try:
+                if not win32gui.IsWindowVisible(hwnd):
+                    win32gui.ShowWindow(hwnd, win32con.SW_SHOWNOACTIVATE)
+                if win32gui.IsIconic(hwnd) or self._is_window_maximized(hwnd):
+                    win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+                    pending.append(hwnd)
+            except Exception as e:
+                self.logger.debug(f"Error normalizing window state: {e}")
+        
+        if not pending:
+            return
+        
+        timing = self.config['window'].get('timing', {})
+        deadline = time.perf_counter() + timing.get('restore_timeout', 1.0)
+        poll_interval = timing.get('poll_interval', 0.01)
+        while time.perf_counter() < deadline:
+            if not any(win32gui.IsIconic(hwnd) or self._is_window_maximized(hwnd) for hwnd in pending):
+                break
+            time.sleep(poll_interval)
     
     def _arrange_single_window_improved(self, hwnd: int, x: int, y: int, width: int, height: int, app_name: str) -> bool:
         """Improved single window arrangement with better error handling"""
@@ -395,65 +1003,111 @@ class WindowManager:
     
     def bring_window_to_front(self, app_name: str) -> bool:
         """Bring specific AI app window to front"""
-        for hwnd in self.ai_windows:
-            window_info = self.window_info.get(hwnd, {})
-            if window_info.get('app_name') == app_name:
-                try:
-                    # First ensure window is not minimized
-                    if win32gui.IsIconic(hwnd):
-                        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                        time.sleep(0.2)
-                    
-                    # Show window
-                    win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
-                    time.sleep(0.1)
-                    
-                    # Bring to front
-                    win32gui.SetForegroundWindow(hwnd)
-                    win32gui.BringWindowToTop(hwnd)
-                    
-                    self.logger.info(f"Brought {app_name} to front")
-                    return True
-                    
-                except Exception as e:
-                    self.logger.error(f"Error bringing {app_name} to front: {e}")
-                    return False
+        hwnd = self.registry.first_window(app_name)
+        if hwnd is None:
+            self.logger.warning(f"Window for {app_name} not found")
+            return False
         
-        self.logger.warning(f"Window for {app_name} not found")
-        return False
+        if self.health_monitor and not self.health_monitor.is_responsive(hwnd):
+            self.logger.warning(f"{app_name} is not responding, not bringing to front")
+            return False
+        
+        if self.resource_governor:
+            self.resource_governor.wake([hwnd])
+        
+        try:
+            # First ensure window is not minimized
+            if win32gui.IsIconic(hwnd):
+                win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+                time.sleep(0.2)
+            
+            # Show window
+            win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
+            time.sleep(0.1)
+            
+            # Bring to front
+            win32gui.SetForegroundWindow(hwnd)
+            win32gui.BringWindowToTop(hwnd)
+            
+            self.logger.info(f"Brought {app_name} to front")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error bringing {app_name} to front: {e}")
+            return False
     
-    def minimize_all_windows(self) -> int:
-        """Minimize all AI application windows"""
-        minimized_count = 0
+    def bulk_window_state(self, hwnds: List[int], action: str) -> Dict[int, str]:
+        """Minimize, restore or close many windows at once.
         
-        for hwnd in self.ai_windows:
+        Every state change is issued asynchronously in one pass, then a single
+        wait covers all of them. Returns each window's result: 'done',
+        'unchanged' (already in that state), 'timeout', 'missing' or 'error'.
+        """
+        user32 = ctypes.windll.user32
+        timing = self.config['window'].get('timing', {})
+        actions = {
+            'minimize': (lambda hwnd: user32.ShowWindowAsync(hwnd, win32con.SW_MINIMIZE),
+                         lambda hwnd: win32gui.IsIconic(hwnd),
+                         timing.get('restore_timeout', 1.0)),
+            'restore': (lambda hwnd: user32.ShowWindowAsync(hwnd, win32con.SW_RESTORE),
+                        lambda hwnd: not win32gui.IsIconic(hwnd),
+                        timing.get('restore_timeout', 1.0)),
+            'close': (lambda hwnd: win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0),
+                      lambda hwnd: not win32gui.IsWindow(hwnd),
+                      timing.get('close_timeout', 5.0))
+        }
+        issue, is_done, timeout = actions[action]
+        
+        results = {}
+        pending = []
+        for hwnd in hwnds:
             try:
-                if win32gui.IsWindow(hwnd):
-                    # Only minimize if not already minimized
-                    if not win32gui.IsIconic(hwnd):
-                        win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
-                        minimized_count += 1
-                        time.sleep(0.1)
+                if not win32gui.IsWindow(hwnd):
+                    results[hwnd] = 'missing'
+                elif is_done(hwnd):
+                    results[hwnd] = 'unchanged'
+                else:
+                    issue(hwnd)
+                    pending.append(hwnd)
             except Exception as e:
-                self.logger.error(f"Error minimizing window: {e}")
+                self.logger.error(f"Error issuing {action} for window {hwnd}: {e}")
+                results[hwnd] = 'error'
+        
+        deadline = time.perf_counter() + timeout
+        poll_interval = timing.get('poll_interval', 0.01)
+        while pending:
+            still_pending = []
+            for hwnd in pending:
+                try:
+                    if is_done(hwnd):
+                        results[hwnd] = 'done'
+                        continue
+                except Exception:
+                    pass
+                still_pending.append(hwnd)
+            pending = still_pending
+            if not pending or time.perf_counter() >= deadline:
+                break
+            time.sleep(poll_interval)
+        
+        for hwnd in pending:
+            results[hwnd] = 'timeout'
+            app_name = self.window_info.get(hwnd, {}).get('app_name', 'Unknown')
+            self.logger.warning(f"{app_name} did not {action} within {timeout}s")
+        return results
+    
+    def minimize_all_windows(self) -> int:
+        """Minimize all AI application windows"""
+        results = self.bulk_window_state(list(self.ai_windows), 'minimize')
+        minimized_count = sum(1 for status in results.values() if status == 'done')
         
         self.logger.info(f"Minimized {minimized_count} windows")
         return minimized_count
     
     def restore_all_windows(self) -> int:
         """Restore all minimized AI windows"""
-        restored_count = 0
-        
-        for hwnd in self.ai_windows:
-            try:
-                if win32gui.IsWindow(hwnd):
-                    # Restore if minimized
-                    if win32gui.IsIconic(hwnd):
-                        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                        restored_count += 1
-                        time.sleep(0.1)
-            except Exception as e:
-                self.logger.error(f"Error restoring window: {e}")
+        results = self.bulk_window_state(list(self.ai_windows), 'restore')
+        restored_count = sum(1 for status in results.values() if status == 'done')
         
         self.logger.info(f"Restored {restored_count} windows")
         return restored_count
@@ -478,10 +1132,9 @@ class WindowManager:
         """Get list of active AI applications for GUI display"""
         active_apps = []
         
-        for hwnd in self.ai_windows:
+        for hwnd, window_info in self.registry.snapshot().items():
             try:
                 if win32gui.IsWindow(hwnd):
-                    window_info = self.window_info.get(hwnd, {})
                     app_name = window_info.get('app_name', 'Unknown')
                     
                     active_apps.append({
@@ -489,7 +1142,8 @@ class WindowManager:
                         'hwnd': hwnd,
                         'title': window_info.get('title', ''),
                         'priority': window_info.get('priority', 999),
-                        'is_minimized': win32gui.IsIconic(hwnd)
+                        'is_minimized': win32gui.IsIconic(hwnd),
+                        'is_quarantined': self._is_quarantined(hwnd)
                     })
             except Exception as e:
                 self.logger.debug(f"Error getting app info: {e}")
@@ -515,7 +1169,10 @@ class WindowManager:
         self.logger.info(f"Verified {verification_count} windows are positioned correctly")
     
     def refresh_window_list(self) -> int:
-        """Refresh the list of AI windows"""
+        """Refresh the list of AI windows (no rescan while event tracking is live)"""
+        if self.is_tracking:
+            return len(self.registry)
+        
         old_count = len(self.ai_windows)
         self.get_ai_windows_fast()
         new_count = len(self.ai_windows)
@@ -524,22 +1181,20 @@ class WindowManager:
         return new_count
     
     def close_all_windows(self) -> int:
-        """Close all AI application windows"""
+        """Close all AI application windows and wait until they are gone"""
         # First restore taskbar icons
         self.restore_taskbar_icons()
         
-        closed_count = 0
+        results = self.bulk_window_state(list(self.ai_windows), 'close')
         
-        for hwnd in self.ai_windows:
-            try:
-                if win32gui.IsWindow(hwnd):
-                    win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
+        # Windows that did not close (e.g. waiting on a "leave page?" prompt) stay tracked
+        closed_count = 0
+        for hwnd, status in results.items():
+            if status in ('done', 'missing'):
+                self.registry.remove(hwnd)
+                if status == 'done':
                     closed_count += 1
-            except Exception as e:
-                self.logger.error(f"Error closing window: {e}")
-        
-        self.ai_windows.clear()
-        self.window_info.clear()
+        self._sync_from_registry()
         
         self.logger.info(f"Closed {closed_count} windows")
-        return closed_count
\ No newline at end of file
+        return closed_count
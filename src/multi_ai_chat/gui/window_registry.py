@@ -0,0 +1,256 @@
+"""
+Multi-AI Chat Manager v1.0.0 - Window Registry
+ AI window table kept current from window create/destroy/name-change events
+"""
+
+import ctypes
+import logging
+import threading
+from ctypes import wintypes
+from typing import Callable, Dict, List, Optional
+
+# Event names delivered to WindowRegistry.handle_event
+EVENT_CREATE = 'create'
+EVENT_DESTROY = 'destroy'
+EVENT_NAMECHANGE = 'namechange'
+
+
+class WindowRegistry:
+    """hwnd -> window info table with a per-app index.
+
+    Lookups (by hwnd or app) are O(1); the table is updated incrementally
+    from window events, and replace_all() lets a periodic full scan correct
+    any drift.
+    """
+
+    def __init__(self, classify: Callable[[int, str], Optional[Dict]], get_title: Callable[[int], str]):
+        self.classify = classify
+        self.get_title = get_title
+        self.logger = logging.getLogger(__name__)
+
+        self._windows: Dict[int, Dict] = {}
+        self._by_app: Dict[str, List[int]] = {}
+        self._lock = threading.RLock()
+
+        # Called with (event, hwnd, info) after the table changes
+        self.on_change: Optional[Callable[[str, int, Optional[Dict]], None]] = None
+
+    def handle_event(self, event: str, hwnd: int, title: str = None) -> None:
+        """Apply one window event to the table"""
+        if event == EVENT_DESTROY:
+            if self.remove(hwnd):
+                self._notify(event, hwnd, None)
+            return
+
+        if event not in (EVENT_CREATE, EVENT_NAMECHANGE):
+            return
+
+        try:
+            if title is None:
+                title = self.get_title(hwnd)
+            info = self.classify(hwnd, title) if title else None
+        except Exception as e:
+            self.logger.debug(f"Could not classify window {hwnd}: {e}")
+            return
+
+        if info:
+            with self._lock:
+                previous = self._windows.get(hwnd)
+                unchanged = previous is not None and previous.get('app_name') == info['app_name']
+                if unchanged:
+                    previous['title'] = info['title']
+                else:
+                    self._remove_locked(hwnd)
+                    self._add_locked(hwnd, info)
+            if not unchanged:
+                self._notify(event, hwnd, info)
+        elif self.remove(hwnd):
+            # Title no longer matches any app
+            self._notify(EVENT_DESTROY, hwnd, None)
+
+    def replace_all(self, entries: Dict[int, Dict]) -> None:
+        """Replace the table with the result of a full scan"""
+        with self._lock:
+            self._windows = {}
+            self._by_app = {}
+            for hwnd, info in entries.items():
+                self._add_locked(hwnd, info)
+
+    def remove(self, hwnd: int) -> bool:
+        with self._lock:
+            return self._remove_locked(hwnd)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._windows.clear()
+            self._by_app.clear()
+
+    def get(self, hwnd: int) -> Optional[Dict]:
+        with self._lock:
+            return self._windows.get(hwnd)
+
+    def get_windows(self) -> List[int]:
+        with self._lock:
+            return list(self._windows)
+
+    def get_app_windows(self, app_name: str) -> List[int]:
+        with self._lock:
+            return list(self._by_app.get(app_name, []))
+
+    def first_window(self, app_name: str) -> Optional[int]:
+        with self._lock:
+            hwnds = self._by_app.get(app_name)
+            return hwnds[0] if hwnds else None
+
+    def snapshot(self) -> Dict[int, Dict]:
+        with self._lock:
+            return dict(self._windows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._windows)
+
+    def _add_locked(self, hwnd: int, info: Dict) -> None:
+        self._windows[hwnd] = info
+        self._by_app.setdefault(info['app_name'], []).append(hwnd)
+
+    def _remove_locked(self, hwnd: int) -> bool:
+        info = self._windows.pop(hwnd, None)
+        if info is None:
+            return False
+        hwnds = self._by_app.get(info['app_name'], [])
+        if hwnd in hwnds:
+            hwnds.remove(hwnd)
+        if not hwnds:
+            self._by_app.pop(info['app_name'], None)
+        return True
+
+    def _notify(self, event: str, hwnd: int, info: Optional[Dict]) -> None:
+        if self.on_change:
+            try:
+                self.on_change(event, hwnd, info)
+            except Exception as e:
+                self.logger.debug(f"Registry change callback failed: {e}")
+
+
+class SyntheticEventSource:
+    """Event source driven by hand, for tests and tools without a desktop"""
+
+    def __init__(self):
+        self.sink = None
+
+    def start(self, sink: Callable[[str, int], None]) -> None:
+        self.sink = sink
+
+    def stop(self) -> None:
+        self.sink = None
+
+    def emit(self, event: str, hwnd: int, title: str = None) -> None:
+        if self.sink:
+            self.sink(event, hwnd, title)
+
+
+class WinEventSource:
+    """Listens for top-level window create/show/destroy/name-change via SetWinEventHook.
+
+    Browsers create their windows hidden and show them later, so a show is
+    reported like a create: the window is classified again once visible.
+    """
+
+    EVENT_OBJECT_CREATE = 0x8000
+    EVENT_OBJECT_DESTROY = 0x8001
+    EVENT_OBJECT_SHOW = 0x8002
+    EVENT_OBJECT_NAMECHANGE = 0x800C
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    WINEVENT_SKIPOWNPROCESS = 0x0002
+    OBJID_WINDOW = 0
+    CHILDID_SELF = 0
+    GA_ROOT = 2
+    WM_QUIT = 0x0012
+
+    EVENT_NAMES = {
+        EVENT_OBJECT_CREATE: EVENT_CREATE,
+        EVENT_OBJECT_DESTROY: EVENT_DESTROY,
+        EVENT_OBJECT_SHOW: EVENT_CREATE,
+        EVENT_OBJECT_NAMECHANGE: EVENT_NAMECHANGE
+    }
+
+    WinEventProc = ctypes.WINFUNCTYPE(
+        None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+        wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+    ) if hasattr(ctypes, 'WINFUNCTYPE') else None
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.sink = None
+        self._thread = None
+        self._thread_id = None
+        self._callback = None
+        self._ready = threading.Event()
+
+    def start(self, sink: Callable[[str, int], None]) -> None:
+        self.sink = sink
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name="WinEventSource", daemon=True)
+        self._thread.start()
+        self._ready.wait(2.0)
+
+    def stop(self) -> None:
+        if self._thread_id:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        self._thread_id = None
+
+    @classmethod
+    def _win_event_api(cls):
+        """user32 with the hook signatures set (HWINEVENTHOOK and HWND are pointer sized)"""
+        user32 = ctypes.windll.user32
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.SetWinEventHook.argtypes = [
+            wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, cls.WinEventProc,
+            wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+        ]
+        user32.UnhookWinEvent.restype = wintypes.BOOL
+        user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+        user32.GetAncestor.restype = wintypes.HWND
+        user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+        return user32
+
+    def _run(self) -> None:
+        user32 = self._win_event_api()
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+
+        def callback(hook, event, hwnd, id_object, id_child, thread_id, timestamp):
+            if id_object != self.OBJID_WINDOW or id_child != self.CHILDID_SELF or not hwnd:
+                return
+            # Destroyed windows can no longer be resolved to a root, so pass them through
+            if event != self.EVENT_OBJECT_DESTROY and user32.GetAncestor(hwnd, self.GA_ROOT) != hwnd:
+                return
+            try:
+                self.sink(self.EVENT_NAMES[event], hwnd, None)
+            except Exception as e:
+                self.logger.debug(f"Window event handler failed: {e}")
+
+        # Keep a reference so the callback is not garbage collected while hooked
+        self._callback = self.WinEventProc(callback)
+        hooks = [
+            user32.SetWinEventHook(self.EVENT_OBJECT_CREATE, self.EVENT_OBJECT_SHOW, None,
+                                   self._callback, 0, 0, self.WINEVENT_OUTOFCONTEXT | self.WINEVENT_SKIPOWNPROCESS),
+            user32.SetWinEventHook(self.EVENT_OBJECT_NAMECHANGE, self.EVENT_OBJECT_NAMECHANGE, None,
+                                   self._callback, 0, 0, self.WINEVENT_OUTOFCONTEXT | self.WINEVENT_SKIPOWNPROCESS)
+        ]
+        self._ready.set()
+        self.logger.info("Window event hooks installed")
+
+        # Out-of-context hooks are delivered through this thread's message loop
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+        for hook in hooks:
+            if hook:
+                user32.UnhookWinEvent(hook)
+        self.logger.info("Window event hooks removed")
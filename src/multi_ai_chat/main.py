@@ -8,7 +8,6 @@ import os
 import sys
 import logging
 import threading
-import time
 from pathlib import Path
 
 def get_resource_path(relative_path):
@@ -130,6 +129,9 @@ def main():
             from core.prompt_sender import ReliablePromptSender
             from gui.interface import CleanGUI
             from core.input_history import InputHistoryManager
+            from core.window_health import WindowHealthMonitor
+            from core.session_snapshot import SessionSnapshot
+            from core.resource_governor import ResourceGovernor
             
             print("All modules imported successfully")
         except ImportError as e:
@@ -143,6 +145,20 @@ def main():
         prompt_sender = ReliablePromptSender(config)
         history_manager = InputHistoryManager(config)
         
+        # Warm start: processes, windows and selection from the last session
+        session_snapshot = SessionSnapshot(config)
+        session_snapshot.apply_selection(config)
+        
+        # Shared hung-window probe for dispatch and arrangement
+        health_monitor = WindowHealthMonitor(config, prompt_sender.backend)
+        window_manager.set_health_monitor(health_monitor)
+        prompt_sender.set_health_monitor(health_monitor)
+        
+        # Idle apps drop to idle priority and give back memory until they are used
+        resource_governor = ResourceGovernor(config, prompt_sender.backend, window_manager.registry.snapshot)
+        window_manager.set_resource_governor(resource_governor)
+        prompt_sender.set_resource_governor(resource_governor)
+        
         logger.info("All components initialized")
         
         # Define callback functions
@@ -178,6 +194,22 @@ def main():
                 logger.error(f"Error sending prompt: {e}")
                 return {'success': 0, 'failed': 0, 'total': 0}
         
+        def cancel_send_callback():
+            """Cancel the prompt dispatch in progress"""
+            try:
+                return prompt_sender.cancel_active()
+            except Exception as e:
+                logger.error(f"Error cancelling prompt dispatch: {e}")
+                return False
+        
+        def export_metrics_callback():
+            """Export recorded dispatch timings as JSONL"""
+            try:
+                return prompt_sender.export_metrics()
+            except Exception as e:
+                logger.error(f"Error exporting dispatch metrics: {e}")
+                return False
+        
         def minimize_all_callback():
             """Minimize all AI applications"""
             try:
@@ -205,12 +237,15 @@ def main():
                 
                 if detected_count > 0:
                     display = window_manager.detect_displays()
-                    window_manager.arrange_windows_grid(display)
-                    logger.info(f"Arranged {detected_count} windows in grid position")
+                    result = window_manager.arrange_windows_grid(display)
+                    logger.info(f"Arranged {detected_count} windows in grid position: "
+                                f"{result['moved']} moved, {result['skipped']} already in place")
+                    return result
                 else:
                     logger.warning("No AI windows found to arrange")
             except Exception as e:
                 logger.error(f"Error arranging windows: {e}")
+            return None
         
         def refresh_windows_callback():
             """Refresh window list"""
@@ -238,31 +273,72 @@ def main():
                 logger.error(f"Error getting active apps: {e}")
                 return []
         
-        def reopen_all_callback():
-            """Reopen all AI applications"""
+        def launch_apps_with_layout(display, apps=None):
+            """Launch apps concurrently, placing each window as soon as it appears"""
+            expected = [app['name'] for app in config['ai_apps'] if app.get('enabled', True)]
+            
+            def on_app_ready(app_name, hwnd):
+                window_manager.arrange_windows_grid(display, reserve_for=expected)
+            
+            result = window_manager.launch_apps_parallel(apps, on_app_ready=on_app_ready)
+            if result['timed_out']:
+                logger.warning(f"Apps not ready within launch timeout: {', '.join(result['timed_out'])}")
+            
+            # Open the extra windows of apps with a prompt pool
+            window_manager.fill_pools(on_app_ready=on_app_ready)
+            
+            # Close the gaps left by apps that never showed up
+            if window_manager.ai_windows:
+                window_manager.arrange_windows_grid(display)
+            return result
+        
+        def reopen_apps_with_layout(app_names=None, on_progress=None):
+            """Recycle apps concurrently, slotting each new window in as it appears"""
+            window_manager.refresh_window_list()
+            display = window_manager.detect_displays()
+            expected = [app['name'] for app in config['ai_apps'] if app.get('enabled', True)]
+            
+            def on_app_ready(app_name, hwnd):
+                window_manager.arrange_windows_grid(display, reserve_for=expected)
+            
+            results = window_manager.reopen_apps(app_names, on_progress=on_progress, on_app_ready=on_app_ready)
+            
+            # Close the gaps left by apps that did not come back
+            if any(stage != 'ready' for stage in results.values()) and window_manager.ai_windows:
+                window_manager.arrange_windows_grid(display)
+            save_session_snapshot()
+            return results
+        
+        def reopen_all_callback(on_progress=None):
+            """Reopen all AI applications, each app independently"""
             try:
                 logger.info("Reopening all applications")
-                
-                closed_count = window_manager.close_all_windows()
-                logger.info(f"Closed {closed_count} windows")
-                
-                time.sleep(2)
-                
-                window_manager.launch_apps_parallel()
-                time.sleep(3)
-                
-                window_manager.get_ai_windows_fast()
-                display = window_manager.detect_displays()
-                window_manager.arrange_windows_grid(display)
-                
-                detected_count = len(window_manager.ai_windows)
-                logger.info(f"Reopened {detected_count} applications")
-                
-                return detected_count
-                
+                return reopen_apps_with_layout(on_progress=on_progress)
             except Exception as e:
                 logger.error(f"Error reopening apps: {e}")
-                return 0
+                return {}
+        
+        def reopen_app_callback(app_name, on_progress=None):
+            """Reopen a single AI application without touching the others"""
+            try:
+                logger.info(f"Reopening {app_name}")
+                return reopen_apps_with_layout([app_name], on_progress=on_progress)
+            except Exception as e:
+                logger.error(f"Error reopening {app_name}: {e}")
+                return {}
+        
+        def save_session_snapshot():
+            """Record which processes and windows belong to each app"""
+            try:
+                session_snapshot.record_windows(window_manager.get_session_signatures())
+                session_snapshot.save()
+            except Exception as e:
+                logger.error(f"Error saving session snapshot: {e}")
+        
+        def selection_changed_callback(selected_apps):
+            """Remember the AI selection for the next session"""
+            session_snapshot.record_selection(selected_apps)
+            session_snapshot.save()
         
         def close_all_callback():
             """Close all AI applications"""
@@ -277,6 +353,8 @@ def main():
         # Create GUI callbacks
         gui_callbacks = {
             'send_prompt': send_prompt_callback,
+            'cancel_send': cancel_send_callback,
+            'export_metrics': export_metrics_callback,
             'minimize_all': minimize_all_callback,
             'restore_all': restore_all_callback,
             'arrange_windows': arrange_windows_callback,
@@ -284,6 +362,8 @@ def main():
             'bring_to_front': bring_to_front_callback,
             'get_active_apps': get_active_apps_callback,
             'reopen_all': reopen_all_callback,
+            'reopen_app': reopen_app_callback,
+            'selection_changed': selection_changed_callback,
             'close_all': close_all_callback
         }
         
@@ -292,13 +372,25 @@ def main():
         gui.set_history_manager(history_manager)
         gui.create_gui()
         
+        # Re-color app icons when windows enter or leave quarantine
+        health_monitor.on_change = gui.refresh_app_states
+        health_monitor.start()
+        
+        resource_governor.on_change = lambda: gui.update_resource_status(resource_governor.summary())
+        if resource_governor.enabled:
+            resource_governor.start()
+        
+        # Refresh the cached monitor layout when displays change
+        window_manager.displays.start()
+        
+        # Keep the window count and icons current as tracked windows come and go
+        window_manager.on_windows_changed = lambda: gui.update_window_count(len(window_manager.ai_windows))
+        
         print("GUI created successfully")
         
         # Initialize AI apps in background
         def init_ai_apps():
             try:
-                time.sleep(1)
-                
                 print("Initializing AI applications")
                 
                 enabled_apps = [app for app in config['ai_apps'] if app.get('enabled', True)]
@@ -309,13 +401,16 @@ def main():
                 
                 display = window_manager.detect_displays()
                 
-                window_manager.launch_apps_parallel()
-                time.sleep(3)
+                # Follow window create/destroy/title events from here on
+                window_manager.start_tracking()
                 
-                window_manager.get_ai_windows_fast()
-                
-                if window_manager.ai_windows:
-                    window_manager.arrange_windows_grid(display)
+                # Re-attach to apps still running from the last session, launch the rest
+                missing_apps = enabled_apps
+                if session_snapshot.enabled:
+                    running = window_manager.attach_from_snapshot(session_snapshot.apps)
+                    missing_apps = [app for app in enabled_apps if app['name'] not in running]
+                launch_apps_with_layout(display, missing_apps)
+                save_session_snapshot()
                 
                 window_count = len(window_manager.ai_windows)
                 gui.update_window_count(window_count)
@@ -339,6 +434,13 @@ def main():
         # Start GUI main loop
         gui.run()
         
+        save_session_snapshot()
+        window_manager.stop_tracking()
+        window_manager.displays.stop()
+        health_monitor.stop()
+        resource_governor.stop()
+        prompt_sender.close()
+        
     except KeyboardInterrupt:
         print("Application interrupted by user")
     except Exception as e:
@@ -0,0 +1,74 @@
+"""Per-phase dispatch metrics and their JSONL export"""
+
+import json
+
+from core.dispatch_metrics import DispatchMetrics
+from core.fake_backend import FakeBackend
+from core.prompt_sender import ReliablePromptSender
+
+
+def send(tmp_path, **metrics):
+    backend = FakeBackend()
+    window_info = {}
+    for hwnd, name in ((1, "Claude"), (2, "Grok")):
+        backend.add_window(hwnd, name, iconic=(hwnd == 2), restore_delay=0.02)
+        window_info[hwnd] = {'app_name': name, 'hwnd': hwnd}
+    metrics.setdefault('export_file', str(tmp_path / 'dispatch_metrics.jsonl'))
+    config = {
+        'window': {'timing': {'prompt_send_delay': 0.0, 'profiles': {'enabled': False}}},
+        'metrics': metrics
+    }
+    sender = ReliablePromptSender(config, backend=backend)
+    return sender, sender.send_prompt_to_all([1, 2], window_info, "hello")
+
+
+def test_every_window_gets_a_phase_breakdown(tmp_path):
+    _, result = send(tmp_path)
+
+    timings = result['timings']
+    assert timings['success'] == 2
+    assert timings['prompt_length'] == 5
+    for entry in timings['windows']:
+        assert {'focus', 'clipboard', 'paste', 'submit'} <= set(entry['phases'])
+        assert all(seconds >= 0 for seconds in entry['phases'].values())
+    assert timings['slowest']['app_name'] in ("Claude", "Grok")
+
+
+def test_export_writes_one_json_line_per_dispatch(tmp_path):
+    sender, _ = send(tmp_path)
+    window_info = {1: {'app_name': "Claude", 'hwnd': 1}}
+    sender.send_prompt_to_all([1], window_info, "again")
+    path = tmp_path / 'export.jsonl'
+
+    assert sender.export_metrics(str(path))
+
+    records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert [record['total'] for record in records] == [2, 1]
+
+
+def test_auto_export_appends_as_dispatches_happen(tmp_path):
+    path = tmp_path / 'auto' / 'metrics.jsonl'
+    send(tmp_path, auto_export=True, export_file=str(path))
+
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 1
+
+
+def test_ring_keeps_only_the_latest_records():
+    metrics = DispatchMetrics({'metrics': {'ring_size': 3}})
+    for total in range(5):
+        metrics.add({'total': total, 'windows': []}, 10)
+
+    assert [record['total'] for record in metrics.get_recent(10)] == [2, 3, 4]
+
+
+def test_average_delivery_times_ignore_failures():
+    metrics = DispatchMetrics({})
+    metrics.add({'windows': [
+        {'app_name': "Claude", 'success': True, 'elapsed': 0.2},
+        {'app_name': "Grok", 'success': False, 'elapsed': 9.0}
+    ]}, 10)
+    metrics.add({'windows': [{'app_name': "Claude", 'success': True, 'elapsed': 0.4}]}, 10)
+
+    averages = metrics.average_delivery_times()
+    assert round(averages["Claude"], 4) == 0.3
+    assert "Grok" not in averages
@@ -0,0 +1,49 @@
+"""Dispatch ordering strategies"""
+
+from core.dispatch_metrics import DispatchMetrics
+from core.dispatch_order import DispatchOrdering
+from core.timing_profiles import TimingProfileStore
+
+AI_APPS = [
+    {'name': "Claude", 'priority': 1, 'expected_response': 20},
+    {'name': "Gemini", 'priority': 2, 'expected_response': 45},
+    {'name': "Grok", 'priority': 3},
+]
+WINDOW_INFO = {1: {'app_name': "Claude"}, 2: {'app_name': "Gemini"}, 3: {'app_name': "Grok"}}
+
+
+def make_ordering(strategy, metrics=None, profiles=None):
+    config = {'window': {'delivery': {'order': strategy}}, 'ai_apps': AI_APPS}
+    return DispatchOrdering(config, metrics or DispatchMetrics({}), profiles)
+
+
+def test_layout_follows_configured_priority():
+    assert make_ordering('layout').order([3, 1, 2], WINDOW_INFO) == [1, 2, 3]
+
+
+def test_fastest_first_uses_measured_delivery_times():
+    metrics = DispatchMetrics({})
+    metrics.add({'windows': [
+        {'app_name': "Claude", 'success': True, 'elapsed': 0.5},
+        {'app_name': "Gemini", 'success': True, 'elapsed': 0.1},
+    ]}, 10)
+
+    # Grok has no history and goes last
+    assert make_ordering('fastest_first', metrics).order([1, 2, 3], WINDOW_INFO) == [2, 1, 3]
+
+
+def test_fastest_first_falls_back_to_learned_profiles(tmp_path):
+    profiles = TimingProfileStore({'window': {'timing': {'profiles': {'file': str(tmp_path / 'p.json')}}}})
+    profiles.observe("Grok", 'focus', 0.05)
+
+    assert make_ordering('fastest_first', profiles=profiles).order([1, 2, 3], WINDOW_INFO) == [3, 1, 2]
+
+
+def test_slowest_responder_first_starts_long_answers_early():
+    assert make_ordering('slowest_responder_first').order([1, 2, 3], WINDOW_INFO) == [2, 1, 3]
+
+
+def test_unknown_strategy_uses_layout():
+    ordering = make_ordering('random')
+    assert ordering.strategy == 'layout'
+    assert ordering.order([2, 3, 1], WINDOW_INFO) == [1, 2, 3]
@@ -0,0 +1,57 @@
+"""Preparation phase: dropped, hung and restored windows"""
+
+from core.dispatch import DispatchPlanner
+from core.fake_backend import FakeBackend
+from core.readiness import ReadinessWaiter
+from core.window_health import WindowHealthMonitor
+
+CONFIG = {'window': {'timing': {'restore_timeout': 0.5, 'poll_interval': 0.005}}}
+
+
+def make_planner(health=False):
+    backend = FakeBackend()
+    for hwnd in (1, 2, 3, 4):
+        backend.add_window(hwnd, f"App {hwnd}")
+    monitor = WindowHealthMonitor({}, backend) if health else None
+    return DispatchPlanner(backend, ReadinessWaiter(backend, CONFIG), monitor), backend
+
+
+def test_closed_and_hung_windows_are_dropped_with_a_reason():
+    planner, backend = make_planner()
+    backend.windows[2].alive = False
+    backend.windows[3].hung = True
+
+    plan = planner.prepare([1, 2, 3, 4])
+
+    assert plan['ready'] == [1, 4]
+    assert plan['dropped'] == [{'hwnd': 2, 'reason': 'closed'}, {'hwnd': 3, 'reason': 'hung'}]
+
+
+def test_health_monitor_reports_unresponsive_windows_as_quarantined():
+    planner, backend = make_planner(health=True)
+    backend.windows[3].hung = True
+
+    plan = planner.prepare([1, 3])
+
+    assert plan['dropped'] == [{'hwnd': 3, 'reason': 'quarantined'}]
+    assert planner.health_monitor.is_quarantined(3)
+
+
+def test_hidden_and_minimized_windows_are_restored_in_one_batch():
+    planner, backend = make_planner()
+    for hwnd in (1, 2):
+        backend.windows[hwnd].iconic = True
+        backend.windows[hwnd].restore_delay = 0.05
+    backend.windows[3].visible = False
+
+    plan = planner.prepare([1, 2, 3])
+
+    assert plan['ready'] == [1, 2, 3]
+    assert plan['restored'] == 2
+    assert not backend.is_iconic(1) and not backend.is_iconic(2)
+    assert backend.is_visible(3)
+
+
+def test_drop_reason_is_none_for_a_healthy_window():
+    planner, _ = make_planner()
+    assert planner.drop_reason(1) is None
@@ -0,0 +1,69 @@
+"""Clipboard handling of one dispatch session on the fake backend"""
+
+from core.dispatch import DispatchSession
+from core.fake_backend import FakeBackend
+from core.prompt_sender import ReliablePromptSender
+
+
+def test_prompt_is_written_once_per_session():
+    backend = FakeBackend()
+    session = DispatchSession(backend, "hello")
+
+    assert session.ensure_clipboard()
+    assert not session.ensure_clipboard()
+    assert not session.ensure_clipboard()
+    assert backend.clipboard_writes == 1
+    assert backend.get_clipboard_text() == "hello"
+
+
+def test_prompt_is_rewritten_after_another_process_changes_the_clipboard():
+    backend = FakeBackend()
+    session = DispatchSession(backend, "hello")
+    session.ensure_clipboard()
+
+    backend.external_clipboard_write("copied by the user")
+    assert not session.owns_clipboard()
+    assert session.ensure_clipboard()
+    assert backend.get_clipboard_text() == "hello"
+    assert session.clipboard_writes == 2
+
+
+def test_fan_out_writes_the_clipboard_once():
+    backend = FakeBackend()
+    window_info = {}
+    for hwnd in (1, 2, 3):
+        backend.add_window(hwnd, f"App {hwnd}")
+        window_info[hwnd] = {'app_name': f"App {hwnd}", 'hwnd': hwnd}
+    config = {'window': {'timing': {'prompt_send_delay': 0.0, 'profiles': {'enabled': False}}}}
+    sender = ReliablePromptSender(config, backend=backend)
+
+    result = sender.send_prompt_to_all([1, 2, 3], window_info, "hello")
+
+    assert result['success'] == 3
+    assert result['clipboard_writes'] == 1
+    assert backend.clipboard_writes == 1
+
+
+def test_fan_out_rewrites_only_after_an_outside_change():
+    backend = FakeBackend()
+    window_info = {}
+    for hwnd in (1, 2, 3):
+        backend.add_window(hwnd, f"App {hwnd}")
+        window_info[hwnd] = {'app_name': f"App {hwnd}", 'hwnd': hwnd}
+    config = {'window': {'timing': {'prompt_send_delay': 0.0, 'profiles': {'enabled': False}}}}
+    sender = ReliablePromptSender(config, backend=backend)
+    send_keys = backend.send_keys
+    pastes = []
+
+    def send_keys_then_copy(keys):
+        send_keys(keys)
+        if keys == "^v":
+            pastes.append(backend.get_clipboard_text())
+            if len(pastes) == 1:
+                backend.external_clipboard_write("copied meanwhile")
+    backend.send_keys = send_keys_then_copy
+
+    result = sender.send_prompt_to_all([1, 2, 3], window_info, "hello")
+
+    assert pastes == ["hello"] * 3
+    assert result['clipboard_writes'] == 2
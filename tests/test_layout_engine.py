@@ -0,0 +1,96 @@
+"""Layouts computed on synthetic display topologies"""
+
+import pytest
+
+from gui.display_topology import (
+    Display, DisplayTopology, DisplayTopologyService, FALLBACK_TOPOLOGY, StaticDisplayProvider
+)
+from gui.layout_engine import compute_layout, fit_grid
+
+PRIMARY = Display(1, 0, 0, 1920, 1040, True)
+# Smaller monitor to the left of the primary one, at negative coordinates
+LEFT = Display(2, -1280, 0, 1280, 984)
+SINGLE = DisplayTopology((PRIMARY,))
+DUAL = DisplayTopology((PRIMARY, LEFT))
+
+
+def inside(rect, display):
+    x, y, width, height = rect
+    return (display.left <= x and x + width <= display.right
+            and display.top <= y and y + height <= display.bottom)
+
+
+def overlaps(a, b):
+    return not (a[0] + a[2] <= b[0] or b[0] + b[2] <= a[0] or a[1] + a[3] <= b[1] or b[1] + b[3] <= a[1])
+
+
+def assert_tiled(rects):
+    for i, a in enumerate(rects):
+        assert a[2] > 0 and a[3] > 0
+        for b in rects[i + 1:]:
+            assert not overlaps(a, b)
+
+
+def test_service_caches_until_invalidated():
+    provider = StaticDisplayProvider(SINGLE)
+    service = DisplayTopologyService(provider)
+    seen = []
+    service.listeners.append(seen.append)
+
+    assert service.snapshot() == SINGLE
+    provider.set(DUAL)
+    assert service.snapshot() == SINGLE
+
+    service.invalidate()
+    assert service.snapshot() == DUAL
+    assert seen == [DUAL]
+
+
+def test_service_falls_back_without_displays():
+    service = DisplayTopologyService(StaticDisplayProvider(DisplayTopology(())))
+    assert service.snapshot() == FALLBACK_TOPOLOGY
+
+
+@pytest.mark.parametrize('strategy', ['grid', 'auto_fit', 'master_stack'])
+@pytest.mark.parametrize('count', [1, 2, 5, 7, 9])
+def test_every_window_gets_a_rect_on_its_display(strategy, count):
+    rects = compute_layout(DUAL, (1.0,) * count, strategy, 3, 2)
+    assert len(rects) == count
+    assert all(inside(rect, PRIMARY) or inside(rect, LEFT) for rect in rects)
+    assert_tiled(rects)
+
+
+def test_grid_overflow_adds_rows_instead_of_dropping():
+    rects = compute_layout(SINGLE, (1.0,) * 8, 'grid', 3, 2)
+    assert len(rects) == 8
+    assert len({rect[1] for rect in rects}) == 3
+    assert all(inside(rect, PRIMARY) for rect in rects)
+
+
+def test_grid_fills_the_first_display_before_the_next():
+    rects = compute_layout(DUAL, (1.0,) * 7, 'grid', 3, 2)
+    assert all(inside(rect, PRIMARY) for rect in rects[:6])
+    assert inside(rects[6], LEFT)
+
+
+def test_auto_fit_splits_windows_by_work_area():
+    rects = compute_layout(DUAL, (1.0,) * 5, 'auto_fit')
+    on_primary = [rect for rect in rects if inside(rect, PRIMARY)]
+    assert len(on_primary) == 3
+
+
+def test_master_stack_gives_the_heaviest_window_the_master_area():
+    rects = compute_layout(SINGLE, (1.0, 3.0, 1.0), 'master_stack', master_ratio=0.6)
+    master = rects[1]
+    assert master[2] > 1920 * 0.5
+    assert all(rect[2] < master[2] for i, rect in enumerate(rects) if i != 1)
+
+
+def test_unknown_strategy_falls_back_to_grid():
+    weights = (1.0,) * 4
+    assert compute_layout(SINGLE, weights, 'spiral') == compute_layout(SINGLE, weights, 'grid')
+
+
+@pytest.mark.parametrize('count, expected', [(5, (3, 2)), (7, (4, 2)), (11, (6, 2)), (13, (7, 2))])
+def test_fit_grid_does_not_force_prime_counts_into_one_row(count, expected):
+    assert fit_grid(count, 1920, 1040, 0.75) == expected
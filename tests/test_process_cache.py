@@ -0,0 +1,80 @@
+"""pid -> executable cache and its recycle detection"""
+
+import psutil
+import pytest
+
+import core.process_cache as process_cache
+from core.process_cache import ProcessNameCache
+
+
+class FakeProcess:
+    """psutil.Process stand-in backed by a pid -> (name, create_time) table"""
+
+    table = {}
+    name_reads = 0
+
+    def __init__(self, pid):
+        if pid not in self.table:
+            raise psutil.NoSuchProcess(pid)
+        self.pid = pid
+
+    def create_time(self):
+        return self.table[self.pid][1]
+
+    def name(self):
+        FakeProcess.name_reads += 1
+        return self.table[self.pid][0]
+
+
+@pytest.fixture
+def processes(monkeypatch):
+    FakeProcess.table = {100: ("Chrome.exe", 1.0)}
+    FakeProcess.name_reads = 0
+    monkeypatch.setattr(process_cache.psutil, 'Process', FakeProcess)
+    monkeypatch.setattr(process_cache.psutil, 'pid_exists', lambda pid: pid in FakeProcess.table)
+    return FakeProcess.table
+
+
+def test_names_are_cached_and_lower_cased(processes):
+    cache = ProcessNameCache(verify_interval=60.0)
+    assert cache.get_name(100) == "chrome.exe"
+    assert cache.get_name(100) == "chrome.exe"
+    assert FakeProcess.name_reads == 1
+    assert cache.get_stats() == {'size': 1, 'hits': 1, 'misses': 1}
+
+
+def test_recycled_pid_is_detected_by_create_time(processes):
+    cache = ProcessNameCache(verify_interval=0.0)
+    assert cache.get_name(100) == "chrome.exe"
+
+    # Same pid, new process
+    processes[100] = ("notepad.exe", 2.0)
+    assert cache.get_name(100) == "notepad.exe"
+
+
+def test_unchanged_process_is_verified_without_rereading_its_name(processes):
+    cache = ProcessNameCache(verify_interval=0.0)
+    cache.get_name(100)
+    cache.get_name(100)
+    assert FakeProcess.name_reads == 1
+
+
+def test_exited_processes_are_forgotten(processes):
+    cache = ProcessNameCache(verify_interval=0.0)
+    cache.get_name(100)
+    del processes[100]
+
+    assert cache.get_name(100) is None
+    assert cache.get_stats()['size'] == 0
+
+
+def test_prune_and_size_bound(processes):
+    processes.update({101: ("a.exe", 1.0), 102: ("b.exe", 1.0)})
+    cache = ProcessNameCache(max_size=2, verify_interval=60.0)
+    for pid in (100, 101, 102):
+        cache.get_name(pid)
+    assert cache.get_stats()['size'] == 2
+
+    del processes[102]
+    assert cache.prune() == 1
+    assert cache.get_stats()['size'] == 1
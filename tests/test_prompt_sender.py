@@ -0,0 +1,167 @@
+"""Prompt fan-out through FakeDelivery on the fake backend"""
+
+import threading
+import time
+
+import pytest
+
+from core.dispatch import CancellationToken
+from core.fake_backend import FakeBackend, FakeDelivery
+from core.prompt_sender import ReliablePromptSender
+
+APP_NAMES = ["Claude", "Google Gemini", "Perplexity", "Grok", "DeepSeek", "ChatGPT"]
+
+
+def make_sender(delivery, windows=6, max_workers=6, ai_apps=None):
+    backend = FakeBackend()
+    window_info = {}
+    for i, name in enumerate(APP_NAMES[:windows]):
+        hwnd = 1000 + i
+        backend.add_window(hwnd, f"{name} - Chat")
+        window_info[hwnd] = {'app_name': name, 'hwnd': hwnd}
+    # Learned profiles are disabled so no state is written between tests
+    config = {
+        'window': {
+            'timing': {'prompt_send_delay': 0.0, 'profiles': {'enabled': False}},
+            'delivery': {'max_workers': max_workers, 'priority_boost': 'none'}
+        },
+        'ai_apps': ai_apps or []
+    }
+    return ReliablePromptSender(config, backend=backend, delivery=delivery), backend, window_info
+
+
+def test_windows_are_fed_concurrently():
+    delivery = FakeDelivery(latency=0.2)
+    sender, backend, window_info = make_sender(delivery)
+
+    start = time.perf_counter()
+    result = sender.send_prompt_to_all(list(window_info), window_info, "hello")
+    elapsed = time.perf_counter() - start
+
+    assert result['success'] == 6
+    assert sorted(delivery.delivered) == sorted(window_info)
+    assert all(prompts == ["hello"] for prompts in delivery.delivered.values())
+    # Six windows at 0.2s each finish well inside the serial 1.2s
+    assert elapsed < 0.8
+    assert backend.foreground is None
+
+
+def test_unsupported_windows_fall_back_to_sendkeys():
+    delivery = FakeDelivery(unsupported={1001})
+    sender, backend, window_info = make_sender(delivery, windows=3)
+
+    result = sender.send_prompt_to_all(list(window_info), window_info, "hello")
+
+    assert result['success'] == 3
+    assert 1001 not in delivery.delivered
+    fallback = [entry for entry in result['windows'] if entry['hwnd'] == 1001][0]
+    assert fallback['method'] == sender.fallback_delivery.name
+
+
+def test_failed_delivery_is_reported_per_window():
+    delivery = FakeDelivery(failing={1002})
+    sender, _, window_info = make_sender(delivery, windows=3)
+
+    result = sender.send_prompt_to_all(list(window_info), window_info, "hello")
+
+    assert result['success'] == 2
+    assert result['failed'] == 1
+    assert "Perplexity" not in result['delivered']
+
+
+def test_cancel_stops_windows_not_started_yet():
+    delivery = FakeDelivery(latency=0.2)
+    sender, _, window_info = make_sender(delivery, max_workers=2)
+    results = []
+    worker = threading.Thread(
+        target=lambda: results.append(sender.send_prompt_to_all(list(window_info), window_info, "hello"))
+    )
+
+    worker.start()
+    time.sleep(0.05)
+    assert sender.cancel_active()
+    worker.join(5.0)
+
+    result = results[0]
+    assert result['cancelled']
+    assert len(result['windows']) == 6
+    assert not delivery.delivered
+    assert sorted(result['skipped']) == sorted(APP_NAMES)
+    assert sender.active_token is None
+    assert not sender.cancel_active()
+
+
+def test_expired_token_delivers_nothing():
+    delivery = FakeDelivery()
+    sender, _, window_info = make_sender(delivery, windows=2)
+    token = CancellationToken(0.001)
+    time.sleep(0.01)
+
+    result = sender.send_prompt_to_all(list(window_info), window_info, "hello", token)
+
+    assert result['success'] == 0
+    assert not delivery.delivered
+    assert sorted(result['timed_out'] + result['skipped']) == sorted(APP_NAMES[:2])
+
+
+@pytest.mark.parametrize('closed', [True, False])
+def test_pool_prompt_skips_windows_that_cannot_take_it(closed):
+    delivery = FakeDelivery()
+    sender, backend, window_info = make_sender(
+        delivery, windows=1, ai_apps=[{'name': 'Claude', 'pool_size': 2}]
+    )
+    backend.add_window(2000, "Claude - Chat")
+    window_info[2000] = {'app_name': 'Claude', 'hwnd': 2000}
+    if closed:
+        backend.windows[1000].alive = False
+    else:
+        backend.windows[1000].hung = True
+
+    result = sender.send_prompt_to_all([1000, 2000], window_info, "hello")
+
+    assert result['success'] == 1
+    assert list(delivery.delivered) == [2000]
+    assert all(entry['in_flight'] == 0 for entry in sender.pools.get_status()['Claude'])
+
+
+def test_window_hung_after_prepare_is_skipped_not_focused():
+    delivery = FakeDelivery(unsupported={1000, 1001, 1002})
+    sender, backend, window_info = make_sender(delivery, windows=3)
+    prepare = sender.planner.prepare
+
+    def prepare_then_hang(*args):
+        plan = prepare(*args)
+        backend.windows[1001].hung = True
+        return plan
+    sender.planner.prepare = prepare_then_hang
+    focused = []
+    set_foreground = backend.set_foreground_window
+    backend.set_foreground_window = lambda hwnd: (focused.append(hwnd), set_foreground(hwnd))
+
+    result = sender.send_prompt_to_all(list(window_info), window_info, "hello")
+
+    assert result['success'] == 2
+    assert result['skipped'] == ["Google Gemini"]
+    assert 1001 not in focused
+
+
+def test_postmessage_leaves_unfocused_renderers_to_sendkeys():
+    backend = FakeBackend()
+    window_info = {}
+    for hwnd in (1, 2):
+        backend.add_window(hwnd, "Claude - Chat")
+        backend.add_input_child(hwnd, hwnd + 100)
+        window_info[hwnd] = {'app_name': f"App {hwnd}", 'hwnd': hwnd}
+    backend.windows[2].input_focused = False
+    config = {'window': {
+        'timing': {'prompt_send_delay': 0.0, 'profiles': {'enabled': False}},
+        'delivery': {'method': 'postmessage', 'priority_boost': 'none'}
+    }}
+    sender = ReliablePromptSender(config, backend=backend)
+
+    result = sender.send_prompt_to_all([1, 2], window_info, "hello")
+
+    methods = {entry['hwnd']: entry['method'] for entry in result['windows']}
+    assert methods == {1: 'postmessage', 2: 'sendkeys'}
+    assert backend.windows[1].submitted == ["hello"]
+    assert result['success'] == 2
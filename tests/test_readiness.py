@@ -0,0 +1,85 @@
+"""Readiness-based waits on the fake backend"""
+
+import time
+
+import pytest
+
+from core.dispatch import CancellationToken, DispatchAborted
+from core.fake_backend import FakeBackend
+from core.readiness import ReadinessWaiter
+
+CONFIG = {'window': {'timing': {'restore_timeout': 1.0, 'foreground_timeout': 1.0,
+                                'paste_settle': 0.05, 'poll_interval': 0.005}}}
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def test_restore_wait_returns_once_the_window_is_restored():
+    backend = FakeBackend()
+    backend.add_window(1, "Claude", iconic=True, restore_delay=0.1)
+    waiter = ReadinessWaiter(backend, CONFIG)
+
+    backend.restore_window(1)
+    restored, elapsed = timed(waiter.wait_restored, 1)
+
+    assert restored
+    assert 0.09 <= elapsed < 0.5
+
+
+def test_foreground_wait_returns_once_focus_is_confirmed():
+    backend = FakeBackend()
+    backend.add_window(1, "Claude", focus_delay=0.05)
+    waiter = ReadinessWaiter(backend, CONFIG)
+
+    backend.set_foreground_window(1)
+    focused, elapsed = timed(waiter.wait_foreground, 1)
+
+    assert focused
+    assert elapsed < 0.5
+
+
+def test_wait_gives_up_at_its_timeout():
+    backend = FakeBackend()
+    backend.add_window(1, "Claude", iconic=True)
+    waiter = ReadinessWaiter(backend, CONFIG)
+
+    restored, elapsed = timed(waiter.wait_restored, 1, timeout=0.1)
+
+    assert not restored
+    assert 0.09 <= elapsed < 0.5
+
+
+def test_batch_restore_pays_one_shared_wait():
+    backend = FakeBackend()
+    for hwnd in (1, 2, 3):
+        backend.add_window(hwnd, f"App {hwnd}", iconic=True, restore_delay=0.1)
+        backend.restore_window(hwnd)
+    backend.add_window(4, "Stuck", iconic=True)
+    waiter = ReadinessWaiter(backend, {'window': {'timing': {'restore_timeout': 0.3, 'poll_interval': 0.005}}})
+
+    pending, elapsed = timed(waiter.wait_all_restored, [1, 2, 3, 4])
+
+    assert pending == [4]
+    assert elapsed < 0.6
+
+
+def test_cancelled_token_ends_the_wait():
+    backend = FakeBackend()
+    backend.add_window(1, "Claude", iconic=True)
+    waiter = ReadinessWaiter(backend, CONFIG)
+    token = CancellationToken()
+    token.cancel()
+
+    with pytest.raises(DispatchAborted) as aborted:
+        waiter.wait_restored(1, token)
+    assert aborted.value.reason == 'cancelled'
+
+
+def test_paste_settle_is_capped_by_the_token_deadline():
+    waiter = ReadinessWaiter(FakeBackend(), {'window': {'timing': {'paste_settle': 1.0}}})
+    _, elapsed = timed(waiter.settle_after_paste, CancellationToken(0.05))
+    assert elapsed < 0.5
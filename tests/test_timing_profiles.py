@@ -0,0 +1,79 @@
+"""Learned per-app timing and its use by the SendKeys path"""
+
+import pytest
+
+from core.fake_backend import FakeBackend
+from core.prompt_sender import ReliablePromptSender
+from core.timing_profiles import TimingProfileStore
+
+
+def profile_config(tmp_path, **profiles):
+    profiles.setdefault('file', str(tmp_path / 'timing_profiles.json'))
+    return {'window': {'timing': {
+        'restore_timeout': 1.0, 'foreground_timeout': 1.0, 'paste_settle': 0.05,
+        'prompt_send_delay': 0.0, 'profiles': profiles
+    }}}
+
+
+def test_defaults_until_enough_samples(tmp_path):
+    store = TimingProfileStore(profile_config(tmp_path, min_samples=5))
+    for _ in range(4):
+        store.observe('Claude', 'focus', 0.01)
+    assert store.get_timing('Claude')['foreground_timeout'] == 1.0
+
+
+def test_learned_waits_are_clamped_between_floor_and_bound(tmp_path):
+    store = TimingProfileStore(profile_config(tmp_path, min_samples=3))
+    for _ in range(5):
+        store.observe('Claude', 'focus', 0.001)
+        store.observe('Grok', 'focus', 5.0)
+
+    assert store.get_timing('Claude')['foreground_timeout'] == 0.15
+    assert store.get_timing('Grok')['foreground_timeout'] == 1.0
+
+
+def test_paste_settle_is_never_learned(tmp_path):
+    store = TimingProfileStore(profile_config(tmp_path, min_samples=1))
+    store.observe('Claude', 'focus', 0.001)
+    assert store.get_timing('Claude')['paste_settle'] == 0.05
+
+
+def test_failed_step_counts_as_the_configured_wait(tmp_path):
+    store = TimingProfileStore(profile_config(tmp_path, min_samples=1))
+    store.observe('Claude', 'focus', 0.01)
+    store.observe('Claude', 'focus', 0.01, success=False)
+    assert store.profiles['Claude']['focus'].mean > 0.1
+
+
+def test_profiles_persist_across_instances(tmp_path):
+    config = profile_config(tmp_path, min_samples=1)
+    store = TimingProfileStore(config)
+    store.observe('Claude', 'restore', 0.3)
+    store.save()
+
+    reloaded = TimingProfileStore(config)
+    assert reloaded.profiles['Claude']['restore'].samples == 1
+    reloaded.reset('Claude')
+    assert 'Claude' not in TimingProfileStore(config).profiles
+
+
+@pytest.mark.parametrize('step', ['focus', 'restore'])
+def test_slow_window_still_gets_the_configured_bound(tmp_path, step):
+    # Fast samples shrink the learned wait to its floor, then one ordinary slow step follows
+    config = profile_config(tmp_path, min_samples=3)
+    backend = FakeBackend()
+    if step == 'focus':
+        backend.add_window(1, "Claude - Chat", focus_delay=0.3)
+    else:
+        backend.add_window(1, "Claude - Chat", iconic=True, restore_delay=0.4)
+    sender = ReliablePromptSender(config, backend=backend)
+    for _ in range(5):
+        sender.timing_profiles.observe('Claude', step, 0.001)
+    learned = sender.timing_profiles.get_timing('Claude')
+    assert learned['foreground_timeout' if step == 'focus' else 'restore_timeout'] < 0.3
+
+    window_info = {1: {'app_name': 'Claude', 'hwnd': 1}}
+    result = sender.send_prompt_to_all([1], window_info, "hello")
+
+    assert result['success'] == 1
+    assert backend.windows[1].iconic is False
@@ -0,0 +1,48 @@
+"""Keyword table and per-hwnd cache of the title matcher"""
+
+from gui.title_matcher import TitleMatcher
+
+AI_APPS = [
+    {'name': "Claude", 'keywords': ["Claude", "Anthropic"]},
+    {'name': "ChatGPT", 'keywords': ["ChatGPT", "OpenAI"]},
+    {'name': "Copilot", 'keywords': ["Copilot", "OpenAI"]},
+    {'name': "Disabled", 'keywords': ["Claude"], 'enabled': False},
+]
+
+
+def test_keywords_match_case_insensitively_in_config_order():
+    matcher = TitleMatcher(AI_APPS)
+    assert matcher.candidates("claude - New chat") == ("Claude",)
+    assert matcher.candidates("Powered by OPENAI") == ("ChatGPT", "Copilot")
+    assert matcher.candidates("Notepad") == ()
+    assert matcher.candidates("") == ()
+
+
+def test_disabled_apps_are_not_in_the_table():
+    assert "Disabled" not in TitleMatcher(AI_APPS).app_names
+
+
+def test_window_is_rematched_only_when_its_title_changes():
+    matcher = TitleMatcher(AI_APPS)
+    calls = []
+    candidates = matcher.candidates
+    matcher.candidates = lambda title: calls.append(title) or candidates(title)
+
+    assert matcher.match_window(1, "Claude") == ("Claude",)
+    assert matcher.match_window(1, "Claude") == ("Claude",)
+    assert matcher.match_window(1, "ChatGPT") == ("ChatGPT",)
+    assert calls == ["Claude", "ChatGPT"]
+
+    matcher.forget(1)
+    matcher.match_window(1, "ChatGPT")
+    assert len(calls) == 3
+
+
+def test_cache_is_bounded_least_recently_used_first():
+    matcher = TitleMatcher(AI_APPS, cache_size=2)
+    for hwnd in (1, 2):
+        matcher.match_window(hwnd, "Claude")
+    matcher.match_window(1, "Claude")
+    matcher.match_window(3, "Claude")
+
+    assert set(matcher._cache) == {1, 3}
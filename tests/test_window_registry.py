@@ -0,0 +1,104 @@
+"""WindowRegistry driven by SyntheticEventSource"""
+
+import pytest
+
+from gui.window_registry import (
+    EVENT_CREATE, EVENT_DESTROY, EVENT_NAMECHANGE, SyntheticEventSource, WindowRegistry
+)
+
+APPS = {'claude': 'Claude', 'gemini': 'Google Gemini'}
+
+
+def classify(hwnd, title):
+    for keyword, app_name in APPS.items():
+        if keyword in title.lower():
+            return {'hwnd': hwnd, 'title': title, 'app_name': app_name}
+    return None
+
+
+@pytest.fixture
+def registry():
+    registry = WindowRegistry(classify, get_title=lambda hwnd: "")
+    registry.changes = []
+    registry.on_change = lambda event, hwnd, info: registry.changes.append(
+        (event, hwnd, info['app_name'] if info else None)
+    )
+    return registry
+
+
+@pytest.fixture
+def source(registry):
+    source = SyntheticEventSource()
+    source.start(registry.handle_event)
+    yield source
+    source.stop()
+
+
+def test_events_apply_in_order(registry, source):
+    source.emit(EVENT_CREATE, 1, "Claude")
+    source.emit(EVENT_CREATE, 2, "Notepad")
+    source.emit(EVENT_CREATE, 3, "Google Gemini")
+    source.emit(EVENT_DESTROY, 1)
+
+    assert registry.changes == [
+        (EVENT_CREATE, 1, 'Claude'),
+        (EVENT_CREATE, 3, 'Google Gemini'),
+        (EVENT_DESTROY, 1, None),
+    ]
+    assert registry.get_windows() == [3]
+    assert registry.get_app_windows('Claude') == []
+
+
+def test_app_index_keeps_creation_order(registry, source):
+    for hwnd in (10, 11, 12):
+        source.emit(EVENT_CREATE, hwnd, f"Claude {hwnd}")
+    assert registry.first_window('Claude') == 10
+
+    source.emit(EVENT_DESTROY, 10)
+    assert registry.get_app_windows('Claude') == [11, 12]
+    assert registry.first_window('Claude') == 11
+
+
+def test_title_change_within_app_updates_quietly(registry, source):
+    source.emit(EVENT_CREATE, 1, "Claude")
+    source.emit(EVENT_NAMECHANGE, 1, "Claude - new chat")
+
+    assert registry.changes == [(EVENT_CREATE, 1, 'Claude')]
+    assert registry.get(1)['title'] == "Claude - new chat"
+
+
+def test_title_change_moves_window_between_apps(registry, source):
+    source.emit(EVENT_CREATE, 1, "Claude")
+    source.emit(EVENT_NAMECHANGE, 1, "Gemini")
+
+    assert registry.changes[-1] == (EVENT_NAMECHANGE, 1, 'Google Gemini')
+    assert registry.get_app_windows('Claude') == []
+    assert registry.get_app_windows('Google Gemini') == [1]
+
+
+def test_title_losing_its_match_reports_destroy(registry, source):
+    source.emit(EVENT_CREATE, 1, "Claude")
+    source.emit(EVENT_NAMECHANGE, 1, "New Tab")
+
+    assert registry.changes == [(EVENT_CREATE, 1, 'Claude'), (EVENT_DESTROY, 1, None)]
+    assert len(registry) == 0
+
+
+def test_unknown_windows_are_ignored(registry, source):
+    source.emit(EVENT_DESTROY, 99)
+    source.emit('focus', 1, "Claude")
+    assert registry.changes == []
+
+
+def test_missing_title_is_read_from_the_window():
+    registry = WindowRegistry(classify, get_title=lambda hwnd: "Claude")
+    source = SyntheticEventSource()
+    source.start(registry.handle_event)
+    source.emit(EVENT_CREATE, 5)
+    assert registry.first_window('Claude') == 5
+
+
+def test_stopped_source_delivers_nothing(registry, source):
+    source.stop()
+    source.emit(EVENT_CREATE, 1, "Claude")
+    assert len(registry) == 0